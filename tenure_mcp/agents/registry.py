@@ -1,6 +1,5 @@
 """Agent registry for deployment registration."""
 
-import json
 from typing import Dict, Optional
 
 from tenure_mcp.schemas.base import AgentManifest
@@ -20,29 +19,17 @@ class AgentRegistry:
         self._agents[manifest.agent_id] = manifest
 
         # Persist to database
-        with self.db.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO agent_manifests (
-                    agent_id, version, input_schema, output_schema,
-                    permitted_tools, permitted_resources, rbac_policy_level,
-                    workflow_version, prompt_hash
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    manifest.agent_id,
-                    manifest.version,
-                    json.dumps(manifest.input_schema),
-                    json.dumps(manifest.output_schema),
-                    json.dumps(manifest.permitted_tools),
-                    json.dumps(manifest.permitted_resources),
-                    manifest.rbac_policy_level,
-                    manifest.workflow_version,
-                    manifest.prompt_hash,
-                ),
-            )
-            conn.commit()
+        self.db.save_agent_manifest(
+            agent_id=manifest.agent_id,
+            version=manifest.version,
+            input_schema=manifest.input_schema,
+            output_schema=manifest.output_schema,
+            permitted_tools=manifest.permitted_tools,
+            permitted_resources=manifest.permitted_resources,
+            rbac_policy_level=manifest.rbac_policy_level,
+            workflow_version=manifest.workflow_version,
+            prompt_hash=manifest.prompt_hash,
+        )
 
     def get(self, agent_id: str) -> Optional[AgentManifest]:
         """Get agent manifest by ID."""
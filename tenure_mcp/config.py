@@ -39,6 +39,9 @@ class Settings(BaseSettings):
     google_drive_mock_enabled: bool = True
     mock_latency_ms: int = 500
 
+    # Read-only integration tool results are reused for this long (0 disables)
+    tool_cache_ttl_seconds: float = 60.0
+
     # HITL
     hitl_enabled: bool = True
     hitl_token_secret: str = ""
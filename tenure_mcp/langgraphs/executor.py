@@ -7,6 +7,7 @@ from opentelemetry import trace
 
 from tenure_mcp.observability import get_tracer
 from tenure_mcp.schemas.base import RequestContext
+from tenure_mcp.server.audit import record_audit_event
 from tenure_mcp.storage import get_db
 
 # Get tracer for workflow execution
@@ -61,7 +62,8 @@ class WorkflowExecutor:
                 result = await self._weekly_vendor_report.ainvoke(initial_state)
 
                 # Log execution
-                self.db.log_audit_event(
+                record_audit_event(
+                    self.db,
                     correlation_id=correlation_id,
                     event_type="workflow_execution",
                     user_id=context.user_id,
@@ -82,7 +84,8 @@ class WorkflowExecutor:
                 }
 
             except Exception as e:
-                self.db.log_audit_event(
+                record_audit_event(
+                    self.db,
                     correlation_id=correlation_id,
                     event_type="workflow_execution",
                     user_id=context.user_id,
@@ -119,7 +122,8 @@ class WorkflowExecutor:
             try:
                 result = await self._arrears_detection.ainvoke(initial_state)
 
-                self.db.log_audit_event(
+                record_audit_event(
+                    self.db,
                     correlation_id=correlation_id,
                     event_type="workflow_execution",
                     user_id=context.user_id,
@@ -140,7 +144,8 @@ class WorkflowExecutor:
                 }
 
             except Exception as e:
-                self.db.log_audit_event(
+                record_audit_event(
+                    self.db,
                     correlation_id=correlation_id,
                     event_type="workflow_execution",
                     user_id=context.user_id,
@@ -177,7 +182,8 @@ class WorkflowExecutor:
             try:
                 result = await self._compliance_audit.ainvoke(initial_state)
 
-                self.db.log_audit_event(
+                record_audit_event(
+                    self.db,
                     correlation_id=correlation_id,
                     event_type="workflow_execution",
                     user_id=context.user_id,
@@ -198,7 +204,8 @@ class WorkflowExecutor:
                 }
 
             except Exception as e:
-                self.db.log_audit_event(
+                record_audit_event(
+                    self.db,
                     correlation_id=correlation_id,
                     event_type="workflow_execution",
                     user_id=context.user_id,
@@ -249,7 +256,8 @@ class WorkflowExecutor:
             try:
                 result = await self._unified_collection.ainvoke(initial_state)
 
-                self.db.log_audit_event(
+                record_audit_event(
+                    self.db,
                     correlation_id=correlation_id,
                     event_type="workflow_execution",
                     user_id=context.user_id,
@@ -284,7 +292,8 @@ class WorkflowExecutor:
                 }
 
             except Exception as e:
-                self.db.log_audit_event(
+                record_audit_event(
+                    self.db,
                     correlation_id=correlation_id,
                     event_type="workflow_execution",
                     user_id=context.user_id,
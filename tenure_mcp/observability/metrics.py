@@ -0,0 +1,26 @@
+"""Prometheus metrics for the HTTP server."""
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+REQUEST_COUNTER = Counter(
+    "tenure_requests_total",
+    "HTTP requests handled",
+    ["method", "path", "status"],
+)
+REQUEST_LATENCY = Histogram(
+    "tenure_request_duration_seconds",
+    "Time to first response byte in seconds",
+    ["method", "path"],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "tenure_requests_in_flight",
+    "HTTP requests currently being handled",
+)
+
+__all__ = [
+    "CONTENT_TYPE_LATEST",
+    "REQUEST_COUNTER",
+    "REQUEST_LATENCY",
+    "REQUESTS_IN_FLIGHT",
+    "generate_latest",
+]
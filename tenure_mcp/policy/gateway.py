@@ -4,6 +4,7 @@ from typing import Dict, List, Optional
 
 from tenure_mcp.config import settings
 from tenure_mcp.schemas.base import RequestContext
+from tenure_mcp.server.audit import record_audit_event
 from tenure_mcp.storage import get_db
 
 
@@ -121,7 +122,8 @@ class PolicyGateway:
 
             # For structured output, we'd need more sophisticated redaction
             # For MVP, we return as-is but log that redaction was applied
-            self.db.log_audit_event(
+            record_audit_event(
+                self.db,
                 correlation_id="",
                 event_type="redaction_applied",
                 user_id=context.user_id,
@@ -141,7 +143,8 @@ class PolicyGateway:
         reason: Optional[str] = None,
     ) -> None:
         """Log policy decision for audit trail."""
-        self.db.log_audit_event(
+        record_audit_event(
+            self.db,
             correlation_id=correlation_id,
             event_type="policy_check",
             user_id=context.user_id,
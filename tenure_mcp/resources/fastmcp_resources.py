@@ -23,18 +23,22 @@ from tenure_mcp.resources.implementations import (
 from tenure_mcp.server.fastmcp_server import create_fastmcp_server
 
 
+# Built once and shared by every call; callers only read it
+_DEFAULT_CONTEXT = RequestContext(
+    user_id="default_user",
+    tenant_id="default_tenant",
+    auth_context="default_auth",
+    role="agent",
+)
+
+
 def _get_default_context() -> RequestContext:
-    """Create a default RequestContext for resource access.
+    """Get the default RequestContext for resource access.
     
     TODO: Extract from FastMCP request context or FastAPI request when integrated.
     For now, returns a default context for MVP.
     """
-    return RequestContext(
-        user_id="default_user",
-        tenant_id="default_tenant",
-        auth_context="default_auth",
-        role="agent",
-    )
+    return _DEFAULT_CONTEXT
 
 
 # Get FastMCP server instance (create if not exists)
@@ -1,6 +1,18 @@
 """Resource registry for MCP Server."""
 
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+
+class _TrieNode:
+    """One URI segment in the resource template trie."""
+
+    __slots__ = ("children", "param_name", "param_child", "pattern")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.param_name: Optional[str] = None
+        self.param_child: Optional["_TrieNode"] = None
+        self.pattern: Optional[str] = None
 
 
 class ResourceRegistry:
@@ -10,6 +22,8 @@ class ResourceRegistry:
         """Initialize resource registry."""
         self._resources: Dict[str, Callable] = {}
         self._resource_metadata: Dict[str, Dict[str, Any]] = {}
+        # URI templates split on "/" into a trie; "{name}" segments are parameters
+        self._root = _TrieNode()
 
     def register(
         self,
@@ -21,33 +35,64 @@ class ResourceRegistry:
         self._resources[uri_pattern] = func
         self._resource_metadata[uri_pattern] = metadata or {}
 
+        node = self._root
+        for part in uri_pattern.split("/"):
+            if part.startswith("{") and part.endswith("}"):
+                if node.param_child is None:
+                    node.param_child = _TrieNode()
+                    node.param_name = part[1:-1]
+                node = node.param_child
+            else:
+                node = node.children.setdefault(part, _TrieNode())
+        # First registration wins, as with the previous linear scan
+        if node.pattern is None:
+            node.pattern = uri_pattern
+
     def get(self, uri: str) -> Optional[tuple[Callable, Dict[str, Any]]]:
         """
         Get a resource handler for URI.
 
         Returns (handler_func, metadata) or None.
         """
-        # Simple pattern matching - in production would use proper URI routing
-        for pattern, func in self._resources.items():
-            if self._match_pattern(pattern, uri):
-                return func, self._resource_metadata.get(pattern, {})
-        return None
+        match = self.match(uri)
+        if match is None:
+            return None
+        func, metadata, _ = match
+        return func, metadata
+
+    def match(self, uri: str) -> Optional[tuple[Callable, Dict[str, Any], Dict[str, str]]]:
+        """
+        Match a URI against the registered templates.
 
-    def _match_pattern(self, pattern: str, uri: str) -> bool:
-        """Simple pattern matching for resource URIs."""
-        # Convert pattern to regex-like matching
-        pattern_parts = pattern.split("/")
-        uri_parts = uri.split("/")
-
-        if len(pattern_parts) != len(uri_parts):
-            return False
-
-        for p, u in zip(pattern_parts, uri_parts):
-            if p.startswith("{") and p.endswith("}"):
-                continue  # Wildcard match
-            if p != u:
-                return False
-        return True
+        Returns (handler_func, metadata, path_params) or None, where path_params
+        maps each "{name}" in the template to the matching URI segment.
+        """
+        params: Dict[str, str] = {}
+        pattern = self._walk(self._root, uri.split("/"), 0, params)
+        if pattern is None:
+            return None
+        return self._resources[pattern], self._resource_metadata.get(pattern, {}), params
+
+    def _walk(
+        self, node: _TrieNode, parts: List[str], index: int, params: Dict[str, str]
+    ) -> Optional[str]:
+        """Find the template matching parts[index:], preferring literal segments."""
+        if index == len(parts):
+            return node.pattern
+
+        part = parts[index]
+        child = node.children.get(part)
+        if child is not None:
+            pattern = self._walk(child, parts, index + 1, params)
+            if pattern is not None:
+                return pattern
+
+        if node.param_child is not None:
+            pattern = self._walk(node.param_child, parts, index + 1, params)
+            if pattern is not None:
+                params[node.param_name] = part
+                return pattern
+        return None
 
     def list_resources(self) -> list[str]:
         """List all registered resource patterns."""
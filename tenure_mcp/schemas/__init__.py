@@ -8,6 +8,7 @@ from tenure_mcp.schemas.base import (
     RequestContext,
     ToolExecutionRequest,
     ToolExecutionResponse,
+    WorkflowExecutionRequest,
 )
 from tenure_mcp.schemas.integrations import (
     # Enums
@@ -108,6 +109,7 @@ __all__ = [
     "RequestContext",
     "ToolExecutionRequest",
     "ToolExecutionResponse",
+    "WorkflowExecutionRequest",
     "AgentManifest",
     "VersionedSchema",
     # Existing tool schemas
@@ -1,10 +1,20 @@
 """Base schemas for MCP Server requests and responses."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints, field_validator
+
+# Identifier format (alphanumeric, hyphen, underscore), enforced natively by pydantic-core.
+# The Rust regex engine anchors $ at end of input, so a trailing newline is rejected.
+ID_PATTERN = r"^[a-zA-Z0-9_-]+$"
+
+# Format-only identifier; length constraints are set per field
+IdFormatStr = Annotated[str, StringConstraints(pattern=ID_PATTERN)]
+
+# Tool input identifier (1-100 chars)
+IdentifierStr = Annotated[IdFormatStr, StringConstraints(min_length=1, max_length=100)]
 
 
 class RequestContext(BaseModel):
@@ -80,6 +90,16 @@ class ToolExecutionResponse(BaseResponse):
     trace_id: Optional[str] = None
 
 
+class WorkflowExecutionRequest(BaseModel):
+    """Request body for workflow execution; each workflow requires one of the IDs."""
+
+    property_id: Optional[str] = Field(None, description="Property identifier")
+    tenancy_id: Optional[str] = Field(None, description="Tenancy identifier")
+    collection_scope: Optional[List[str]] = Field(
+        None, description="Integrations to collect from (unified_collection only)"
+    )
+
+
 class AgentManifest(BaseModel):
     """Agent manifest for deployment registration."""
 
@@ -1,6 +1,5 @@
 """Integration schemas for Gmail, Google Drive, VaultRE, and Ailo."""
 
-import re
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
@@ -8,6 +7,7 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from tenure_mcp.schemas.base import IdentifierStr, IdFormatStr
 from tenure_mcp.schemas.versioning import VersionedSchema
 
 
@@ -140,8 +140,8 @@ class MessagePayload(BaseModel):
 class GmailMessage(VersionedSchema):
     """Gmail message schema based on Gmail API v1."""
 
-    id: str = Field(..., min_length=1, description="Immutable message ID")
-    thread_id: str = Field(..., min_length=1, description="Thread ID")
+    id: IdFormatStr = Field(..., min_length=1, description="Immutable message ID")
+    thread_id: IdFormatStr = Field(..., min_length=1, description="Thread ID")
     label_ids: List[str] = Field(default_factory=list, description="Applied label IDs")
     snippet: str = Field(default="", max_length=500, description="Message preview")
     internal_date: str = Field(..., description="Creation timestamp in epoch ms")
@@ -149,14 +149,6 @@ class GmailMessage(VersionedSchema):
     size_estimate: int = Field(default=0, ge=0, description="Estimated size in bytes")
     history_id: Optional[str] = Field(None, description="Last history record ID")
 
-    @field_validator("id", "thread_id")
-    @classmethod
-    def validate_id_format(cls, v: str) -> str:
-        """Validate ID format."""
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
-            raise ValueError("ID must contain only alphanumeric characters, hyphens, or underscores")
-        return v
-
 
 class GmailThread(VersionedSchema):
     """Gmail thread schema."""
@@ -227,7 +219,7 @@ class DrivePermission(BaseModel):
 class DriveFile(VersionedSchema):
     """Google Drive file schema based on Drive API v3."""
 
-    id: str = Field(..., min_length=1, description="File ID")
+    id: IdFormatStr = Field(..., min_length=1, description="File ID")
     name: str = Field(..., min_length=1, description="File name")
     mime_type: str = Field(..., description="File MIME type")
     created_time: datetime = Field(..., description="Creation timestamp")
@@ -243,14 +235,6 @@ class DriveFile(VersionedSchema):
     description: Optional[str] = Field(None, max_length=1000, description="File description")
     md5_checksum: Optional[str] = Field(None, description="MD5 checksum for content")
 
-    @field_validator("id")
-    @classmethod
-    def validate_file_id(cls, v: str) -> str:
-        """Validate file ID format."""
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
-            raise ValueError("File ID must contain only alphanumeric characters, hyphens, or underscores")
-        return v
-
 
 class DocumentInfo(BaseModel):
     """Simplified document info for tool outputs."""
@@ -344,7 +328,7 @@ class PropertyPhoto(BaseModel):
 class VaultREProperty(VersionedSchema):
     """VaultRE property schema based on VaultRE API v1.3."""
 
-    id: str = Field(..., min_length=1, description="Property ID")
+    id: IdFormatStr = Field(..., min_length=1, description="Property ID")
     address: PropertyAddress = Field(..., description="Property address")
     property_class: PropertyClass = Field(..., description="Property classification")
     property_type: str = Field(..., description="Property type (e.g., House, Unit)")
@@ -362,14 +346,6 @@ class VaultREProperty(VersionedSchema):
     created_at: Optional[datetime] = Field(None, description="Record creation time")
     updated_at: Optional[datetime] = Field(None, description="Last update time")
 
-    @field_validator("id")
-    @classmethod
-    def validate_property_id(cls, v: str) -> str:
-        """Validate property ID format."""
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
-            raise ValueError("Property ID must contain only alphanumeric characters, hyphens, or underscores")
-        return v
-
 
 class VaultREContact(VersionedSchema):
     """VaultRE contact schema."""
@@ -473,8 +449,8 @@ class AiloLedger(VersionedSchema):
     """Ailo ledger schema for tenancy financial tracking."""
 
     id: str = Field(..., min_length=1, description="Ledger ID")
-    tenancy_id: str = Field(..., min_length=1, description="Tenancy ID")
-    property_id: str = Field(..., min_length=1, description="Property ID")
+    tenancy_id: IdFormatStr = Field(..., min_length=1, description="Tenancy ID")
+    property_id: IdFormatStr = Field(..., min_length=1, description="Property ID")
     current_balance: Decimal = Field(default=Decimal("0.00"), description="Current balance (positive = owing)")
     rent_amount: Decimal = Field(..., gt=0, description="Rent amount per period")
     rent_frequency: RentFrequency = Field(..., description="Rent payment frequency")
@@ -485,14 +461,6 @@ class AiloLedger(VersionedSchema):
     last_payment_date: Optional[date] = Field(None, description="Date of last payment")
     last_payment_amount: Optional[Decimal] = Field(None, description="Amount of last payment")
 
-    @field_validator("tenancy_id", "property_id")
-    @classmethod
-    def validate_ids(cls, v: str) -> str:
-        """Validate ID formats."""
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
-            raise ValueError("ID must contain only alphanumeric characters, hyphens, or underscores")
-        return v
-
 
 class AiloTenant(VersionedSchema):
     """Ailo tenant schema."""
@@ -637,17 +605,9 @@ class UnifiedPropertyData(VersionedSchema):
 class FetchPropertyEmailsInput(VersionedSchema):
     """Input for fetch_property_emails tool."""
 
-    property_id: str = Field(..., min_length=1, max_length=100, description="Property ID")
+    property_id: IdentifierStr = Field(..., description="Property ID")
     days_back: int = Field(default=30, ge=1, le=365, description="Days to look back")
 
-    @field_validator("property_id")
-    @classmethod
-    def validate_property_id(cls, v: str) -> str:
-        """Validate property ID format."""
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
-            raise ValueError("Property ID must contain only alphanumeric characters, hyphens, or underscores")
-        return v
-
 
 class FetchPropertyEmailsOutput(VersionedSchema):
     """Output for fetch_property_emails tool."""
@@ -1,32 +1,40 @@
 """Tool-specific input/output schemas."""
 
-import re
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, List, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
+from tenure_mcp.schemas.base import IdentifierStr
 from tenure_mcp.schemas.versioning import VersionedSchema
 
+# Document URLs must use the http://, https://, or vault:// scheme
+DocumentUrlStr = Annotated[str, StringConstraints(pattern=r"^(https?|vault)://")]
+
+BreachType = Literal["rent_arrears", "lease_violation", "property_damage"]
+BreachLevel = Literal["low", "medium", "high", "critical"]
+BreachLegalStatus = Literal["compliant", "at_risk", "breached"]
+
+
+class RecordModel(BaseModel):
+    """Immutable base for small record types built in bulk inside tool outputs.
+
+    Instances are frozen and reject unknown fields, which adds
+    ``additionalProperties: false`` to their JSON schemas. Field values still
+    live in a per-instance ``__dict__``, so this does not reduce memory use.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class AnalyzeFeedbackInput(VersionedSchema):
     """Input schema for analyze_open_home_feedback tool."""
 
-    property_id: str = Field(..., min_length=1, max_length=100, description="Property identifier")
+    property_id: IdentifierStr = Field(..., description="Property identifier")
     version: str = "v1"
 
-    @field_validator("property_id")
-    @classmethod
-    def validate_property_id(cls, v: str) -> str:
-        """Validate property ID format."""
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
-            raise ValueError(
-                "Property ID must contain only alphanumeric characters, hyphens, or underscores"
-            )
-        return v
 
-
-class SentimentCategory(BaseModel):
+class SentimentCategory(RecordModel):
     """Sentiment category breakdown."""
 
     category: str
@@ -47,26 +55,16 @@ class AnalyzeFeedbackOutput(VersionedSchema):
 class CalculateBreachInput(VersionedSchema):
     """Input schema for calculate_breach_status tool."""
 
-    tenancy_id: str = Field(..., min_length=1, max_length=100, description="Tenancy identifier")
+    tenancy_id: IdentifierStr = Field(..., description="Tenancy identifier")
     version: str = "v1"
 
-    @field_validator("tenancy_id")
-    @classmethod
-    def validate_tenancy_id(cls, v: str) -> str:
-        """Validate tenancy ID format."""
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
-            raise ValueError(
-                "Tenancy ID must contain only alphanumeric characters, hyphens, or underscores"
-            )
-        return v
-
 
-class BreachRisk(BaseModel):
+class BreachRisk(RecordModel):
     """Breach risk classification."""
 
-    level: str = Field(..., description="low, medium, high, or critical")
+    level: BreachLevel
     days_overdue: Optional[int] = None
-    breach_legal_status: str = Field(..., description="compliant, at_risk, or breached")
+    breach_legal_status: BreachLegalStatus
     recommended_action: Optional[str] = None
 
 
@@ -83,17 +81,9 @@ class CalculateBreachOutput(VersionedSchema):
 class OCRDocumentInput(VersionedSchema):
     """Input schema for ocr_document tool."""
 
-    document_url: str = Field(..., description="URL to document for OCR")
+    document_url: DocumentUrlStr = Field(..., description="URL to document for OCR")
     version: str = "v1"
 
-    @field_validator("document_url")
-    @classmethod
-    def validate_url(cls, v: str) -> str:
-        """Validate URL format."""
-        if not (v.startswith("http://") or v.startswith("https://") or v.startswith("vault://")):
-            raise ValueError("Document URL must be http://, https://, or vault://")
-        return v
-
 
 class OCRDocumentOutput(VersionedSchema):
     """Output schema for ocr_document tool."""
@@ -114,7 +104,7 @@ class ExtractExpiryInput(VersionedSchema):
     version: str = "v1"
 
 
-class ExtractedDate(BaseModel):
+class ExtractedDate(RecordModel):
     """Extracted date field."""
 
     field_name: str
@@ -132,18 +122,23 @@ class ExtractExpiryOutput(VersionedSchema):
 class GenerateVendorReportInput(VersionedSchema):
     """Input schema for generate_vendor_report tool."""
 
-    property_id: str = Field(..., min_length=1, max_length=100, description="Property identifier")
+    property_id: IdentifierStr = Field(..., description="Property identifier")
     version: str = "v1"
 
-    @field_validator("property_id")
-    @classmethod
-    def validate_property_id(cls, v: str) -> str:
-        """Validate property ID format."""
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
-            raise ValueError(
-                "Property ID must contain only alphanumeric characters, hyphens, or underscores"
-            )
-        return v
+
+class FeedbackSummary(RecordModel):
+    """Open home feedback rollup for a vendor report."""
+
+    total_feedback: int
+    positive_sentiment: int
+    positive_percentage: float
+
+
+class MarketTrends(RecordModel):
+    """Local market indicators for a vendor report."""
+
+    avg_days_on_market: int
+    price_trend: str
 
 
 class GenerateVendorReportOutput(VersionedSchema):
@@ -151,8 +146,8 @@ class GenerateVendorReportOutput(VersionedSchema):
 
     property_id: str
     report_date: datetime
-    feedback_summary: dict
-    market_trends: Optional[dict] = None
+    feedback_summary: FeedbackSummary
+    market_trends: Optional[MarketTrends] = None
     recommendations: List[str] = Field(default_factory=list)
     version: str = "v1"
 
@@ -160,37 +155,18 @@ class GenerateVendorReportOutput(VersionedSchema):
 class PrepareBreachNoticeInput(VersionedSchema):
     """Input schema for prepare_breach_notice tool (Tier C - HITL required)."""
 
-    tenancy_id: str = Field(..., min_length=1, max_length=100, description="Tenancy identifier")
-    breach_type: str = Field(
+    tenancy_id: IdentifierStr = Field(..., description="Tenancy identifier")
+    breach_type: BreachType = Field(
         ...,
         description="Type of breach: rent_arrears, lease_violation, or property_damage",
     )
     version: str = "v1"
 
-    @field_validator("breach_type")
-    @classmethod
-    def validate_breach_type(cls, v: str) -> str:
-        """Validate breach type."""
-        valid_types = ["rent_arrears", "lease_violation", "property_damage"]
-        if v not in valid_types:
-            raise ValueError(f"Invalid breach_type. Must be one of: {valid_types}")
-        return v
-
-    @field_validator("tenancy_id")
-    @classmethod
-    def validate_tenancy_id(cls, v: str) -> str:
-        """Validate tenancy ID format."""
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
-            raise ValueError(
-                "Tenancy ID must contain only alphanumeric characters, hyphens, or underscores"
-            )
-        return v
-
 
 class PrepareBreachNoticeOutput(VersionedSchema):
     """Output schema for prepare_breach_notice tool."""
 
-    notice_id: str = Field(..., description="Unique notice identifier")
+    notice_id: str
     tenancy_id: str
     breach_type: str
     draft_content: str = Field(..., description="Draft breach notice content (MVP: draft-only)")
@@ -199,12 +175,12 @@ class PrepareBreachNoticeOutput(VersionedSchema):
     version: str = "v1"
 
 
-class WebSearchResultItem(BaseModel):
+class WebSearchResultItem(RecordModel):
     """Single web search result."""
 
-    title: str = Field(..., description="Page title")
-    url: str = Field(..., description="Page URL")
-    snippet: str = Field(default="", description="Short excerpt")
+    title: str
+    url: str
+    snippet: str = ""
 
 
 class WebSearchInput(VersionedSchema):
@@ -1,6 +1,22 @@
 """FastAPI server for MCP Server."""
 
-from tenure_mcp.server.app import create_app
-from tenure_mcp.server.sse import sse_app
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tenure_mcp.server.app import create_app
+    from tenure_mcp.server.sse import sse_app
 
 __all__ = ["create_app", "sse_app"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import FastAPI/SSE machinery on first access rather than at package import."""
+    if name == "create_app":
+        from tenure_mcp.server.app import create_app
+
+        return create_app
+    if name == "sse_app":
+        from tenure_mcp.server.sse import sse_app
+
+        return sse_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
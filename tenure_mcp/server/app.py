@@ -1,14 +1,19 @@
 """FastAPI application factory."""
 
+import asyncio
+import time
 import uuid
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Dict, Tuple, Type
 
-from fastapi import FastAPI, Header, HTTPException, Request, status
+import orjson
+from fastapi import FastAPI, Header, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 
 from tenure_mcp.config import settings
-from tenure_mcp.policy import get_policy_gateway
+from tenure_mcp.policy import PolicyGateway, get_policy_gateway
 from tenure_mcp.resources import get_resource_registry, register_resource
 from tenure_mcp.resources.implementations import (
     get_ledger_summary_resource,
@@ -21,11 +26,45 @@ from tenure_mcp.schemas.base import (
     RequestContext,
     ToolExecutionRequest,
     ToolExecutionResponse,
+    WorkflowExecutionRequest,
+)
+from tenure_mcp.schemas.integrations import (
+    CheckDocumentExpiryInput,
+    FetchPropertyEmailsInput,
+    GetDocumentContentInput,
+    GetPropertyContactsInput,
+    GetTenantCommunicationHistoryInput,
+    GetUpcomingOpenHomesInput,
+    ListActivePropertiesInput,
+    ListArrearsTenanciesInput,
+    ListPropertyDocumentsInput,
+    SearchCommunicationThreadsInput,
+)
+from tenure_mcp.schemas.tools import (
+    AnalyzeFeedbackInput,
+    CalculateBreachInput,
+    ExtractExpiryInput,
+    GenerateVendorReportInput,
+    OCRDocumentInput,
+    PrepareBreachNoticeInput,
+    WebSearchInput,
+)
+from tenure_mcp.server.audit import (
+    AUDIT_EVENT,
+    AUDIT_QUEUE_MAXSIZE,
+    TOOL_EXECUTION,
+    audit_writer_loop,
+    enqueue_record,
+    flush_queue,
+    register_writer,
+    unregister_writer,
 )
 from tenure_mcp.server.middleware import (
-    authentication_middleware,
-    observability_middleware,
-    request_id_middleware,
+    AuthenticationMiddleware,
+    EtagMiddleware,
+    ObservabilityMiddleware,
+    RequestIdMiddleware,
+    compute_etag,
 )
 from tenure_mcp.server.sse import sse_app
 from tenure_mcp.langgraphs.agent import execute_query_agent
@@ -38,6 +77,7 @@ from tenure_mcp.server.fastmcp_server import get_fastmcp_server
 
 # Initialize OpenTelemetry tracing
 from tenure_mcp.observability import initialize_tracing, shutdown_tracing
+from tenure_mcp.observability.metrics import CONTENT_TYPE_LATEST, generate_latest
 from tenure_mcp.tools import get_tool_registry, register_tool
 from tenure_mcp.tools.implementations import (
     analyze_open_home_feedback,
@@ -61,6 +101,60 @@ from tenure_mcp.tools.integration_tools import (
     get_tenant_communication_history,
 )
 
+# Input schema per tool (in production, would use schema registry)
+_TOOL_INPUT_SCHEMAS: Dict[str, Type[BaseModel]] = {
+    # Existing tools
+    "analyze_open_home_feedback": AnalyzeFeedbackInput,
+    "calculate_breach_status": CalculateBreachInput,
+    "ocr_document": OCRDocumentInput,
+    "extract_expiry_date": ExtractExpiryInput,
+    "generate_vendor_report": GenerateVendorReportInput,
+    "prepare_breach_notice": PrepareBreachNoticeInput,
+    "web_search": WebSearchInput,
+    # Gmail integration tools
+    "fetch_property_emails": FetchPropertyEmailsInput,
+    "search_communication_threads": SearchCommunicationThreadsInput,
+    # Google Drive integration tools
+    "list_property_documents": ListPropertyDocumentsInput,
+    "get_document_content": GetDocumentContentInput,
+    "check_document_expiry": CheckDocumentExpiryInput,
+    # VaultRE integration tools
+    "list_active_properties": ListActivePropertiesInput,
+    "get_property_contacts": GetPropertyContactsInput,
+    "get_upcoming_open_homes": GetUpcomingOpenHomesInput,
+    # Ailo integration tools
+    "list_arrears_tenancies": ListArrearsTenanciesInput,
+    "get_tenant_communication_history": GetTenantCommunicationHistoryInput,
+}
+
+# Workflow name -> (executor method, required body key, optional body keys)
+_WORKFLOWS: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "weekly_vendor_report": ("execute_weekly_vendor_report", "property_id", ()),
+    "arrears_detection": ("execute_arrears_detection", "tenancy_id", ()),
+    "compliance_audit": ("execute_compliance_audit", "property_id", ()),
+    "unified_collection": ("execute_unified_collection", "property_id", ("collection_scope",)),
+}
+
+# How long a /ready result is reused before the dependencies are probed again
+READY_CACHE_TTL_SECONDS = 2.0
+
+# Tools whose pre-execution state is written to the audit log
+_MUTATION_TOOLS = frozenset(PolicyGateway.MUTATION_TOOLS)
+
+# Tools whose post-execution output is written to the audit log
+_POST_STATE_TOOLS = frozenset({"prepare_breach_notice"})
+
+
+def _probe_db() -> bool:
+    """Check database connectivity with a trivial query."""
+    try:
+        db = get_db()
+        with db.get_connection() as conn:
+            conn.execute("SELECT 1")
+        return True
+    except Exception:
+        return False
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -139,9 +233,36 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     register_workflow("compliance_audit", executor.execute_compliance_audit)
     register_workflow("unified_collection", executor.execute_unified_collection)
 
+    # Warm the database (directory, schema, first connection) so the first
+    # tool call does not pay for it on the request path
+    await asyncio.to_thread(_probe_db)
+
+    # Bind the singletons used by request handlers once, instead of per request
+    db = get_db()
+    app.state.db = db
+    app.state.policy_gateway = get_policy_gateway()
+    app.state.tool_registry = get_tool_registry()
+    app.state.resource_registry = get_resource_registry()
+
+    # Start the batched audit writer
+    app.state.audit_queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+    audit_writer = asyncio.create_task(audit_writer_loop(app.state.audit_queue, db))
+    # Policy and workflow audit events go through the same writer
+    register_writer(app.state.audit_queue, db)
+
     yield
 
-    # Shutdown: cleanup if needed
+    # Shutdown: stop the audit writer and write whatever is still queued
+    unregister_writer()
+    audit_writer.cancel()
+    try:
+        await audit_writer
+    except asyncio.CancelledError:
+        pass
+    flush_queue(app.state.audit_queue, db)
+    # Close the pooled connections
+    await asyncio.to_thread(db.close)
+
     shutdown_tracing()
 
 
@@ -152,17 +273,21 @@ def create_app() -> FastAPI:
         description="MCP Server for Tenure RE Tech - Ray White real estate agentic workflows",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Add middleware (order matters - runs in REVERSE order of registration)
-    # So we want: request_id -> auth -> observability (for actual request flow)
-    # Register observability first, then auth, then request_id
-    if settings.opentelemetry_enabled:
-        app.middleware("http")(observability_middleware)
-    app.middleware("http")(authentication_middleware)
-    app.middleware("http")(request_id_middleware)
-
-    # CORS
+    # So we want: request_id -> etag -> auth -> observability (for actual request flow)
+    # Register observability first, then auth, then etag, then request_id
+    # Observability always runs for Prometheus metrics; it only creates spans when
+    # OpenTelemetry is enabled
+    app.add_middleware(ObservabilityMiddleware)
+    app.add_middleware(AuthenticationMiddleware)
+    app.add_middleware(EtagMiddleware)
+    app.add_middleware(RequestIdMiddleware)
+
+    # CORS - registered last, so it is the outermost layer and answers
+    # preflight OPTIONS requests before request_id, auth or observability run
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],  # In production, restrict to specific origins
@@ -183,64 +308,82 @@ def create_app() -> FastAPI:
     # Mount FastMCP app - it will handle its own routes and lifecycle
     app.mount("/mcp", mcp_app)
 
+    # Static probe bodies are encoded once; the precomputed ETag spares EtagMiddleware a hash
+    healthz_body = orjson.dumps({"status": "healthy", "version": "0.1.0"})
+    version_body = orjson.dumps({"version": "0.1.0", "api_version": settings.mcp_api_version})
+    healthz_headers = {"ETag": compute_etag(healthz_body)}
+    version_headers = {"ETag": compute_etag(version_body)}
+
     # Health check (liveness probe)
     @app.get("/healthz")
     async def health_check():
         """Liveness health check endpoint."""
-        return {"status": "healthy", "version": "0.1.0"}
+        return Response(healthz_body, media_type="application/json", headers=healthz_headers)
 
     # Readiness check (readiness probe)
+    # Probes are answered from a short-lived cache so a probe storm runs at most
+    # one blocking DB check per TTL, and that check runs off the event loop
+    ready_cache = {"ts": 0.0, "value": None}
+    ready_lock = asyncio.Lock()
+
     @app.get("/ready")
     async def readiness_check():
         """Readiness check - verifies all dependencies are available."""
-        checks = {
-            "database": False,
-            "tools_registered": False,
-            "resources_registered": False,
-        }
+        if time.monotonic() - ready_cache["ts"] < READY_CACHE_TTL_SECONDS:
+            return ready_cache["value"]
+
+        async with ready_lock:
+            # Another request may have refreshed the cache while we waited
+            if time.monotonic() - ready_cache["ts"] < READY_CACHE_TTL_SECONDS:
+                return ready_cache["value"]
+
+            checks = {
+                "database": False,
+                "tools_registered": False,
+                "resources_registered": False,
+            }
 
-        # Check database connectivity
-        try:
-            db = get_db()
-            with db.get_connection() as conn:
-                conn.execute("SELECT 1")
-            checks["database"] = True
-        except Exception:
-            pass
-
-        # Check tools are registered
-        tool_registry = get_tool_registry()
-        checks["tools_registered"] = len(tool_registry._tools) > 0
-
-        # Check resources are registered
-        resource_registry = get_resource_registry()
-        checks["resources_registered"] = len(resource_registry.list_resources()) > 0
-
-        all_ready = all(checks.values())
-        return {
-            "status": "ready" if all_ready else "not_ready",
-            "checks": checks,
-            "version": "0.1.0",
-        }
+            async with asyncio.TaskGroup() as tg:
+                # Check database connectivity in a worker thread
+                database_check = tg.create_task(asyncio.to_thread(_probe_db))
+
+                # Registry checks are in-memory, so they run while the DB probe is in flight
+                # Check tools are registered
+                tool_registry = app.state.tool_registry
+                checks["tools_registered"] = len(tool_registry._tools) > 0
+
+                # Check resources are registered
+                resource_registry = app.state.resource_registry
+                checks["resources_registered"] = len(resource_registry.list_resources()) > 0
+
+            checks["database"] = database_check.result()
+
+            all_ready = all(checks.values())
+            ready_cache["value"] = {
+                "status": "ready" if all_ready else "not_ready",
+                "checks": checks,
+                "version": "0.1.0",
+            }
+            ready_cache["ts"] = time.monotonic()
+            return ready_cache["value"]
 
     # Version endpoint
     @app.get("/version")
     async def get_version():
         """Get API version."""
-        return {
-            "version": "0.1.0",
-            "api_version": settings.mcp_api_version,
-        }
+        return Response(version_body, media_type="application/json", headers=version_headers)
 
-    # Metrics endpoint (stub for Prometheus)
+    # Metrics endpoint (Prometheus text exposition format)
     @app.get("/metrics")
     async def get_metrics():
         """Prometheus-compatible metrics endpoint."""
-        # In production, would export actual metrics
-        return "# Metrics endpoint\n# Prometheus metrics would be exported here\n"
+        return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
     # Tool execution endpoint
-    @app.post(f"/{settings.mcp_api_version}/tools/{{tool_name}}")
+    @app.post(
+        f"/{settings.mcp_api_version}/tools/{{tool_name}}",
+        response_model=ToolExecutionResponse,
+    )
     async def execute_tool(
         tool_name: str,
         tool_request: ToolExecutionRequest,
@@ -248,14 +391,14 @@ def create_app() -> FastAPI:
         hitl_token: str | None = Header(None, alias="X-HITL-Token"),
     ):
         """Execute a tool."""
-        import time
-
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         correlation_id = tool_request.correlation_id
         context = tool_request.context
+        # Read once from the ASGI scope; request.state would build a State wrapper
+        trace_id = http_request.scope.get("state", {}).get("trace_id")
 
         # Validate request context
-        policy_gateway = get_policy_gateway()
+        policy_gateway = app.state.policy_gateway
         context_valid, context_error = policy_gateway.check_request_context(context)
         if not context_valid:
             policy_gateway.log_policy_decision(
@@ -280,64 +423,16 @@ def create_app() -> FastAPI:
         policy_gateway.log_policy_decision(correlation_id, context, tool_name, True)
 
         # Get tool from registry
-        tool_func = get_tool_registry().get(tool_name)
+        tool_func = app.state.tool_registry.get(tool_name)
         if not tool_func:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Tool '{tool_name}' not found",
             )
 
-            # Execute tool
+        # Execute tool
         try:
-            # Parse input based on tool name (in production, would use schema registry)
-            from tenure_mcp.schemas.tools import (
-                AnalyzeFeedbackInput,
-                CalculateBreachInput,
-                ExtractExpiryInput,
-                GenerateVendorReportInput,
-                OCRDocumentInput,
-                PrepareBreachNoticeInput,
-                WebSearchInput,
-            )
-            from tenure_mcp.schemas.integrations import (
-                FetchPropertyEmailsInput,
-                SearchCommunicationThreadsInput,
-                ListPropertyDocumentsInput,
-                GetDocumentContentInput,
-                CheckDocumentExpiryInput,
-                ListActivePropertiesInput,
-                GetPropertyContactsInput,
-                GetUpcomingOpenHomesInput,
-                ListArrearsTenanciesInput,
-                GetTenantCommunicationHistoryInput,
-            )
-
-            input_schema_map = {
-                # Existing tools
-                "analyze_open_home_feedback": AnalyzeFeedbackInput,
-                "calculate_breach_status": CalculateBreachInput,
-                "ocr_document": OCRDocumentInput,
-                "extract_expiry_date": ExtractExpiryInput,
-                "generate_vendor_report": GenerateVendorReportInput,
-                "prepare_breach_notice": PrepareBreachNoticeInput,
-                "web_search": WebSearchInput,
-                # Gmail integration tools
-                "fetch_property_emails": FetchPropertyEmailsInput,
-                "search_communication_threads": SearchCommunicationThreadsInput,
-                # Google Drive integration tools
-                "list_property_documents": ListPropertyDocumentsInput,
-                "get_document_content": GetDocumentContentInput,
-                "check_document_expiry": CheckDocumentExpiryInput,
-                # VaultRE integration tools
-                "list_active_properties": ListActivePropertiesInput,
-                "get_property_contacts": GetPropertyContactsInput,
-                "get_upcoming_open_homes": GetUpcomingOpenHomesInput,
-                # Ailo integration tools
-                "list_arrears_tenancies": ListArrearsTenanciesInput,
-                "get_tenant_communication_history": GetTenantCommunicationHistoryInput,
-            }
-
-            schema_class = input_schema_map.get(tool_name)
+            schema_class = _TOOL_INPUT_SCHEMAS.get(tool_name)
             if not schema_class:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -356,14 +451,18 @@ def create_app() -> FastAPI:
                 output_dict = {"data": str(output)}
 
             redacted_output = policy_gateway.redact_output(output_dict, context, tool_name)
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
-            # Log execution
-            db = get_db()
+            # Log execution via the batched audit writer, off the request path
+            db = app.state.db
+            audit_queue = app.state.audit_queue
 
             # For mutation tools, log pre/post state
-            if tool_name in policy_gateway.MUTATION_TOOLS:
-                db.log_audit_event(
+            if tool_name in _MUTATION_TOOLS:
+                enqueue_record(
+                    audit_queue,
+                    db,
+                    AUDIT_EVENT,
                     correlation_id=correlation_id,
                     event_type="mutation_pre_state",
                     user_id=context.user_id,
@@ -373,7 +472,10 @@ def create_app() -> FastAPI:
                     details={"input": tool_request.input_data},
                 )
 
-            db.log_tool_execution(
+            enqueue_record(
+                audit_queue,
+                db,
+                TOOL_EXECUTION,
                 correlation_id=correlation_id,
                 tool_name=tool_name,
                 user_id=context.user_id,
@@ -381,13 +483,16 @@ def create_app() -> FastAPI:
                 input_data=tool_request.input_data,
                 output_data=redacted_output,
                 execution_time_ms=execution_time_ms,
-                trace_id=getattr(http_request.state, "trace_id", None),
+                trace_id=trace_id,
                 success=True,
             )
 
             # Log post-state for mutation tools
-            if tool_name in ["prepare_breach_notice"]:
-                db.log_audit_event(
+            if tool_name in _POST_STATE_TOOLS:
+                enqueue_record(
+                    audit_queue,
+                    db,
+                    AUDIT_EVENT,
                     correlation_id=correlation_id,
                     event_type="mutation_post_state",
                     user_id=context.user_id,
@@ -403,16 +508,19 @@ def create_app() -> FastAPI:
                 tool_name=tool_name,
                 output_data=redacted_output,
                 execution_time_ms=execution_time_ms,
-                trace_id=getattr(http_request.state, "trace_id", None),
+                trace_id=trace_id,
             )
 
         except Exception as e:
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             error_message = str(e)
 
             # Log error
-            db = get_db()
-            db.log_tool_execution(
+            db = app.state.db
+            enqueue_record(
+                app.state.audit_queue,
+                db,
+                TOOL_EXECUTION,
                 correlation_id=correlation_id,
                 tool_name=tool_name,
                 user_id=context.user_id,
@@ -420,7 +528,7 @@ def create_app() -> FastAPI:
                 input_data=tool_request.input_data,
                 output_data=None,
                 execution_time_ms=execution_time_ms,
-                trace_id=getattr(http_request.state, "trace_id", None),
+                trace_id=trace_id,
                 success=False,
                 error_message=error_message,
             )
@@ -434,15 +542,13 @@ def create_app() -> FastAPI:
     @app.post(f"/{settings.mcp_api_version}/workflows/{{workflow_name}}")
     async def execute_workflow(
         workflow_name: str,
-        request: Request,
+        body: WorkflowExecutionRequest,
         user_id: str = Header(..., alias="X-User-ID"),
         tenant_id: str = Header(..., alias="X-Tenant-ID"),
         auth_context: str = Header(..., alias="X-Auth-Context"),
         role: str = Header(default="agent", alias="X-Role"),
     ):
         """Execute a LangGraph workflow."""
-        body = await request.json()
-
         # Build request context
         context = RequestContext(
             user_id=user_id,
@@ -452,7 +558,7 @@ def create_app() -> FastAPI:
         )
 
         # Validate context
-        policy_gateway = get_policy_gateway()
+        policy_gateway = app.state.policy_gateway
         context_valid, context_error = policy_gateway.check_request_context(context)
         if not context_valid:
             raise HTTPException(
@@ -465,53 +571,25 @@ def create_app() -> FastAPI:
 
         executor = get_workflow_executor()
 
-        try:
-            if workflow_name == "weekly_vendor_report":
-                property_id = body.get("property_id")
-                if not property_id:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Missing property_id",
-                    )
-                result = await executor.execute_weekly_vendor_report(property_id, context)
-
-            elif workflow_name == "arrears_detection":
-                tenancy_id = body.get("tenancy_id")
-                if not tenancy_id:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Missing tenancy_id",
-                    )
-                result = await executor.execute_arrears_detection(tenancy_id, context)
-
-            elif workflow_name == "compliance_audit":
-                property_id = body.get("property_id")
-                if not property_id:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Missing property_id",
-                    )
-                result = await executor.execute_compliance_audit(property_id, context)
-
-            elif workflow_name == "unified_collection":
-                property_id = body.get("property_id")
-                if not property_id:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Missing property_id",
-                    )
-                collection_scope = body.get("collection_scope")  # Optional
-                result = await executor.execute_unified_collection(
-                    property_id, context, collection_scope
-                )
+        workflow = _WORKFLOWS.get(workflow_name)
+        if workflow is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Workflow '{workflow_name}' not found",
+            )
+        method_name, required_key, optional_keys = workflow
 
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Workflow '{workflow_name}' not found",
-                )
+        kwargs = {required_key: getattr(body, required_key)}
+        if not kwargs[required_key]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Missing {required_key}",
+            )
+        for key in optional_keys:
+            kwargs[key] = getattr(body, key)
 
-            return result
+        try:
+            return await getattr(executor, method_name)(context=context, **kwargs)
 
         except HTTPException:
             raise
@@ -537,7 +615,7 @@ def create_app() -> FastAPI:
             auth_context=auth_context,
             role=role,
         )
-        policy_gateway = get_policy_gateway()
+        policy_gateway = app.state.policy_gateway
         context_valid, context_error = policy_gateway.check_request_context(context)
         if not context_valid:
             raise HTTPException(
@@ -561,13 +639,15 @@ def create_app() -> FastAPI:
     @app.get(f"/{settings.mcp_api_version}/resources/{{resource_path:path}}")
     async def get_resource(
         resource_path: str,
+        request: Request,
         user_id: str = Header(..., alias="X-User-ID"),
         tenant_id: str = Header(..., alias="X-Tenant-ID"),
         auth_context: str = Header(..., alias="X-Auth-Context"),
         role: str = Header(default="agent", alias="X-Role"),
     ):
         """Get a resource."""
-        correlation_id = str(uuid.uuid4())
+        # Reuse the ID assigned by RequestIdMiddleware rather than generating a second one
+        correlation_id = getattr(request.state, "correlation_id", None) or str(uuid.uuid4())
 
         # Build request context
         context = RequestContext(
@@ -578,7 +658,7 @@ def create_app() -> FastAPI:
         )
 
         # Validate context
-        policy_gateway = get_policy_gateway()
+        policy_gateway = app.state.policy_gateway
         context_valid, context_error = policy_gateway.check_request_context(context)
         if not context_valid:
             raise HTTPException(
@@ -587,20 +667,18 @@ def create_app() -> FastAPI:
             )
 
         # Get resource handler
-        resource_registry = get_resource_registry()
-        handler_result = resource_registry.get(resource_path)
+        resource_registry = app.state.resource_registry
+        handler_result = resource_registry.match(resource_path)
         if not handler_result:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Resource '{resource_path}' not found",
             )
 
-        handler_func, metadata = handler_result
+        handler_func, metadata, path_params = handler_result
 
-        # Extract ID from URI (simple parsing)
-        # In production, would use proper URI routing
-        parts = resource_path.split("/")
-        resource_id = parts[-1] if parts else None
+        # Resource templates carry a single ID parameter ({id} or {tenancy_id})
+        resource_id = next(iter(path_params.values()), None)
 
         try:
             # Call resource handler
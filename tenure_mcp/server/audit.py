@@ -0,0 +1,140 @@
+"""Batched audit log writer for the HTTP server.
+
+Tool execution and audit records are queued by request handlers, the policy
+gateway and the workflow executor, and written by a single background task,
+which groups them into one SQLite transaction per batch instead of one commit
+per record.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from tenure_mcp.storage.database import Database
+
+logger = logging.getLogger(__name__)
+
+# Queue bound; when full, handlers write directly so no record is dropped
+AUDIT_QUEUE_MAXSIZE = 10_000
+# Maximum records per transaction
+AUDIT_BATCH_SIZE = 128
+# How long a partial batch waits for more records before it is written
+AUDIT_FLUSH_INTERVAL_SECONDS = 0.02
+
+TOOL_EXECUTION = "tool_execution"
+AUDIT_EVENT = "audit_event"
+
+# The running server's writer (queue, its database, its event loop), set by the app lifespan
+_writer: Optional[Tuple[asyncio.Queue, Database, asyncio.AbstractEventLoop]] = None
+
+
+class AuditRecord(NamedTuple):
+    """Queued log record: the kind and the keyword arguments of the matching Database.log_* call."""
+
+    kind: str
+    fields: Dict[str, Any]
+
+
+def write_records(db: Database, records: List[AuditRecord]) -> None:
+    """Write records to the database in a single transaction."""
+    db.log_batch(
+        tool_executions=[r.fields for r in records if r.kind == TOOL_EXECUTION],
+        audit_events=[r.fields for r in records if r.kind == AUDIT_EVENT],
+    )
+
+
+def write_records_or_each(db: Database, records: List[AuditRecord]) -> None:
+    """Write records in one transaction, retrying one per transaction if the batch fails.
+
+    A single bad record (or a transient error) then costs at most that record.
+    """
+    try:
+        write_records(db, records)
+        return
+    except Exception:
+        if len(records) == 1:
+            logger.exception("Failed to write %s audit record", records[0].kind)
+            return
+        logger.warning(
+            "Failed to write %d audit records as a batch; writing them one by one",
+            len(records),
+            exc_info=True,
+        )
+
+    for record in records:
+        try:
+            write_records(db, [record])
+        except Exception:
+            logger.exception("Failed to write %s audit record", record.kind)
+
+
+def enqueue_record(queue: asyncio.Queue, db: Database, kind: str, **fields: Any) -> None:
+    """Queue a record for the writer, writing it directly if the queue is full."""
+    record = AuditRecord(kind, fields)
+    try:
+        queue.put_nowait(record)
+    except asyncio.QueueFull:
+        write_records_or_each(db, [record])
+
+
+def register_writer(queue: asyncio.Queue, db: Database) -> None:
+    """Send record_audit_event calls on the running event loop to this writer's queue."""
+    global _writer
+    _writer = (queue, db, asyncio.get_running_loop())
+
+
+def unregister_writer() -> None:
+    """Write record_audit_event calls directly again (writer shutting down)."""
+    global _writer
+    _writer = None
+
+
+def record_audit_event(db: Database, **fields: Any) -> None:
+    """Record an audit event (log_audit_event arguments) through the server's writer.
+
+    The event joins the same queue as the request handlers' records, so one
+    request's records are written in order. With no writer for db on the
+    current event loop (CLI runs, worker threads, tests), it is written directly.
+    """
+    writer = _writer
+    if writer is not None:
+        queue, writer_db, loop = writer
+        try:
+            on_writer_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_writer_loop = False
+        if on_writer_loop and writer_db is db:
+            enqueue_record(queue, db, AUDIT_EVENT, **fields)
+            return
+    write_records_or_each(db, [AuditRecord(AUDIT_EVENT, fields)])
+
+
+async def audit_writer_loop(queue: asyncio.Queue, db: Database) -> None:
+    """Drain the queue, writing up to AUDIT_BATCH_SIZE records per transaction."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + AUDIT_FLUSH_INTERVAL_SECONDS
+        while len(batch) < AUDIT_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+            except asyncio.CancelledError:
+                # Shutting down: do not lose records already taken off the queue
+                write_records_or_each(db, batch)
+                raise
+
+        await asyncio.to_thread(write_records_or_each, db, batch)
+
+
+def flush_queue(queue: asyncio.Queue, db: Database) -> None:
+    """Write every record still in the queue (used at shutdown)."""
+    records = []
+    while not queue.empty():
+        records.append(queue.get_nowait())
+    if records:
+        write_records_or_each(db, records)
@@ -1,76 +1,255 @@
-"""FastAPI middleware for authentication and observability."""
+"""ASGI middleware for authentication and observability.
 
+Written as pure ASGI classes so requests skip BaseHTTPMiddleware's per-request task group.
+"""
+
+import hashlib
+import hmac
 import time
 import uuid
-from typing import Callable
 
-from fastapi import Request, Response, status
-from fastapi.responses import JSONResponse
 from opentelemetry import trace
+from starlette import status
+from starlette.datastructures import URL, Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from tenure_mcp.config import settings
+from tenure_mcp.observability.metrics import (
+    REQUEST_COUNTER,
+    REQUEST_LATENCY,
+    REQUESTS_IN_FLIGHT,
+)
 
 tracer = trace.get_tracer(__name__)
 
+# Endpoints served without a bearer token (health/version/docs)
+PUBLIC_PATHS = frozenset({"/healthz", "/ready", "/version", "/docs", "/openapi.json", "/metrics"})
 
-async def authentication_middleware(request: Request, call_next: Callable) -> Response:
-    """Middleware to authenticate requests via bearer token."""
-    # Skip auth for health/version/docs endpoints
-    if request.url.path in ["/healthz", "/ready", "/version", "/docs", "/openapi.json", "/metrics"]:
-        return await call_next(request)
-
-    # Check bearer token
-    auth_header = request.headers.get("Authorization")
-    if not auth_header or not auth_header.startswith("Bearer "):
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content={"error": "Missing or invalid Authorization header"},
-        )
+# GET endpoints whose bodies only change with server state, so pollers can revalidate
+ETAG_PATHS = frozenset({"/healthz", "/ready", "/version"})
 
-    token = auth_header.replace("Bearer ", "")
-    if token != settings.bearer_token:
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content={"error": "Invalid bearer token"},
-        )
+# Pre-encoded 401 bodies
+_MISSING_AUTH_BODY = b'{"error":"Missing or invalid Authorization header"}'
+_INVALID_TOKEN_BODY = b'{"error":"Invalid bearer token"}'
 
-    return await call_next(request)
 
+async def _send_json(send: Send, status_code: int, body: bytes) -> None:
+    """Send a complete JSON response without building a Response object."""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
 
-async def request_id_middleware(request: Request, call_next: Callable) -> Response:
-    """Middleware to add correlation ID to requests."""
-    correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
-    request.state.correlation_id = correlation_id
-
-    response = await call_next(request)
-    response.headers["X-Correlation-ID"] = correlation_id
-    return response
 
+def compute_etag(body: bytes) -> str:
+    """Compute a strong ETag for a response body."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
 
-async def observability_middleware(request: Request, call_next: Callable) -> Response:
-    """Middleware for observability (tracing, timing)."""
-    start_time = time.time()
 
-    # Get correlation_id (set by request_id_middleware)
-    correlation_id = getattr(request.state, "correlation_id", str(uuid.uuid4()))
-
-    # Create trace span if OpenTelemetry enabled
-    if settings.opentelemetry_enabled:
-        with tracer.start_as_current_span(f"{request.method} {request.url.path}") as span:
-            span.set_attribute("http.method", request.method)
-            span.set_attribute("http.url", str(request.url))
-            span.set_attribute("correlation_id", correlation_id)
-
-            response = await call_next(request)
+class AuthenticationMiddleware:
+    """Middleware to authenticate requests via bearer token."""
 
-            duration_ms = (time.time() - start_time) * 1000
-            span.set_attribute("http.status_code", response.status_code)
-            span.set_attribute("duration_ms", duration_ms)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        # Encoded once per app for the constant-time comparison
+        self.bearer_token = settings.bearer_token.encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Skip auth for health/version/docs endpoints
+        if scope["path"] in PUBLIC_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        # Check bearer token
+        auth_header = Headers(scope=scope).get("Authorization")
+        if not auth_header or not auth_header.startswith("Bearer "):
+            await _send_json(send, status.HTTP_401_UNAUTHORIZED, _MISSING_AUTH_BODY)
+            return
+
+        token = auth_header[7:]
+        if not hmac.compare_digest(token.encode(), self.bearer_token):
+            await _send_json(send, status.HTTP_401_UNAUTHORIZED, _INVALID_TOKEN_BODY)
+            return
+
+        await self.app(scope, receive, send)
+
+
+class EtagMiddleware:
+    """Middleware to add ETags to polled GET endpoints and answer If-None-Match with 304."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or scope["path"] not in ETAG_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("If-None-Match")
+        start_message: Message = {}
+        body_parts = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                if message["status"] != status.HTTP_200_OK:
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            # Non-200 responses were passed through at start
+            if not start_message:
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            headers = Headers(raw=start_message["headers"])
+            etag = headers.get("ETag")
+            raw_headers = list(start_message["headers"])
+            if etag is None:
+                etag = compute_etag(body)
+                raw_headers.append((b"etag", etag.encode()))
+
+            if if_none_match == etag:
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": status.HTTP_304_NOT_MODIFIED,
+                        "headers": [(b"etag", etag.encode())],
+                    }
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**start_message, "headers": raw_headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class RequestIdMiddleware:
+    """Middleware to add correlation ID to requests."""
 
-            response.headers["X-Request-Duration-Ms"] = str(duration_ms)
-            return response
-    else:
-        response = await call_next(request)
-        duration_ms = (time.time() - start_time) * 1000
-        response.headers["X-Request-Duration-Ms"] = str(duration_ms)
-        return response
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Scan the raw header list so a client-supplied ID skips both the
+        # Headers object and uuid4() (an os.urandom syscall)
+        raw_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-correlation-id":
+                raw_id = value
+                break
+        if raw_id is None:
+            correlation_id = str(uuid.uuid4())
+            raw_id = correlation_id.encode("latin-1")
+        else:
+            correlation_id = raw_id.decode("latin-1")
+
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
+        header = (b"x-correlation-id", raw_id)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), header]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _route_label(scope: Scope) -> str:
+    """Metrics label for the matched route template, keeping path-parameter values out."""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    # Mounted apps (/sse, /mcp) are labelled by mount point; anything else is unmatched
+    return scope.get("root_path") or "unmatched"
+
+
+def _record_request(scope: Scope, status_code: int, duration_ms: float) -> None:
+    """Update the Prometheus request metrics."""
+    method = scope["method"]
+    path = _route_label(scope)
+    REQUEST_COUNTER.labels(method, path, str(status_code)).inc()
+    REQUEST_LATENCY.labels(method, path).observe(duration_ms / 1000)
+
+
+class ObservabilityMiddleware:
+    """Middleware for observability (tracing, timing, Prometheus metrics)."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+
+        # Get correlation_id (set by RequestIdMiddleware)
+        correlation_id = scope.get("state", {}).get("correlation_id") or str(uuid.uuid4())
+
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            # Create trace span if OpenTelemetry enabled
+            if settings.opentelemetry_enabled:
+                method = scope["method"]
+                with tracer.start_as_current_span(f"{method} {scope['path']}") as span:
+                    span.set_attribute("http.method", method)
+                    span.set_attribute("http.url", str(URL(scope=scope)))
+                    span.set_attribute("correlation_id", correlation_id)
+
+                    async def send_wrapper(message: Message) -> None:
+                        if message["type"] == "http.response.start":
+                            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                            span.set_attribute("http.status_code", message["status"])
+                            span.set_attribute("duration_ms", duration_ms)
+                            _record_request(scope, message["status"], duration_ms)
+                            message["headers"] = [
+                                *message.get("headers", []),
+                                (b"x-request-duration-ms", str(duration_ms).encode()),
+                            ]
+                        await send(message)
+
+                    await self.app(scope, receive, send_wrapper)
+            else:
+
+                async def send_wrapper(message: Message) -> None:
+                    if message["type"] == "http.response.start":
+                        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                        _record_request(scope, message["status"], duration_ms)
+                        message["headers"] = [
+                            *message.get("headers", []),
+                            (b"x-request-duration-ms", str(duration_ms).encode()),
+                        ]
+                    await send(message)
+
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
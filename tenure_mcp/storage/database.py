@@ -1,12 +1,20 @@
 """SQLite database for MCP Server persistence."""
 
+import atexit
 import json
 import sqlite3
+import threading
+import weakref
 from contextlib import contextmanager
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import orjson
 
 from tenure_mcp.config import settings
 
@@ -14,15 +22,759 @@ from tenure_mcp.config import settings
 class DateTimeEncoder(json.JSONEncoder):
     """JSON encoder that handles datetime, date, and Decimal objects."""
 
+    # Exact-type dispatch; datetime precedes date so subclass lookups pick the right one
+    _ENCODERS = {datetime: datetime.isoformat, date: date.isoformat, Decimal: str}
+
     def default(self, obj):
         """Encode datetime, date, and Decimal objects."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, date):
-            return obj.isoformat()
-        if isinstance(obj, Decimal):
-            return str(obj)
-        return super().default(obj)
+        encoder = self._ENCODERS.get(type(obj))
+        if encoder is None:
+            # Subclasses (e.g. pendulum datetimes) miss the exact-type lookup
+            for cls, candidate in self._ENCODERS.items():
+                if isinstance(obj, cls):
+                    encoder = candidate
+                    break
+            else:
+                return super().default(obj)
+        return encoder(obj)
+
+
+# orjson encodes datetime/date natively; the encoder above covers Decimal and anything else
+_ENCODER = DateTimeEncoder()
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a JSON column value."""
+    return orjson.dumps(obj, default=_ENCODER.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Per-connection PRAGMAs; SQLite does not persist these, so they run on every open
+_CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+# On-disk only: synchronous=NORMAL is durable under WAL except for the last commits
+# before a power loss
+_FILE_PRAGMAS = ("PRAGMA synchronous=NORMAL",)
+
+# How long a connection waits on another writer's lock before "database is locked"
+_BUSY_TIMEOUT_SECONDS = 30.0
+
+_IN_MEMORY_PATH = ":memory:"
+
+# Tables are created in one executescript call; IF NOT EXISTS keeps it idempotent
+_TABLES_DDL = """
+    -- Tool execution logs
+    CREATE TABLE IF NOT EXISTS tool_executions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        correlation_id TEXT NOT NULL,
+        tool_name TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        tenant_id TEXT NOT NULL,
+        input_data TEXT,
+        output_data TEXT,
+        execution_time_ms REAL,
+        trace_id TEXT,
+        success BOOLEAN,
+        error_message TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- LangGraph workflow executions
+    CREATE TABLE IF NOT EXISTS workflow_executions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        correlation_id TEXT NOT NULL,
+        workflow_name TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        tenant_id TEXT NOT NULL,
+        state_snapshot TEXT,
+        trace_id TEXT,
+        status TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        completed_at TIMESTAMP
+    );
+
+    -- Agent manifests
+    CREATE TABLE IF NOT EXISTS agent_manifests (
+        agent_id TEXT PRIMARY KEY,
+        version TEXT NOT NULL,
+        input_schema TEXT NOT NULL,
+        output_schema TEXT NOT NULL,
+        permitted_tools TEXT,
+        permitted_resources TEXT,
+        rbac_policy_level TEXT NOT NULL,
+        workflow_version TEXT,
+        prompt_hash TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Audit log
+    CREATE TABLE IF NOT EXISTS audit_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        correlation_id TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        user_id TEXT,
+        tenant_id TEXT,
+        tool_name TEXT,
+        action TEXT,
+        policy_result TEXT,
+        details TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Mock Data Tables for Integration Testing
+
+    -- Gmail mock emails
+    CREATE TABLE IF NOT EXISTS mock_emails (
+        id TEXT PRIMARY KEY,
+        thread_id TEXT NOT NULL,
+        property_id TEXT,
+        contact_email TEXT,
+        sender TEXT NOT NULL,
+        recipient TEXT NOT NULL,
+        subject TEXT NOT NULL,
+        snippet TEXT,
+        body_preview TEXT,
+        label_ids TEXT,
+        internal_date INTEGER,
+        has_attachments BOOLEAN DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Google Drive mock files
+    CREATE TABLE IF NOT EXISTS mock_drive_files (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        mime_type TEXT NOT NULL,
+        property_id TEXT,
+        parent_folder_id TEXT,
+        size_bytes INTEGER,
+        content_hash TEXT,
+        expiry_date DATE,
+        web_view_link TEXT,
+        owner_email TEXT,
+        shared BOOLEAN DEFAULT 0,
+        created_time TIMESTAMP,
+        modified_time TIMESTAMP,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- VaultRE mock properties
+    CREATE TABLE IF NOT EXISTS mock_properties (
+        id TEXT PRIMARY KEY,
+        address_line1 TEXT NOT NULL,
+        address_line2 TEXT,
+        address_suburb TEXT NOT NULL,
+        address_state TEXT NOT NULL,
+        address_postcode TEXT NOT NULL,
+        property_class TEXT NOT NULL,
+        property_type TEXT,
+        status TEXT NOT NULL,
+        bedrooms INTEGER,
+        bathrooms INTEGER,
+        car_spaces INTEGER,
+        land_area REAL,
+        building_area REAL,
+        price_display TEXT,
+        price_value REAL,
+        description TEXT,
+        features TEXT,
+        agent_ids TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- VaultRE mock contacts
+    CREATE TABLE IF NOT EXISTS mock_contacts (
+        id TEXT PRIMARY KEY,
+        property_id TEXT,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        email TEXT,
+        phone TEXT,
+        mobile TEXT,
+        contact_type TEXT NOT NULL,
+        company TEXT,
+        notes TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- VaultRE mock property feedback
+    CREATE TABLE IF NOT EXISTS mock_feedback (
+        id TEXT PRIMARY KEY,
+        property_id TEXT NOT NULL,
+        contact_id TEXT,
+        contact_name TEXT,
+        feedback_date TIMESTAMP NOT NULL,
+        rating INTEGER,
+        interest_level TEXT,
+        comments TEXT,
+        source TEXT DEFAULT 'open_home',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- VaultRE mock open homes
+    CREATE TABLE IF NOT EXISTS mock_open_homes (
+        id TEXT PRIMARY KEY,
+        property_id TEXT NOT NULL,
+        start_time TIMESTAMP NOT NULL,
+        end_time TIMESTAMP NOT NULL,
+        agent_id TEXT,
+        attendee_count INTEGER DEFAULT 0,
+        notes TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Ailo mock ledgers
+    CREATE TABLE IF NOT EXISTS mock_ledgers (
+        id TEXT PRIMARY KEY,
+        tenancy_id TEXT NOT NULL UNIQUE,
+        property_id TEXT,
+        tenant_id TEXT,
+        current_balance REAL DEFAULT 0.0,
+        rent_amount REAL NOT NULL,
+        rent_frequency TEXT NOT NULL,
+        next_due_date DATE,
+        arrears_days INTEGER DEFAULT 0,
+        arrears_status TEXT DEFAULT 'current',
+        last_payment_date DATE,
+        last_payment_amount REAL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Ailo mock tenants
+    CREATE TABLE IF NOT EXISTS mock_tenants (
+        id TEXT PRIMARY KEY,
+        tenancy_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        email TEXT NOT NULL,
+        phone TEXT,
+        lease_start DATE NOT NULL,
+        lease_end DATE,
+        is_primary BOOLEAN DEFAULT 1,
+        emergency_contact TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Ailo mock payments
+    CREATE TABLE IF NOT EXISTS mock_payments (
+        id TEXT PRIMARY KEY,
+        ledger_id TEXT NOT NULL,
+        amount REAL NOT NULL,
+        payment_date DATE NOT NULL,
+        payment_type TEXT DEFAULT 'rent',
+        reference TEXT,
+        status TEXT DEFAULT 'completed',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+# Per-connection prepared statement cache; sized to hold every constant below plus
+# the dynamic filter queries
+_STATEMENT_CACHE_SIZE = 256
+
+# Insert parameter layout per mock table: COLUMNS is the INSERT column order,
+# DEFAULTS fills optional columns, GET pulls the tuple out in one C call and
+# JSON_COLUMNS are stored as JSON text and decoded on read
+_MOCK_EMAIL_COLUMNS = (
+    "id", "thread_id", "property_id", "contact_email", "sender", "recipient", "subject", "snippet",
+    "body_preview", "label_ids", "internal_date", "has_attachments",
+)
+_MOCK_EMAIL_DEFAULTS = {
+    "property_id": None,
+    "contact_email": None,
+    "snippet": None,
+    "body_preview": None,
+    "label_ids": [],
+    "internal_date": None,
+    "has_attachments": False,
+}
+_MOCK_EMAIL_GET = itemgetter(*_MOCK_EMAIL_COLUMNS)
+_MOCK_EMAIL_JSON_COLUMNS = ("label_ids",)
+
+_MOCK_DRIVE_FILE_COLUMNS = (
+    "id", "name", "mime_type", "property_id", "parent_folder_id", "size_bytes", "content_hash",
+    "expiry_date", "web_view_link", "owner_email", "shared", "created_time", "modified_time",
+)
+_MOCK_DRIVE_FILE_DEFAULTS = {
+    "property_id": None,
+    "parent_folder_id": None,
+    "size_bytes": None,
+    "content_hash": None,
+    "expiry_date": None,
+    "web_view_link": None,
+    "owner_email": None,
+    "shared": False,
+    "created_time": None,
+    "modified_time": None,
+}
+_MOCK_DRIVE_FILE_GET = itemgetter(*_MOCK_DRIVE_FILE_COLUMNS)
+
+_MOCK_PROPERTY_COLUMNS = (
+    "id", "address_line1", "address_line2", "address_suburb", "address_state", "address_postcode",
+    "property_class", "property_type", "status", "bedrooms", "bathrooms", "car_spaces", "land_area",
+    "building_area", "price_display", "price_value", "description", "features", "agent_ids",
+)
+_MOCK_PROPERTY_DEFAULTS = {
+    "address_line2": None,
+    "property_type": None,
+    "bedrooms": None,
+    "bathrooms": None,
+    "car_spaces": None,
+    "land_area": None,
+    "building_area": None,
+    "price_display": None,
+    "price_value": None,
+    "description": None,
+    "features": [],
+    "agent_ids": [],
+}
+_MOCK_PROPERTY_GET = itemgetter(*_MOCK_PROPERTY_COLUMNS)
+_MOCK_PROPERTY_JSON_COLUMNS = ("features", "agent_ids")
+
+_MOCK_CONTACT_COLUMNS = (
+    "id", "property_id", "first_name", "last_name", "email", "phone", "mobile", "contact_type",
+    "company", "notes",
+)
+_MOCK_CONTACT_DEFAULTS = {
+    "property_id": None,
+    "email": None,
+    "phone": None,
+    "mobile": None,
+    "company": None,
+    "notes": None,
+}
+_MOCK_CONTACT_GET = itemgetter(*_MOCK_CONTACT_COLUMNS)
+
+_MOCK_FEEDBACK_COLUMNS = (
+    "id", "property_id", "contact_id", "contact_name", "feedback_date", "rating", "interest_level",
+    "comments", "source",
+)
+_MOCK_FEEDBACK_DEFAULTS = {
+    "contact_id": None,
+    "contact_name": None,
+    "rating": None,
+    "interest_level": None,
+    "comments": None,
+    "source": "open_home",
+}
+_MOCK_FEEDBACK_GET = itemgetter(*_MOCK_FEEDBACK_COLUMNS)
+
+_MOCK_OPEN_HOME_COLUMNS = (
+    "id", "property_id", "start_time", "end_time", "agent_id", "attendee_count", "notes",
+)
+_MOCK_OPEN_HOME_DEFAULTS = {
+    "agent_id": None,
+    "attendee_count": 0,
+    "notes": None,
+}
+_MOCK_OPEN_HOME_GET = itemgetter(*_MOCK_OPEN_HOME_COLUMNS)
+
+_MOCK_LEDGER_COLUMNS = (
+    "id", "tenancy_id", "property_id", "tenant_id", "current_balance", "rent_amount",
+    "rent_frequency", "next_due_date", "arrears_days", "arrears_status", "last_payment_date",
+    "last_payment_amount",
+)
+_MOCK_LEDGER_DEFAULTS = {
+    "property_id": None,
+    "tenant_id": None,
+    "current_balance": 0.0,
+    "next_due_date": None,
+    "arrears_days": 0,
+    "arrears_status": "current",
+    "last_payment_date": None,
+    "last_payment_amount": None,
+}
+_MOCK_LEDGER_GET = itemgetter(*_MOCK_LEDGER_COLUMNS)
+
+_MOCK_TENANT_COLUMNS = (
+    "id", "tenancy_id", "name", "email", "phone", "lease_start", "lease_end", "is_primary",
+    "emergency_contact",
+)
+_MOCK_TENANT_DEFAULTS = {
+    "phone": None,
+    "lease_end": None,
+    "is_primary": True,
+    "emergency_contact": None,
+}
+_MOCK_TENANT_GET = itemgetter(*_MOCK_TENANT_COLUMNS)
+
+_MOCK_PAYMENT_COLUMNS = (
+    "id", "ledger_id", "amount", "payment_date", "payment_type", "reference", "status",
+)
+_MOCK_PAYMENT_DEFAULTS = {
+    "payment_type": "rent",
+    "reference": None,
+    "status": "completed",
+}
+_MOCK_PAYMENT_GET = itemgetter(*_MOCK_PAYMENT_COLUMNS)
+
+# Native upserts (SQLite 3.24+) update the conflicting row in place, keeping its
+# created_at; older runtimes fall back to INSERT OR REPLACE (delete + reinsert)
+_SUPPORTS_UPSERT = sqlite3.sqlite_version_info >= (3, 24, 0)
+
+
+@lru_cache(maxsize=None)
+def _upsert_sql(
+    table: str,
+    columns: Tuple[str, ...],
+    key: str = "id",
+    computed: Tuple[Tuple[str, str], ...] = (),
+    rows: int = 1,
+) -> str:
+    """Build an insert of rows VALUES groups that updates rows whose key already exists.
+
+    computed pairs extra columns with SQL expressions applied on both insert and update.
+    """
+    names = ", ".join([*columns, *(column for column, _ in computed)])
+    row_values = "(" + ", ".join(["?"] * len(columns) + [expr for _, expr in computed]) + ")"
+    values = ", ".join([row_values] * rows)
+    if not _SUPPORTS_UPSERT:
+        return f"INSERT OR REPLACE INTO {table} ({names}) VALUES {values}"
+    updates = ", ".join(
+        [f"{column} = excluded.{column}" for column in columns if column != key]
+        + [f"{column} = {expr}" for column, expr in computed]
+    )
+    return (
+        f"INSERT INTO {table} ({names}) VALUES {values} "
+        f"ON CONFLICT({key}) DO UPDATE SET {updates}"
+    )
+
+
+_AGENT_MANIFEST_COLUMNS = (
+    "agent_id", "version", "input_schema", "output_schema", "permitted_tools",
+    "permitted_resources", "rbac_policy_level", "workflow_version", "prompt_hash",
+)
+_UPSERT_AGENT_MANIFEST_SQL = _upsert_sql("agent_manifests", _AGENT_MANIFEST_COLUMNS, key="agent_id")
+
+_MOCK_PROPERTY_COMPUTED = (("updated_at", "CURRENT_TIMESTAMP"),)
+
+# Rows per multi-VALUES insert, capped so a statement stays under SQLite's host
+# parameter limit (999 before SQLite 3.32)
+_BULK_INSERT_ROWS = 100
+_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+# Rows fetched per round trip when iterating over a result set
+_FETCH_BATCH_SIZE = 1000
+
+# Mock tables, mapped to the statement that clears each one. Run with execute() inside
+# the surrounding transaction: executescript() would commit it first.
+_CLEAR_MOCK_TABLE_SQL = {
+    table: f"DELETE FROM {table}"
+    for table in (
+        "mock_emails",
+        "mock_drive_files",
+        "mock_properties",
+        "mock_contacts",
+        "mock_feedback",
+        "mock_open_homes",
+        "mock_ledgers",
+        "mock_tenants",
+        "mock_payments",
+    )
+}
+
+# Secondary indexes on the mock tables; dropped and rebuilt around bulk seeds
+_MOCK_INDEX_DDL = [
+    (
+        "idx_mock_emails_property",
+        "CREATE INDEX IF NOT EXISTS idx_mock_emails_property ON mock_emails(property_id)",
+    ),
+    (
+        "idx_mock_emails_thread",
+        "CREATE INDEX IF NOT EXISTS idx_mock_emails_thread ON mock_emails(thread_id)",
+    ),
+    (
+        "idx_mock_drive_files_property",
+        "CREATE INDEX IF NOT EXISTS idx_mock_drive_files_property ON mock_drive_files(property_id)",
+    ),
+    (
+        "idx_mock_contacts_property",
+        "CREATE INDEX IF NOT EXISTS idx_mock_contacts_property ON mock_contacts(property_id)",
+    ),
+    (
+        "idx_mock_feedback_property",
+        "CREATE INDEX IF NOT EXISTS idx_mock_feedback_property ON mock_feedback(property_id)",
+    ),
+    (
+        "idx_mock_open_homes_property",
+        "CREATE INDEX IF NOT EXISTS idx_mock_open_homes_property ON mock_open_homes(property_id)",
+    ),
+    (
+        "idx_mock_ledgers_tenancy",
+        "CREATE INDEX IF NOT EXISTS idx_mock_ledgers_tenancy ON mock_ledgers(tenancy_id)",
+    ),
+    (
+        "idx_mock_tenants_tenancy",
+        "CREATE INDEX IF NOT EXISTS idx_mock_tenants_tenancy ON mock_tenants(tenancy_id)",
+    ),
+    # Serves the newest-first payment history without a sort step
+    (
+        "idx_mock_payments_ledger_date",
+        "CREATE INDEX IF NOT EXISTS idx_mock_payments_ledger_date "
+        "ON mock_payments(ledger_id, payment_date DESC)",
+    ),
+    # Range scans for the arrears and expiry reports and the status-filtered listing
+    (
+        "idx_mock_ledgers_arrears",
+        "CREATE INDEX IF NOT EXISTS idx_mock_ledgers_arrears ON mock_ledgers(arrears_days DESC)",
+    ),
+    (
+        "idx_mock_drive_files_expiry",
+        "CREATE INDEX IF NOT EXISTS idx_mock_drive_files_expiry ON mock_drive_files(expiry_date)",
+    ),
+    (
+        "idx_mock_properties_status_updated",
+        "CREATE INDEX IF NOT EXISTS idx_mock_properties_status_updated "
+        "ON mock_properties(status, updated_at DESC)",
+    ),
+]
+
+_DROP_MOCK_INDEX_SQL = tuple(f"DROP INDEX IF EXISTS {name}" for name, _ in _MOCK_INDEX_DDL)
+
+# Indexes superseded by the ones above, dropped from existing databases
+_RETIRED_INDEXES = ("idx_mock_payments_ledger",)
+
+_SCHEMA_DDL = (
+    "BEGIN;\n"
+    + _TABLES_DDL
+    + "".join(f"DROP INDEX IF EXISTS {name};\n" for name in _RETIRED_INDEXES)
+    + "".join(f"{ddl};\n" for _, ddl in _MOCK_INDEX_DDL)
+    + "COMMIT;\n"
+)
+
+_INSERT_TOOL_EXECUTION_SQL = """
+    INSERT INTO tool_executions (
+        correlation_id, tool_name, user_id, tenant_id,
+        input_data, output_data, execution_time_ms, trace_id,
+        success, error_message
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_AUDIT_EVENT_SQL = """
+    INSERT INTO audit_log (
+        correlation_id, event_type, user_id, tenant_id,
+        tool_name, action, policy_result, details
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_MOCK_EMAILS_BY_PROPERTY_SQL = (
+    "SELECT * FROM mock_emails WHERE property_id = ? ORDER BY internal_date DESC LIMIT ?"
+)
+
+_SELECT_MOCK_EMAILS_SQL = "SELECT * FROM mock_emails ORDER BY internal_date DESC LIMIT ?"
+
+_SELECT_MOCK_DRIVE_FILES_BY_PROPERTY_SQL = (
+    "SELECT * FROM mock_drive_files WHERE property_id = ? ORDER BY modified_time DESC LIMIT ?"
+)
+
+_SELECT_MOCK_DRIVE_FILES_SQL = "SELECT * FROM mock_drive_files ORDER BY modified_time DESC LIMIT ?"
+
+_SELECT_MOCK_PROPERTY_SQL = "SELECT * FROM mock_properties WHERE id = ?"
+
+_SELECT_MOCK_PROPERTIES_BY_STATUS_SQL = (
+    "SELECT * FROM mock_properties WHERE status = ? ORDER BY updated_at DESC LIMIT ?"
+)
+
+_SELECT_MOCK_PROPERTIES_SQL = "SELECT * FROM mock_properties ORDER BY updated_at DESC LIMIT ?"
+
+_SELECT_MOCK_FEEDBACK_SQL = (
+    "SELECT * FROM mock_feedback WHERE property_id = ? ORDER BY feedback_date DESC LIMIT ?"
+)
+
+_SELECT_MOCK_LEDGER_SQL = "SELECT * FROM mock_ledgers WHERE tenancy_id = ?"
+
+_SELECT_MOCK_TENANT_SQL = "SELECT * FROM mock_tenants WHERE tenancy_id = ? AND is_primary = 1"
+
+_SELECT_MOCK_PAYMENTS_SQL = (
+    "SELECT * FROM mock_payments WHERE ledger_id = ? ORDER BY payment_date DESC LIMIT ?"
+)
+
+# ROW_NUMBER() needs SQLite 3.25+; older runtimes query each ledger separately
+_SUPPORTS_WINDOW_FUNCTIONS = sqlite3.sqlite_version_info >= (3, 25, 0)
+
+
+@lru_cache(maxsize=64)
+def _select_mock_payments_multi_sql(ledger_count: int) -> str:
+    """Build a query for the newest payments of ledger_count ledgers, capped per ledger."""
+    placeholders = ", ".join(["?"] * ledger_count)
+    return (
+        "SELECT id, ledger_id, amount, payment_date, payment_type, reference, status, created_at "
+        "FROM (SELECT *, ROW_NUMBER() OVER "
+        "(PARTITION BY ledger_id ORDER BY payment_date DESC) AS row_number "
+        f"FROM mock_payments WHERE ledger_id IN ({placeholders})) "
+        "WHERE row_number <= ? ORDER BY ledger_id, payment_date DESC"
+    )
+
+_SELECT_EXPIRING_DOCUMENTS_SQL = """
+    SELECT * FROM mock_drive_files
+    WHERE expiry_date IS NOT NULL
+    AND expiry_date <= ?
+    ORDER BY expiry_date ASC
+"""
+
+_SELECT_MOCK_ARREARS_LEDGERS_SQL = """
+    SELECT * FROM mock_ledgers
+    WHERE arrears_days >= ?
+    ORDER BY arrears_days DESC
+    LIMIT ?
+"""
+
+
+def _tool_execution_params(
+    correlation_id: str,
+    tool_name: str,
+    user_id: str,
+    tenant_id: str,
+    input_data: Dict[str, Any],
+    output_data: Optional[Dict[str, Any]] = None,
+    execution_time_ms: Optional[float] = None,
+    trace_id: Optional[str] = None,
+    success: bool = True,
+    error_message: Optional[str] = None,
+) -> tuple:
+    """Build the tool_executions row for one execution."""
+    return (
+        correlation_id,
+        tool_name,
+        user_id,
+        tenant_id,
+        _dumps(input_data),
+        _dumps(output_data) if output_data else None,
+        execution_time_ms,
+        trace_id,
+        success,
+        error_message,
+    )
+
+
+def _audit_event_params(
+    correlation_id: str,
+    event_type: str,
+    user_id: Optional[str] = None,
+    tenant_id: Optional[str] = None,
+    tool_name: Optional[str] = None,
+    action: Optional[str] = None,
+    policy_result: Optional[str] = None,
+    details: Optional[Dict[str, Any]] = None,
+) -> tuple:
+    """Build the audit_log row for one event."""
+    return (
+        correlation_id,
+        event_type,
+        user_id,
+        tenant_id,
+        tool_name,
+        action,
+        policy_result,
+        _dumps(details) if details else None,
+    )
+
+
+def _iter_rows(
+    cursor: sqlite3.Cursor, batch_size: int = _FETCH_BATCH_SIZE
+) -> Iterator[tuple]:
+    """Yield a cursor's rows, fetching batch_size at a time."""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from rows
+
+
+def _mock_rows(
+    records: Iterable[Dict[str, Any]],
+    defaults: Dict[str, Any],
+    getter: Callable[[Dict[str, Any]], tuple],
+    json_columns: Tuple[str, ...] = (),
+) -> Iterator[tuple]:
+    """Build insert parameter tuples, filling defaults and JSON-encoding list columns."""
+    for record in records:
+        row = {**defaults, **record}
+        for column in json_columns:
+            row[column] = _dumps(row[column])
+        yield getter(row)
+
+
+def mock_property_rows(records: Iterable[Dict[str, Any]]) -> List[tuple]:
+    """Build mock_properties insert rows in column order, for records that never change."""
+    return list(
+        _mock_rows(
+            records, _MOCK_PROPERTY_DEFAULTS, _MOCK_PROPERTY_GET, _MOCK_PROPERTY_JSON_COLUMNS
+        )
+    )
+
+
+def mock_contact_rows(records: Iterable[Dict[str, Any]]) -> List[tuple]:
+    """Build mock_contacts insert rows in column order, for records that never change."""
+    return list(_mock_rows(records, _MOCK_CONTACT_DEFAULTS, _MOCK_CONTACT_GET))
+
+
+def _chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most size items."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _iter_dicts(
+    cursor: sqlite3.Cursor, json_columns: Tuple[str, ...] = ()
+) -> Iterator[Dict[str, Any]]:
+    """Yield a cursor's rows as dicts, decoding its JSON list columns.
+
+    Each dict is built once from the row tuple, rather than through an
+    intermediate sqlite3.Row.
+    """
+    columns = [description[0] for description in cursor.description]
+    for row in _iter_rows(cursor):
+        data = dict(zip(columns, row))
+        for column in json_columns:
+            value = data[column]
+            data[column] = orjson.loads(value) if value else []
+        yield data
+
+
+def _fetch_dict(
+    cursor: sqlite3.Cursor, json_columns: Tuple[str, ...] = ()
+) -> Optional[Dict[str, Any]]:
+    """Return the cursor's first row as a dict (see _iter_dicts), or None."""
+    return next(_iter_dicts(cursor, json_columns), None)
+
+
+# Databases not yet garbage collected; the ones still open are closed at interpreter exit
+# without the exit hook keeping every instance alive
+_OPEN_DATABASES: "weakref.WeakSet[Database]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_databases() -> None:
+    """Close every live Database at interpreter exit."""
+    for db in list(_OPEN_DATABASES):
+        db.close()
+
+
+class _ThreadConnection:
+    """A thread's pooled connection, held in thread-local storage.
+
+    Thread-local data is released when its thread exits, which runs the finalizer
+    registered in Database.get_connection and closes the connection.
+    """
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+def _close_thread_connection(
+    connections: Dict[int, sqlite3.Connection], lock: threading.Lock, key: int
+) -> None:
+    """Close and forget a pooled connection whose thread has exited."""
+    with lock:
+        conn = connections.pop(key, None)
+    if conn is not None:
+        conn.close()
 
 
 class Database:
@@ -31,6 +783,15 @@ class Database:
     def __init__(self, db_path: Optional[str] = None):
         """Initialize database connection."""
         self.db_path = db_path or settings.database_path
+        # One long-lived connection per thread, plus a lock so writers do not hit SQLITE_BUSY.
+        # Reentrant so a thread holding the shared in-memory connection can write with it.
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+        # An in-memory database exists only inside its connection, so every thread shares one
+        self._shared_conn: Optional[sqlite3.Connection] = None
+        _OPEN_DATABASES.add(self)
         self._ensure_db_dir()
         self._init_schema()
 
@@ -40,263 +801,172 @@ class Database:
 
     def _init_schema(self) -> None:
         """Initialize database schema."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        if self.db_path != _IN_MEMORY_PATH:
+            with self.get_connection() as conn:
+                # WAL is stored in the database file, so it is set once here rather than per
+                # connection; in-memory databases have no file to journal
+                conn.execute("PRAGMA journal_mode=WAL")
+
+        with self._write_lock, self.get_connection() as conn:
+            try:
+                conn.executescript(_SCHEMA_DDL)
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the shared PRAGMAs."""
+        # Autocommit mode: transactions are opened explicitly by _transaction().
+        # check_same_thread is off so close() can run from the atexit thread and so
+        # threads can share an in-memory database's connection under the write lock.
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+            timeout=_BUSY_TIMEOUT_SECONDS,
+        )
+        pragmas = _CONNECTION_PRAGMAS
+        if self.db_path != _IN_MEMORY_PATH:
+            pragmas += _FILE_PRAGMAS
+        for pragma in pragmas:
+            conn.execute(pragma)
+        return conn
 
-            # Tool execution logs
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tool_executions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    correlation_id TEXT NOT NULL,
-                    tool_name TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    tenant_id TEXT NOT NULL,
-                    input_data TEXT,
-                    output_data TEXT,
-                    execution_time_ms REAL,
-                    trace_id TEXT,
-                    success BOOLEAN,
-                    error_message TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # LangGraph workflow executions
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS workflow_executions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    correlation_id TEXT NOT NULL,
-                    workflow_name TEXT NOT NULL,
-                    user_id TEXT NOT NULL,
-                    tenant_id TEXT NOT NULL,
-                    state_snapshot TEXT,
-                    trace_id TEXT,
-                    status TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    completed_at TIMESTAMP
-                )
-            """)
-
-            # Agent manifests
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS agent_manifests (
-                    agent_id TEXT PRIMARY KEY,
-                    version TEXT NOT NULL,
-                    input_schema TEXT NOT NULL,
-                    output_schema TEXT NOT NULL,
-                    permitted_tools TEXT,
-                    permitted_resources TEXT,
-                    rbac_policy_level TEXT NOT NULL,
-                    workflow_version TEXT,
-                    prompt_hash TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Audit log
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS audit_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    correlation_id TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    user_id TEXT,
-                    tenant_id TEXT,
-                    tool_name TEXT,
-                    action TEXT,
-                    policy_result TEXT,
-                    details TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # =========================================================
-            # Mock Data Tables for Integration Testing
-            # =========================================================
-
-            # Gmail mock emails
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS mock_emails (
-                    id TEXT PRIMARY KEY,
-                    thread_id TEXT NOT NULL,
-                    property_id TEXT,
-                    contact_email TEXT,
-                    sender TEXT NOT NULL,
-                    recipient TEXT NOT NULL,
-                    subject TEXT NOT NULL,
-                    snippet TEXT,
-                    body_preview TEXT,
-                    label_ids TEXT,
-                    internal_date INTEGER,
-                    has_attachments BOOLEAN DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Google Drive mock files
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS mock_drive_files (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    mime_type TEXT NOT NULL,
-                    property_id TEXT,
-                    parent_folder_id TEXT,
-                    size_bytes INTEGER,
-                    content_hash TEXT,
-                    expiry_date DATE,
-                    web_view_link TEXT,
-                    owner_email TEXT,
-                    shared BOOLEAN DEFAULT 0,
-                    created_time TIMESTAMP,
-                    modified_time TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # VaultRE mock properties
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS mock_properties (
-                    id TEXT PRIMARY KEY,
-                    address_line1 TEXT NOT NULL,
-                    address_line2 TEXT,
-                    address_suburb TEXT NOT NULL,
-                    address_state TEXT NOT NULL,
-                    address_postcode TEXT NOT NULL,
-                    property_class TEXT NOT NULL,
-                    property_type TEXT,
-                    status TEXT NOT NULL,
-                    bedrooms INTEGER,
-                    bathrooms INTEGER,
-                    car_spaces INTEGER,
-                    land_area REAL,
-                    building_area REAL,
-                    price_display TEXT,
-                    price_value REAL,
-                    description TEXT,
-                    features TEXT,
-                    agent_ids TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # VaultRE mock contacts
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS mock_contacts (
-                    id TEXT PRIMARY KEY,
-                    property_id TEXT,
-                    first_name TEXT NOT NULL,
-                    last_name TEXT NOT NULL,
-                    email TEXT,
-                    phone TEXT,
-                    mobile TEXT,
-                    contact_type TEXT NOT NULL,
-                    company TEXT,
-                    notes TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # VaultRE mock property feedback
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS mock_feedback (
-                    id TEXT PRIMARY KEY,
-                    property_id TEXT NOT NULL,
-                    contact_id TEXT,
-                    contact_name TEXT,
-                    feedback_date TIMESTAMP NOT NULL,
-                    rating INTEGER,
-                    interest_level TEXT,
-                    comments TEXT,
-                    source TEXT DEFAULT 'open_home',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # VaultRE mock open homes
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS mock_open_homes (
-                    id TEXT PRIMARY KEY,
-                    property_id TEXT NOT NULL,
-                    start_time TIMESTAMP NOT NULL,
-                    end_time TIMESTAMP NOT NULL,
-                    agent_id TEXT,
-                    attendee_count INTEGER DEFAULT 0,
-                    notes TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Ailo mock ledgers
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS mock_ledgers (
-                    id TEXT PRIMARY KEY,
-                    tenancy_id TEXT NOT NULL UNIQUE,
-                    property_id TEXT,
-                    tenant_id TEXT,
-                    current_balance REAL DEFAULT 0.0,
-                    rent_amount REAL NOT NULL,
-                    rent_frequency TEXT NOT NULL,
-                    next_due_date DATE,
-                    arrears_days INTEGER DEFAULT 0,
-                    arrears_status TEXT DEFAULT 'current',
-                    last_payment_date DATE,
-                    last_payment_amount REAL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Ailo mock tenants
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS mock_tenants (
-                    id TEXT PRIMARY KEY,
-                    tenancy_id TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    email TEXT NOT NULL,
-                    phone TEXT,
-                    lease_start DATE NOT NULL,
-                    lease_end DATE,
-                    is_primary BOOLEAN DEFAULT 1,
-                    emergency_contact TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Ailo mock payments
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS mock_payments (
-                    id TEXT PRIMARY KEY,
-                    ledger_id TEXT NOT NULL,
-                    amount REAL NOT NULL,
-                    payment_date DATE NOT NULL,
-                    payment_type TEXT DEFAULT 'rent',
-                    reference TEXT,
-                    status TEXT DEFAULT 'completed',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+    @contextmanager
+    def get_connection(self) -> Iterator[sqlite3.Connection]:
+        """Get this thread's pooled connection; it stays open after the block exits.
 
-            # Create indexes for common queries
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_mock_emails_property ON mock_emails(property_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_mock_emails_thread ON mock_emails(thread_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_mock_drive_files_property ON mock_drive_files(property_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_mock_contacts_property ON mock_contacts(property_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_mock_feedback_property ON mock_feedback(property_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_mock_open_homes_property ON mock_open_homes(property_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_mock_ledgers_tenancy ON mock_ledgers(tenancy_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_mock_tenants_tenancy ON mock_tenants(tenancy_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_mock_payments_ledger ON mock_payments(ledger_id)")
+        The connection is closed when its thread exits or when close() is called.
+        An in-memory database has one connection shared by all threads instead,
+        held under the write lock for the whole block and closed by close().
+        """
+        if self.db_path == _IN_MEMORY_PATH:
+            with self._write_lock:
+                yield self._get_shared_connection()
+            return
+
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = self._connect()
+            key = id(conn)
+            with self._connections_lock:
+                self._connections[key] = conn
+            holder = self._local.holder = _ThreadConnection(conn)
+            weakref.finalize(
+                holder, _close_thread_connection, self._connections, self._connections_lock, key
+            )
+        yield holder.conn
 
-            conn.commit()
+    def _get_shared_connection(self) -> sqlite3.Connection:
+        """Return the in-memory database's connection, opening it on first use."""
+        if self._shared_conn is None:
+            conn = self._connect()
+            with self._connections_lock:
+                self._connections[id(conn)] = conn
+            self._shared_conn = conn
+        return self._shared_conn
 
     @contextmanager
-    def get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Get database connection context manager."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+    def _read_cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Get a cursor on this thread's connection for a read query.
+
+        Every public getter returns plain dicts, built from the cursor's rows by
+        _iter_dicts / _fetch_dict.
+        """
+        with self.get_connection() as conn:
+            yield conn.cursor()
+
+    @contextmanager
+    def _transaction(self, begin: str = "BEGIN") -> Iterator[sqlite3.Connection]:
+        """Run a block of writes in one transaction, serialized across threads.
+
+        Nested calls on the same thread join the outer transaction.
+        """
+        conn = getattr(self._local, "transaction_conn", None)
+        if conn is not None:
             yield conn
+            return
+
+        with self._write_lock, self.get_connection() as conn:
+            conn.execute(begin)
+            self._local.transaction_conn = conn
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+            finally:
+                self._local.transaction_conn = None
+
+    @contextmanager
+    def bulk_ingest(self, drop_indexes: bool = False) -> Iterator[sqlite3.Connection]:
+        """Group every write made on this thread inside the block into one transaction.
+
+        The write lock is taken up front (BEGIN IMMEDIATE), the block commits once
+        on exit and rolls back if it raises. With drop_indexes, the mock table
+        indexes are dropped first and rebuilt once before the commit.
+        """
+        with self._transaction("BEGIN IMMEDIATE") as conn:
+            if drop_indexes:
+                self.drop_mock_indexes()
+            yield conn
+            if drop_indexes:
+                self.rebuild_mock_indexes()
+
+    def drop_mock_indexes(self) -> None:
+        """Drop the secondary indexes on the mock tables."""
+        with self._transaction() as conn:
+            for sql in _DROP_MOCK_INDEX_SQL:
+                conn.execute(sql)
+
+    def rebuild_mock_indexes(self) -> None:
+        """Recreate any missing secondary indexes on the mock tables."""
+        with self._transaction() as conn:
+            for _, ddl in _MOCK_INDEX_DDL:
+                conn.execute(ddl)
+
+    def persist(self, path: str) -> None:
+        """Copy this database to a file with SQLite's online backup API.
+
+        Lets an in-memory database, seeded without disk writes, be saved once at the end.
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        target = sqlite3.connect(path)
+        try:
+            with self.get_connection() as conn:
+                conn.backup(target)
         finally:
+            target.close()
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._connections_lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for conn in connections:
             conn.close()
+        self._local = threading.local()
+        self._shared_conn = None
+
+    def _bulk_insert(
+        self,
+        table: str,
+        columns: Tuple[str, ...],
+        rows: Iterable[tuple],
+        computed: Tuple[Tuple[str, str], ...] = (),
+    ) -> None:
+        """Upsert rows with multi-row VALUES statements in a single transaction."""
+        chunk_size = min(_BULK_INSERT_ROWS, _MAX_VARIABLES // len(columns))
+        with self._transaction() as conn:
+            for chunk in _chunked(rows, chunk_size):
+                conn.execute(
+                    _upsert_sql(table, columns, computed=computed, rows=len(chunk)),
+                    list(chain.from_iterable(chunk)),
+                )
 
     def log_tool_execution(
         self,
@@ -312,30 +982,23 @@ class Database:
         error_message: Optional[str] = None,
     ) -> None:
         """Log tool execution to database."""
-        with self.get_connection() as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                INSERT INTO tool_executions (
-                    correlation_id, tool_name, user_id, tenant_id,
-                    input_data, output_data, execution_time_ms, trace_id,
-                    success, error_message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
+                _INSERT_TOOL_EXECUTION_SQL,
+                _tool_execution_params(
                     correlation_id,
                     tool_name,
                     user_id,
                     tenant_id,
-                    json.dumps(input_data, cls=DateTimeEncoder),
-                    json.dumps(output_data, cls=DateTimeEncoder) if output_data else None,
+                    input_data,
+                    output_data,
                     execution_time_ms,
                     trace_id,
                     success,
                     error_message,
                 ),
             )
-            conn.commit()
 
     def log_audit_event(
         self,
@@ -349,16 +1012,11 @@ class Database:
         details: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Log audit event."""
-        with self.get_connection() as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                INSERT INTO audit_log (
-                    correlation_id, event_type, user_id, tenant_id,
-                    tool_name, action, policy_result, details
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
+                _INSERT_AUDIT_EVENT_SQL,
+                _audit_event_params(
                     correlation_id,
                     event_type,
                     user_id,
@@ -366,227 +1024,221 @@ class Database:
                     tool_name,
                     action,
                     policy_result,
-                    json.dumps(details, cls=DateTimeEncoder) if details else None,
+                    details,
+                ),
+            )
+
+    def log_batch(
+        self,
+        tool_executions: List[Dict[str, Any]],
+        audit_events: List[Dict[str, Any]],
+    ) -> None:
+        """Log tool executions and audit events in a single transaction.
+
+        Each entry holds the keyword arguments of log_tool_execution or
+        log_audit_event respectively.
+        """
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            if tool_executions:
+                cursor.executemany(
+                    _INSERT_TOOL_EXECUTION_SQL,
+                    [_tool_execution_params(**entry) for entry in tool_executions],
+                )
+            if audit_events:
+                cursor.executemany(
+                    _INSERT_AUDIT_EVENT_SQL,
+                    [_audit_event_params(**entry) for entry in audit_events],
+                )
+
+    def save_agent_manifest(
+        self,
+        agent_id: str,
+        version: str,
+        input_schema: Dict[str, Any],
+        output_schema: Dict[str, Any],
+        permitted_tools: List[str],
+        permitted_resources: List[str],
+        rbac_policy_level: str,
+        workflow_version: Optional[str] = None,
+        prompt_hash: Optional[str] = None,
+    ) -> None:
+        """Insert or update an agent manifest."""
+        with self._transaction() as conn:
+            conn.execute(
+                _UPSERT_AGENT_MANIFEST_SQL,
+                (
+                    agent_id,
+                    version,
+                    _dumps(input_schema),
+                    _dumps(output_schema),
+                    _dumps(permitted_tools),
+                    _dumps(permitted_resources),
+                    rbac_policy_level,
+                    workflow_version,
+                    prompt_hash,
                 ),
             )
-            conn.commit()
 
     # =========================================================================
     # Mock Data Management Methods
     # =========================================================================
 
+    def insert_mock_emails_bulk(self, records: List[Dict[str, Any]]) -> None:
+        """Insert mock email records in a single transaction."""
+        self._bulk_insert(
+            "mock_emails",
+            _MOCK_EMAIL_COLUMNS,
+            _mock_rows(records, _MOCK_EMAIL_DEFAULTS, _MOCK_EMAIL_GET, _MOCK_EMAIL_JSON_COLUMNS),
+        )
+
     def insert_mock_email(self, email_data: Dict[str, Any]) -> None:
         """Insert a mock email record."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO mock_emails (
-                    id, thread_id, property_id, contact_email, sender, recipient,
-                    subject, snippet, body_preview, label_ids, internal_date,
-                    has_attachments
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    email_data["id"],
-                    email_data["thread_id"],
-                    email_data.get("property_id"),
-                    email_data.get("contact_email"),
-                    email_data["sender"],
-                    email_data["recipient"],
-                    email_data["subject"],
-                    email_data.get("snippet"),
-                    email_data.get("body_preview"),
-                    json.dumps(email_data.get("label_ids", [])),
-                    email_data.get("internal_date"),
-                    email_data.get("has_attachments", False),
-                ),
-            )
-            conn.commit()
+        self.insert_mock_emails_bulk([email_data])
 
-    def get_mock_emails(
+    def iter_mock_emails(
         self, property_id: Optional[str] = None, limit: int = 50
-    ) -> List[Dict[str, Any]]:
-        """Get mock emails, optionally filtered by property."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over mock emails, optionally filtered by property."""
+        with self._read_cursor() as cursor:
             if property_id:
                 cursor.execute(
-                    "SELECT * FROM mock_emails WHERE property_id = ? ORDER BY internal_date DESC LIMIT ?",
+                    _SELECT_MOCK_EMAILS_BY_PROPERTY_SQL,
                     (property_id, limit),
                 )
             else:
                 cursor.execute(
-                    "SELECT * FROM mock_emails ORDER BY internal_date DESC LIMIT ?",
+                    _SELECT_MOCK_EMAILS_SQL,
                     (limit,),
                 )
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            yield from _iter_dicts(cursor, _MOCK_EMAIL_JSON_COLUMNS)
+
+    def get_mock_emails(
+        self, property_id: Optional[str] = None, limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Get mock emails, optionally filtered by property."""
+        return list(self.iter_mock_emails(property_id, limit))
+
+    def insert_mock_drive_files_bulk(self, records: List[Dict[str, Any]]) -> None:
+        """Insert mock Drive file records in a single transaction."""
+        self._bulk_insert(
+            "mock_drive_files",
+            _MOCK_DRIVE_FILE_COLUMNS,
+            _mock_rows(records, _MOCK_DRIVE_FILE_DEFAULTS, _MOCK_DRIVE_FILE_GET),
+        )
 
     def insert_mock_drive_file(self, file_data: Dict[str, Any]) -> None:
         """Insert a mock Drive file record."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO mock_drive_files (
-                    id, name, mime_type, property_id, parent_folder_id,
-                    size_bytes, content_hash, expiry_date, web_view_link,
-                    owner_email, shared, created_time, modified_time
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    file_data["id"],
-                    file_data["name"],
-                    file_data["mime_type"],
-                    file_data.get("property_id"),
-                    file_data.get("parent_folder_id"),
-                    file_data.get("size_bytes"),
-                    file_data.get("content_hash"),
-                    file_data.get("expiry_date"),
-                    file_data.get("web_view_link"),
-                    file_data.get("owner_email"),
-                    file_data.get("shared", False),
-                    file_data.get("created_time"),
-                    file_data.get("modified_time"),
-                ),
-            )
-            conn.commit()
+        self.insert_mock_drive_files_bulk([file_data])
 
-    def get_mock_drive_files(
+    def iter_mock_drive_files(
         self, property_id: Optional[str] = None, limit: int = 50
-    ) -> List[Dict[str, Any]]:
-        """Get mock Drive files, optionally filtered by property."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over mock Drive files, optionally filtered by property."""
+        with self._read_cursor() as cursor:
             if property_id:
                 cursor.execute(
-                    "SELECT * FROM mock_drive_files WHERE property_id = ? ORDER BY modified_time DESC LIMIT ?",
+                    _SELECT_MOCK_DRIVE_FILES_BY_PROPERTY_SQL,
                     (property_id, limit),
                 )
             else:
                 cursor.execute(
-                    "SELECT * FROM mock_drive_files ORDER BY modified_time DESC LIMIT ?",
+                    _SELECT_MOCK_DRIVE_FILES_SQL,
                     (limit,),
                 )
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            yield from _iter_dicts(cursor)
+
+    def get_mock_drive_files(
+        self, property_id: Optional[str] = None, limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Get mock Drive files, optionally filtered by property."""
+        return list(self.iter_mock_drive_files(property_id, limit))
+
+    def iter_expiring_documents(
+        self, days_ahead: int = 30
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over documents expiring within specified days."""
+        # Cutoff computed once in Python (UTC, as SQLite's 'now') and bound as a plain range
+        cutoff = (datetime.now(timezone.utc).date() + timedelta(days=days_ahead)).isoformat()
+        with self._read_cursor() as cursor:
+            cursor.execute(
+                _SELECT_EXPIRING_DOCUMENTS_SQL,
+                (cutoff,),
+            )
+            yield from _iter_dicts(cursor)
 
     def get_expiring_documents(
         self, days_ahead: int = 30
     ) -> List[Dict[str, Any]]:
         """Get documents expiring within specified days."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT * FROM mock_drive_files 
-                WHERE expiry_date IS NOT NULL 
-                AND expiry_date <= date('now', '+' || ? || ' days')
-                ORDER BY expiry_date ASC
-            """,
-                (days_ahead,),
+        return list(self.iter_expiring_documents(days_ahead))
+
+    def insert_mock_properties_bulk(self, records: List[Dict[str, Any]]) -> None:
+        """Insert mock VaultRE property records in a single transaction."""
+        self.insert_mock_property_rows(
+            _mock_rows(
+                records, _MOCK_PROPERTY_DEFAULTS, _MOCK_PROPERTY_GET, _MOCK_PROPERTY_JSON_COLUMNS
             )
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+        )
+
+    def insert_mock_property_rows(self, rows: Iterable[tuple]) -> None:
+        """Insert rows built by mock_property_rows in a single transaction."""
+        self._bulk_insert(
+            "mock_properties", _MOCK_PROPERTY_COLUMNS, rows, computed=_MOCK_PROPERTY_COMPUTED
+        )
 
     def insert_mock_property(self, property_data: Dict[str, Any]) -> None:
         """Insert a mock VaultRE property record."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO mock_properties (
-                    id, address_line1, address_line2, address_suburb,
-                    address_state, address_postcode, property_class, property_type,
-                    status, bedrooms, bathrooms, car_spaces, land_area,
-                    building_area, price_display, price_value, description,
-                    features, agent_ids, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """,
-                (
-                    property_data["id"],
-                    property_data["address_line1"],
-                    property_data.get("address_line2"),
-                    property_data["address_suburb"],
-                    property_data["address_state"],
-                    property_data["address_postcode"],
-                    property_data["property_class"],
-                    property_data.get("property_type"),
-                    property_data["status"],
-                    property_data.get("bedrooms"),
-                    property_data.get("bathrooms"),
-                    property_data.get("car_spaces"),
-                    property_data.get("land_area"),
-                    property_data.get("building_area"),
-                    property_data.get("price_display"),
-                    property_data.get("price_value"),
-                    property_data.get("description"),
-                    json.dumps(property_data.get("features", [])),
-                    json.dumps(property_data.get("agent_ids", [])),
-                ),
-            )
-            conn.commit()
+        self.insert_mock_properties_bulk([property_data])
 
     def get_mock_property(self, property_id: str) -> Optional[Dict[str, Any]]:
         """Get a single mock property by ID."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM mock_properties WHERE id = ?", (property_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        with self._read_cursor() as cursor:
+            cursor.execute(_SELECT_MOCK_PROPERTY_SQL, (property_id,))
+            return _fetch_dict(cursor, _MOCK_PROPERTY_JSON_COLUMNS)
 
-    def get_mock_properties(
+    def iter_mock_properties(
         self, status: Optional[str] = None, limit: int = 50
-    ) -> List[Dict[str, Any]]:
-        """Get mock properties, optionally filtered by status."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over mock properties, optionally filtered by status."""
+        with self._read_cursor() as cursor:
             if status:
                 cursor.execute(
-                    "SELECT * FROM mock_properties WHERE status = ? ORDER BY updated_at DESC LIMIT ?",
+                    _SELECT_MOCK_PROPERTIES_BY_STATUS_SQL,
                     (status, limit),
                 )
             else:
                 cursor.execute(
-                    "SELECT * FROM mock_properties ORDER BY updated_at DESC LIMIT ?",
+                    _SELECT_MOCK_PROPERTIES_SQL,
                     (limit,),
                 )
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            yield from _iter_dicts(cursor, _MOCK_PROPERTY_JSON_COLUMNS)
+
+    def get_mock_properties(
+        self, status: Optional[str] = None, limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Get mock properties, optionally filtered by status."""
+        return list(self.iter_mock_properties(status, limit))
+
+    def insert_mock_contacts_bulk(self, records: List[Dict[str, Any]]) -> None:
+        """Insert mock VaultRE contact records in a single transaction."""
+        self.insert_mock_contact_rows(
+            _mock_rows(records, _MOCK_CONTACT_DEFAULTS, _MOCK_CONTACT_GET)
+        )
+
+    def insert_mock_contact_rows(self, rows: Iterable[tuple]) -> None:
+        """Insert rows built by mock_contact_rows in a single transaction."""
+        self._bulk_insert("mock_contacts", _MOCK_CONTACT_COLUMNS, rows)
 
     def insert_mock_contact(self, contact_data: Dict[str, Any]) -> None:
         """Insert a mock VaultRE contact record."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO mock_contacts (
-                    id, property_id, first_name, last_name, email, phone,
-                    mobile, contact_type, company, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    contact_data["id"],
-                    contact_data.get("property_id"),
-                    contact_data["first_name"],
-                    contact_data["last_name"],
-                    contact_data.get("email"),
-                    contact_data.get("phone"),
-                    contact_data.get("mobile"),
-                    contact_data["contact_type"],
-                    contact_data.get("company"),
-                    contact_data.get("notes"),
-                ),
-            )
-            conn.commit()
+        self.insert_mock_contacts_bulk([contact_data])
 
-    def get_mock_contacts(
+    def iter_mock_contacts(
         self, property_id: Optional[str] = None, contact_type: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """Get mock contacts, optionally filtered."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over mock contacts, optionally filtered."""
+        with self._read_cursor() as cursor:
             conditions = []
             params = []
 
@@ -603,76 +1255,60 @@ class Database:
             query += " ORDER BY created_at DESC"
 
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            yield from _iter_dicts(cursor)
+
+    def get_mock_contacts(
+        self, property_id: Optional[str] = None, contact_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get mock contacts, optionally filtered."""
+        return list(self.iter_mock_contacts(property_id, contact_type))
+
+    def insert_mock_feedback_bulk(self, records: List[Dict[str, Any]]) -> None:
+        """Insert mock property feedback records in a single transaction."""
+        self._bulk_insert(
+            "mock_feedback",
+            _MOCK_FEEDBACK_COLUMNS,
+            _mock_rows(records, _MOCK_FEEDBACK_DEFAULTS, _MOCK_FEEDBACK_GET),
+        )
 
     def insert_mock_feedback(self, feedback_data: Dict[str, Any]) -> None:
         """Insert a mock property feedback record."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        self.insert_mock_feedback_bulk([feedback_data])
+
+    def iter_mock_feedback(
+        self, property_id: str, limit: int = 50
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over mock feedback for a property."""
+        with self._read_cursor() as cursor:
             cursor.execute(
-                """
-                INSERT OR REPLACE INTO mock_feedback (
-                    id, property_id, contact_id, contact_name, feedback_date,
-                    rating, interest_level, comments, source
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    feedback_data["id"],
-                    feedback_data["property_id"],
-                    feedback_data.get("contact_id"),
-                    feedback_data.get("contact_name"),
-                    feedback_data["feedback_date"],
-                    feedback_data.get("rating"),
-                    feedback_data.get("interest_level"),
-                    feedback_data.get("comments"),
-                    feedback_data.get("source", "open_home"),
-                ),
+                _SELECT_MOCK_FEEDBACK_SQL,
+                (property_id, limit),
             )
-            conn.commit()
+            yield from _iter_dicts(cursor)
 
     def get_mock_feedback(
         self, property_id: str, limit: int = 50
     ) -> List[Dict[str, Any]]:
         """Get mock feedback for a property."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM mock_feedback WHERE property_id = ? ORDER BY feedback_date DESC LIMIT ?",
-                (property_id, limit),
-            )
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+        return list(self.iter_mock_feedback(property_id, limit))
+
+    def insert_mock_open_homes_bulk(self, records: List[Dict[str, Any]]) -> None:
+        """Insert mock open home records in a single transaction."""
+        self._bulk_insert(
+            "mock_open_homes",
+            _MOCK_OPEN_HOME_COLUMNS,
+            _mock_rows(records, _MOCK_OPEN_HOME_DEFAULTS, _MOCK_OPEN_HOME_GET),
+        )
 
     def insert_mock_open_home(self, open_home_data: Dict[str, Any]) -> None:
         """Insert a mock open home record."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO mock_open_homes (
-                    id, property_id, start_time, end_time, agent_id,
-                    attendee_count, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    open_home_data["id"],
-                    open_home_data["property_id"],
-                    open_home_data["start_time"],
-                    open_home_data["end_time"],
-                    open_home_data.get("agent_id"),
-                    open_home_data.get("attendee_count", 0),
-                    open_home_data.get("notes"),
-                ),
-            )
-            conn.commit()
+        self.insert_mock_open_homes_bulk([open_home_data])
 
-    def get_mock_open_homes(
+    def iter_mock_open_homes(
         self, property_id: Optional[str] = None, upcoming_only: bool = False
-    ) -> List[Dict[str, Any]]:
-        """Get mock open homes."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over mock open homes."""
+        with self._read_cursor() as cursor:
             conditions = []
             params = []
 
@@ -680,7 +1316,9 @@ class Database:
                 conditions.append("property_id = ?")
                 params.append(property_id)
             if upcoming_only:
-                conditions.append("start_time > datetime('now')")
+                # ISO format to match the stored start_time values
+                conditions.append("start_time > ?")
+                params.append(datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S"))
 
             query = "SELECT * FROM mock_open_homes"
             if conditions:
@@ -688,193 +1326,179 @@ class Database:
             query += " ORDER BY start_time ASC"
 
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            yield from _iter_dicts(cursor)
+
+    def get_mock_open_homes(
+        self, property_id: Optional[str] = None, upcoming_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get mock open homes."""
+        return list(self.iter_mock_open_homes(property_id, upcoming_only))
+
+    def insert_mock_ledgers_bulk(self, records: List[Dict[str, Any]]) -> None:
+        """Insert mock Ailo ledger records in a single transaction."""
+        self._bulk_insert(
+            "mock_ledgers",
+            _MOCK_LEDGER_COLUMNS,
+            _mock_rows(records, _MOCK_LEDGER_DEFAULTS, _MOCK_LEDGER_GET),
+        )
 
     def insert_mock_ledger(self, ledger_data: Dict[str, Any]) -> None:
         """Insert a mock Ailo ledger record."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO mock_ledgers (
-                    id, tenancy_id, property_id, tenant_id, current_balance,
-                    rent_amount, rent_frequency, next_due_date, arrears_days,
-                    arrears_status, last_payment_date, last_payment_amount
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    ledger_data["id"],
-                    ledger_data["tenancy_id"],
-                    ledger_data.get("property_id"),
-                    ledger_data.get("tenant_id"),
-                    ledger_data.get("current_balance", 0.0),
-                    ledger_data["rent_amount"],
-                    ledger_data["rent_frequency"],
-                    ledger_data.get("next_due_date"),
-                    ledger_data.get("arrears_days", 0),
-                    ledger_data.get("arrears_status", "current"),
-                    ledger_data.get("last_payment_date"),
-                    ledger_data.get("last_payment_amount"),
-                ),
-            )
-            conn.commit()
+        self.insert_mock_ledgers_bulk([ledger_data])
 
     def get_mock_ledger(self, tenancy_id: str) -> Optional[Dict[str, Any]]:
         """Get a single mock ledger by tenancy ID."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM mock_ledgers WHERE tenancy_id = ?", (tenancy_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        with self._read_cursor() as cursor:
+            cursor.execute(_SELECT_MOCK_LEDGER_SQL, (tenancy_id,))
+            return _fetch_dict(cursor)
 
-    def get_mock_arrears_ledgers(
+    def iter_mock_arrears_ledgers(
         self, min_days: int = 1, limit: int = 50
-    ) -> List[Dict[str, Any]]:
-        """Get ledgers in arrears."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over ledgers in arrears."""
+        with self._read_cursor() as cursor:
             cursor.execute(
-                """
-                SELECT * FROM mock_ledgers 
-                WHERE arrears_days >= ? 
-                ORDER BY arrears_days DESC 
-                LIMIT ?
-            """,
+                _SELECT_MOCK_ARREARS_LEDGERS_SQL,
                 (min_days, limit),
             )
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            yield from _iter_dicts(cursor)
+
+    def get_mock_arrears_ledgers(
+        self, min_days: int = 1, limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Get ledgers in arrears."""
+        return list(self.iter_mock_arrears_ledgers(min_days, limit))
+
+    def insert_mock_tenants_bulk(self, records: List[Dict[str, Any]]) -> None:
+        """Insert mock Ailo tenant records in a single transaction."""
+        self._bulk_insert(
+            "mock_tenants",
+            _MOCK_TENANT_COLUMNS,
+            _mock_rows(records, _MOCK_TENANT_DEFAULTS, _MOCK_TENANT_GET),
+        )
 
     def insert_mock_tenant(self, tenant_data: Dict[str, Any]) -> None:
         """Insert a mock Ailo tenant record."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO mock_tenants (
-                    id, tenancy_id, name, email, phone, lease_start,
-                    lease_end, is_primary, emergency_contact
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    tenant_data["id"],
-                    tenant_data["tenancy_id"],
-                    tenant_data["name"],
-                    tenant_data["email"],
-                    tenant_data.get("phone"),
-                    tenant_data["lease_start"],
-                    tenant_data.get("lease_end"),
-                    tenant_data.get("is_primary", True),
-                    tenant_data.get("emergency_contact"),
-                ),
-            )
-            conn.commit()
+        self.insert_mock_tenants_bulk([tenant_data])
 
     def get_mock_tenant(self, tenancy_id: str) -> Optional[Dict[str, Any]]:
         """Get tenant by tenancy ID."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        with self._read_cursor() as cursor:
             cursor.execute(
-                "SELECT * FROM mock_tenants WHERE tenancy_id = ? AND is_primary = 1",
+                _SELECT_MOCK_TENANT_SQL,
                 (tenancy_id,),
             )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            return _fetch_dict(cursor)
+
+    def insert_mock_payments_bulk(self, records: List[Dict[str, Any]]) -> None:
+        """Insert mock payment records in a single transaction."""
+        self._bulk_insert(
+            "mock_payments",
+            _MOCK_PAYMENT_COLUMNS,
+            _mock_rows(records, _MOCK_PAYMENT_DEFAULTS, _MOCK_PAYMENT_GET),
+        )
 
     def insert_mock_payment(self, payment_data: Dict[str, Any]) -> None:
         """Insert a mock payment record."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        self.insert_mock_payments_bulk([payment_data])
+
+    def iter_mock_payments(
+        self, ledger_id: str, limit: int = 20
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over payments for a ledger."""
+        with self._read_cursor() as cursor:
             cursor.execute(
-                """
-                INSERT OR REPLACE INTO mock_payments (
-                    id, ledger_id, amount, payment_date, payment_type,
-                    reference, status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    payment_data["id"],
-                    payment_data["ledger_id"],
-                    payment_data["amount"],
-                    payment_data["payment_date"],
-                    payment_data.get("payment_type", "rent"),
-                    payment_data.get("reference"),
-                    payment_data.get("status", "completed"),
-                ),
+                _SELECT_MOCK_PAYMENTS_SQL,
+                (ledger_id, limit),
             )
-            conn.commit()
+            yield from _iter_dicts(cursor)
 
     def get_mock_payments(
         self, ledger_id: str, limit: int = 20
     ) -> List[Dict[str, Any]]:
         """Get payments for a ledger."""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM mock_payments WHERE ledger_id = ? ORDER BY payment_date DESC LIMIT ?",
-                (ledger_id, limit),
-            )
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+        return list(self.iter_mock_payments(ledger_id, limit))
+
+    def get_mock_payments_multi(
+        self, ledger_ids: Iterable[str], limit: int = 20
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get payments for several ledgers, newest first, with one query per chunk of IDs."""
+        payments: Dict[str, List[Dict[str, Any]]] = {ledger_id: [] for ledger_id in ledger_ids}
+        if not _SUPPORTS_WINDOW_FUNCTIONS:
+            for ledger_id in payments:
+                payments[ledger_id] = self.get_mock_payments(ledger_id, limit)
+            return payments
+
+        with self._read_cursor() as cursor:
+            # One parameter is kept back for the per-ledger limit
+            for chunk in _chunked(payments, _MAX_VARIABLES - 1):
+                cursor.execute(_select_mock_payments_multi_sql(len(chunk)), (*chunk, limit))
+                for row in _iter_dicts(cursor):
+                    payments[row["ledger_id"]].append(row)
+        return payments
 
     def clear_mock_data(self, table: Optional[str] = None) -> None:
         """Clear mock data from tables. If table is None, clears all mock tables."""
-        mock_tables = [
-            "mock_emails",
-            "mock_drive_files",
-            "mock_properties",
-            "mock_contacts",
-            "mock_feedback",
-            "mock_open_homes",
-            "mock_ledgers",
-            "mock_tenants",
-            "mock_payments",
-        ]
+        if table and table not in _CLEAR_MOCK_TABLE_SQL:
+            return
+        statements = (_CLEAR_MOCK_TABLE_SQL[table],) if table else _CLEAR_MOCK_TABLE_SQL.values()
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            if table:
-                if table in mock_tables:
-                    cursor.execute(f"DELETE FROM {table}")
-            else:
-                for t in mock_tables:
-                    cursor.execute(f"DELETE FROM {t}")
-            conn.commit()
+        with self._transaction() as conn:
+            for sql in statements:
+                conn.execute(sql)
 
-    def seed_mock_data(self, data: Dict[str, List[Dict[str, Any]]]) -> None:
+    def seed_mock_data(
+        self,
+        data: Dict[str, List[Dict[str, Any]]],
+        rows: Optional[Dict[str, Iterable[tuple]]] = None,
+    ) -> None:
         """Seed mock data from a dictionary of table -> records.
         
         Args:
             data: Dict mapping table names to lists of records.
                   Keys: 'emails', 'drive_files', 'properties', 'contacts',
                         'feedback', 'open_homes', 'ledgers', 'tenants', 'payments'
+            rows: Optional pre-built insert rows ('properties', 'contacts'), from
+                  mock_property_rows / mock_contact_rows, used in place of data[key].
         """
-        insert_methods = {
-            "emails": self.insert_mock_email,
-            "drive_files": self.insert_mock_drive_file,
-            "properties": self.insert_mock_property,
-            "contacts": self.insert_mock_contact,
-            "feedback": self.insert_mock_feedback,
-            "open_homes": self.insert_mock_open_home,
-            "ledgers": self.insert_mock_ledger,
-            "tenants": self.insert_mock_tenant,
-            "payments": self.insert_mock_payment,
+        bulk_insert_methods = {
+            "emails": self.insert_mock_emails_bulk,
+            "drive_files": self.insert_mock_drive_files_bulk,
+            "properties": self.insert_mock_properties_bulk,
+            "contacts": self.insert_mock_contacts_bulk,
+            "feedback": self.insert_mock_feedback_bulk,
+            "open_homes": self.insert_mock_open_homes_bulk,
+            "ledgers": self.insert_mock_ledgers_bulk,
+            "tenants": self.insert_mock_tenants_bulk,
+            "payments": self.insert_mock_payments_bulk,
+        }
+        row_insert_methods = {
+            "properties": self.insert_mock_property_rows,
+            "contacts": self.insert_mock_contact_rows,
         }
+        rows = rows or {}
 
-        for table_key, records in data.items():
-            if table_key in insert_methods:
-                for record in records:
-                    insert_methods[table_key](record)
+        with self.bulk_ingest(drop_indexes=True):
+            for table_key, records in data.items():
+                if table_key in rows and table_key in row_insert_methods:
+                    row_insert_methods[table_key](rows[table_key])
+                elif table_key in bulk_insert_methods and records:
+                    bulk_insert_methods[table_key](records)
 
 
 # Global database instance
 _db: Optional[Database] = None
+_db_lock = threading.Lock()
 
 
 def get_db() -> Database:
     """Get global database instance."""
     global _db
-    if _db is None:
-        _db = Database()
-    return _db
+    db = _db
+    if db is None:
+        # Threads racing on the first call must not each open a Database
+        with _db_lock:
+            if _db is None:
+                _db = Database()
+            db = _db
+    return db
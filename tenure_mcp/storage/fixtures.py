@@ -1,15 +1,43 @@
 """Mock data fixtures for integration testing and development."""
 
-import uuid
+import copy
+import secrets
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, List, Optional
 
-from tenure_mcp.storage.database import get_db
+from tenure_mcp.storage.database import (
+    Database,
+    get_db,
+    mock_contact_rows,
+    mock_property_rows,
+)
 
 
 def generate_id(prefix: str = "") -> str:
     """Generate a unique ID with optional prefix."""
-    return f"{prefix}{uuid.uuid4().hex[:12]}"
+    return f"{prefix}{secrets.token_hex(6)}"
+
+
+def _cached_per_day(
+    builder: Callable[[], List[Dict[str, Any]]],
+) -> Callable[[], List[Dict[str, Any]]]:
+    """Build a fixture list once per calendar day; each caller gets its own deep copy.
+
+    Times derived from datetime.now() are those of the day's first call, not of
+    each call, until the date changes.
+    """
+
+    @lru_cache(maxsize=1)
+    def build(day: date) -> List[Dict[str, Any]]:
+        return builder()
+
+    @wraps(builder)
+    def get_fixture() -> List[Dict[str, Any]]:
+        return copy.deepcopy(build(date.today()))
+
+    get_fixture.cache_clear = build.cache_clear
+    return get_fixture
 
 
 # =============================================================================
@@ -139,6 +167,9 @@ MOCK_PROPERTIES: List[Dict[str, Any]] = [
     },
 ]
 
+# Insert rows for MOCK_PROPERTIES, built once since the records never change
+MOCK_PROPERTIES_ROWS = mock_property_rows(MOCK_PROPERTIES)
+
 
 # =============================================================================
 # VaultRE Mock Contacts
@@ -207,21 +238,26 @@ MOCK_CONTACTS: List[Dict[str, Any]] = [
     },
 ]
 
+# Insert rows for MOCK_CONTACTS, built once since the records never change
+MOCK_CONTACTS_ROWS = mock_contact_rows(MOCK_CONTACTS)
+
 
 # =============================================================================
 # VaultRE Mock Feedback
 # =============================================================================
 
+@_cached_per_day
 def get_mock_feedback() -> List[Dict[str, Any]]:
     """Generate mock feedback with relative dates."""
     base_date = datetime.now()
+    three_days_ago = (base_date - timedelta(days=3)).isoformat()
     return [
         {
             "id": "feedback_001",
             "property_id": "prop_001",
             "contact_id": "contact_buyer_001",
             "contact_name": "Michael Brown",
-            "feedback_date": (base_date - timedelta(days=3)).isoformat(),
+            "feedback_date": three_days_ago,
             "rating": 4,
             "interest_level": "High",
             "comments": "Love the layout and location. Need to discuss price with partner.",
@@ -231,7 +267,7 @@ def get_mock_feedback() -> List[Dict[str, Any]]:
             "id": "feedback_002",
             "property_id": "prop_001",
             "contact_name": "Sarah Thompson",
-            "feedback_date": (base_date - timedelta(days=3)).isoformat(),
+            "feedback_date": three_days_ago,
             "rating": 5,
             "interest_level": "Very High",
             "comments": "Perfect for our family. Will be making an offer this week.",
@@ -241,7 +277,7 @@ def get_mock_feedback() -> List[Dict[str, Any]]:
             "id": "feedback_003",
             "property_id": "prop_001",
             "contact_name": "David Lee",
-            "feedback_date": (base_date - timedelta(days=3)).isoformat(),
+            "feedback_date": three_days_ago,
             "rating": 3,
             "interest_level": "Medium",
             "comments": "Nice property but slightly above our budget. Would consider if price drops.",
@@ -264,6 +300,7 @@ def get_mock_feedback() -> List[Dict[str, Any]]:
 # VaultRE Mock Open Homes
 # =============================================================================
 
+@_cached_per_day
 def get_mock_open_homes() -> List[Dict[str, Any]]:
     """Generate mock open homes with relative dates."""
     now = datetime.now()
@@ -310,9 +347,14 @@ def get_mock_open_homes() -> List[Dict[str, Any]]:
 # Gmail Mock Emails
 # =============================================================================
 
+# Gmail internalDate is epoch milliseconds
+_DAY_MS = 86_400_000
+
+
+@_cached_per_day
 def get_mock_emails() -> List[Dict[str, Any]]:
     """Generate mock emails with relative dates."""
-    now = datetime.now()
+    now_ms = int(datetime.now().timestamp() * 1000)
     return [
         {
             "id": "msg_001",
@@ -325,7 +367,7 @@ def get_mock_emails() -> List[Dict[str, Any]]:
             "snippet": "Thanks for the update. Happy with the progress so far. Looking forward to the open home this weekend.",
             "body_preview": "Thanks for the update on 123 Main Street...",
             "label_ids": ["INBOX", "IMPORTANT"],
-            "internal_date": int((now - timedelta(days=1)).timestamp() * 1000),
+            "internal_date": now_ms - 1 * _DAY_MS,
             "has_attachments": False,
         },
         {
@@ -339,7 +381,7 @@ def get_mock_emails() -> List[Dict[str, Any]]:
             "snippet": "Hi Robert, Here's your weekly update on the property. We've had strong interest...",
             "body_preview": "Hi Robert,\n\nHere's your weekly update on the property at 123 Main Street...",
             "label_ids": ["SENT"],
-            "internal_date": int((now - timedelta(days=2)).timestamp() * 1000),
+            "internal_date": now_ms - 2 * _DAY_MS,
             "has_attachments": True,
         },
         {
@@ -353,7 +395,7 @@ def get_mock_emails() -> List[Dict[str, Any]]:
             "snippet": "Hi, I visited the open home last weekend and I'm very interested in the property...",
             "body_preview": "Hi,\n\nI visited the open home last weekend and I'm very interested...",
             "label_ids": ["INBOX"],
-            "internal_date": int((now - timedelta(days=4)).timestamp() * 1000),
+            "internal_date": now_ms - 4 * _DAY_MS,
             "has_attachments": False,
         },
         {
@@ -367,7 +409,7 @@ def get_mock_emails() -> List[Dict[str, Any]]:
             "snippet": "Hi, The air conditioning unit in the living room has stopped working...",
             "body_preview": "Hi,\n\nThe air conditioning unit in the living room has stopped working...",
             "label_ids": ["INBOX"],
-            "internal_date": int((now - timedelta(days=2)).timestamp() * 1000),
+            "internal_date": now_ms - 2 * _DAY_MS,
             "has_attachments": False,
         },
     ]
@@ -377,10 +419,13 @@ def get_mock_emails() -> List[Dict[str, Any]]:
 # Google Drive Mock Files
 # =============================================================================
 
+@_cached_per_day
 def get_mock_drive_files() -> List[Dict[str, Any]]:
     """Generate mock Drive files with relative dates."""
     now = datetime.now()
     today = date.today()
+    # Created and modified times coincide for files never edited since upload
+    days_ago = {days: (now - timedelta(days=days)).isoformat() for days in (45, 60, 180, 350, 700)}
     return [
         {
             "id": "file_001",
@@ -406,8 +451,8 @@ def get_mock_drive_files() -> List[Dict[str, Any]]:
             "web_view_link": "https://drive.google.com/file/d/file_002/view",
             "owner_email": "inspector@example.com",
             "shared": True,
-            "created_time": (now - timedelta(days=60)).isoformat(),
-            "modified_time": (now - timedelta(days=60)).isoformat(),
+            "created_time": days_ago[60],
+            "modified_time": days_ago[60],
             "expiry_date": None,
         },
         {
@@ -420,8 +465,8 @@ def get_mock_drive_files() -> List[Dict[str, Any]]:
             "web_view_link": "https://drive.google.com/file/d/file_003/view",
             "owner_email": "strata@example.com",
             "shared": True,
-            "created_time": (now - timedelta(days=45)).isoformat(),
-            "modified_time": (now - timedelta(days=45)).isoformat(),
+            "created_time": days_ago[45],
+            "modified_time": days_ago[45],
             "expiry_date": None,
         },
         {
@@ -434,8 +479,8 @@ def get_mock_drive_files() -> List[Dict[str, Any]]:
             "web_view_link": "https://drive.google.com/file/d/file_004/view",
             "owner_email": "agent@raywhite.com",
             "shared": False,
-            "created_time": (now - timedelta(days=350)).isoformat(),
-            "modified_time": (now - timedelta(days=350)).isoformat(),
+            "created_time": days_ago[350],
+            "modified_time": days_ago[350],
             "expiry_date": (today + timedelta(days=15)).isoformat(),  # Expiring soon
         },
         {
@@ -448,8 +493,8 @@ def get_mock_drive_files() -> List[Dict[str, Any]]:
             "web_view_link": "https://drive.google.com/file/d/file_005/view",
             "owner_email": "agent@raywhite.com",
             "shared": False,
-            "created_time": (now - timedelta(days=700)).isoformat(),
-            "modified_time": (now - timedelta(days=700)).isoformat(),
+            "created_time": days_ago[700],
+            "modified_time": days_ago[700],
             "expiry_date": (today - timedelta(days=5)).isoformat(),  # Already expired
         },
         {
@@ -462,8 +507,8 @@ def get_mock_drive_files() -> List[Dict[str, Any]]:
             "web_view_link": "https://drive.google.com/file/d/file_006/view",
             "owner_email": "agent@raywhite.com",
             "shared": True,
-            "created_time": (now - timedelta(days=180)).isoformat(),
-            "modified_time": (now - timedelta(days=180)).isoformat(),
+            "created_time": days_ago[180],
+            "modified_time": days_ago[180],
             "expiry_date": (today + timedelta(days=185)).isoformat(),  # Lease end
         },
     ]
@@ -473,6 +518,7 @@ def get_mock_drive_files() -> List[Dict[str, Any]]:
 # Ailo Mock Ledgers
 # =============================================================================
 
+@_cached_per_day
 def get_mock_ledgers() -> List[Dict[str, Any]]:
     """Generate mock ledgers with relative dates."""
     today = date.today()
@@ -544,6 +590,7 @@ def get_mock_ledgers() -> List[Dict[str, Any]]:
 # Ailo Mock Tenants
 # =============================================================================
 
+@_cached_per_day
 def get_mock_tenants() -> List[Dict[str, Any]]:
     """Generate mock tenants with relative dates."""
     today = date.today()
@@ -596,51 +643,54 @@ def get_mock_tenants() -> List[Dict[str, Any]]:
 # Ailo Mock Payments
 # =============================================================================
 
+@_cached_per_day
 def get_mock_payments() -> List[Dict[str, Any]]:
     """Generate mock payment history."""
     today = date.today()
-    payments = []
-
-    # Generate payment history for each ledger
-    ledgers = get_mock_ledgers()
-    for ledger in ledgers:
-        ledger_id = ledger["id"]
-        rent_amount = ledger["rent_amount"]
-        frequency_days = 7 if ledger["rent_frequency"] == "weekly" else 14
-
-        # Generate 8 weeks of payment history
-        for i in range(8):
-            payment_date = today - timedelta(days=frequency_days * (i + 1))
-            payments.append({
-                "id": f"payment_{ledger_id}_{i}",
-                "ledger_id": ledger_id,
-                "amount": rent_amount,
-                "payment_date": payment_date.isoformat(),
-                "payment_type": "rent",
-                "reference": f"RENT-{payment_date.strftime('%Y%m%d')}",
-                "status": "completed",
-            })
-
-    return payments
+
+    # 8 periods of payment history per ledger, newest first
+    return [
+        {
+            "id": f"payment_{ledger_id}_{i}",
+            "ledger_id": ledger_id,
+            "amount": rent_amount,
+            "payment_date": payment_date.isoformat(),
+            "payment_type": "rent",
+            "reference": f"RENT-{payment_date:%Y%m%d}",
+            "status": "completed",
+        }
+        for ledger_id, rent_amount, frequency_days in (
+            (
+                ledger["id"],
+                ledger["rent_amount"],
+                7 if ledger["rent_frequency"] == "weekly" else 14,
+            )
+            for ledger in get_mock_ledgers()
+        )
+        for i, payment_date in enumerate(
+            today - timedelta(days=frequency_days * period) for period in range(1, 9)
+        )
+    ]
 
 
 # =============================================================================
 # Seed Function
 # =============================================================================
 
-def seed_all_mock_data(clear_existing: bool = True) -> Dict[str, int]:
+def seed_all_mock_data(
+    clear_existing: bool = True, db: Optional[Database] = None
+) -> Dict[str, int]:
     """Seed all mock data into the database.
     
     Args:
         clear_existing: If True, clears existing mock data before seeding.
+        db: Database to seed instead of the global one, e.g. Database(":memory:")
+            in tests, saved with db.persist(path) if it needs to outlive the run.
         
     Returns:
         Dict with counts of seeded records per table.
     """
-    db = get_db()
-
-    if clear_existing:
-        db.clear_mock_data()
+    db = db or get_db()
 
     # Prepare all data
     data = {
@@ -655,8 +705,13 @@ def seed_all_mock_data(clear_existing: bool = True) -> Dict[str, int]:
         "payments": get_mock_payments(),
     }
 
-    # Seed data
-    db.seed_mock_data(data)
+    # Clear and seed in one transaction, so readers never see a half-seeded database
+    with db.bulk_ingest():
+        if clear_existing:
+            db.clear_mock_data()
+        db.seed_mock_data(
+            data, rows={"properties": MOCK_PROPERTIES_ROWS, "contacts": MOCK_CONTACTS_ROWS}
+        )
 
     # Return counts
     return {key: len(records) for key, records in data.items()}
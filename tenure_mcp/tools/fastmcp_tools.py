@@ -5,11 +5,14 @@ our existing tool implementations. Tools are registered using FastMCP's
 @mcp.tool() decorator pattern.
 """
 
+import functools
+import inspect
 import time
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, Callable, Dict, Tuple, TypeVar
 
 from opentelemetry import trace
 
+from tenure_mcp.config import settings
 from tenure_mcp.observability import get_tracer
 from tenure_mcp.schemas.base import RequestContext
 
@@ -18,9 +21,14 @@ tracer = get_tracer(__name__)
 
 T = TypeVar("T")
 
+# Input value types OpenTelemetry accepts as span attributes without conversion
+_ATTRIBUTE_TYPES = frozenset({str, int, float, bool})
+
 
 def _trace_tool_execution(tool_name: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
-    """Helper to trace tool execution with OpenTelemetry spans.
+    """Helper to trace synchronous tool execution with OpenTelemetry spans.
+    
+    Async tools are traced with @_traced instead.
     
     Args:
         tool_name: Name of the tool being executed
@@ -31,37 +39,35 @@ def _trace_tool_execution(tool_name: str, func: Callable[..., T], *args: Any, **
     Returns:
         Result from tool function execution
     """
+    if not settings.opentelemetry_enabled:
+        return func(*args, **kwargs)
+
     with tracer.start_as_current_span(f"tool.{tool_name}") as span:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        # Attributes are dropped anyway when the span is sampled out
+        recording = span.is_recording()
         
         try:
             # Set span attributes
-            span.set_attribute("tool.name", tool_name)
-            if args:
+            if recording:
+                span.set_attribute("tool.name", tool_name)
                 # Add first arg as input if it's a string (property_id, tenancy_id, etc.)
-                if isinstance(args[0], str):
+                if args and isinstance(args[0], str):
                     span.set_attribute("tool.input.id", args[0])
             
             # Execute tool
-            if hasattr(func, "__call__"):
-                result = func(*args, **kwargs)
-            else:
-                # Handle async functions
-                import asyncio
-                if asyncio.iscoroutinefunction(func):
-                    result = asyncio.run(func(*args, **kwargs))
-                else:
-                    result = func(*args, **kwargs)
+            result = func(*args, **kwargs)
             
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-            span.set_attribute("tool.duration_ms", duration_ms)
+            if recording:
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                span.set_attribute("tool.duration_ms", duration_ms)
             span.set_status(trace.Status(trace.StatusCode.OK))
             
             return result
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            span.set_attribute("tool.duration_ms", duration_ms)
+            if recording:
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                span.set_attribute("tool.duration_ms", duration_ms)
             span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
             span.record_exception(e)
             raise
@@ -129,141 +135,234 @@ from tenure_mcp.tools.integration_tools import (
 from tenure_mcp.server.fastmcp_server import create_fastmcp_server
 
 
-def _get_default_context() -> RequestContext:
-    """Create a default RequestContext for tool execution.
-    
-    TODO: Extract from FastMCP request context or FastAPI request when integrated.
-    For now, returns a default context for MVP.
-    """
-    return RequestContext(
-        user_id="default_user",
-        tenant_id="default_tenant",
-        auth_context="default_auth",
-        role="agent",
-    )
+# Default RequestContext for tool execution, built once and shared by every call
+# (callers only read it). Tool wrappers reference it directly.
+# TODO: Extract from FastMCP request context or FastAPI request when integrated.
+_DEFAULT_CONTEXT = RequestContext(
+    user_id="default_user",
+    tenant_id="default_tenant",
+    auth_context="default_auth",
+    role="agent",
+)
 
 
-def _trace_tool_async(tool_name: str):
-    """Decorator helper to add OpenTelemetry tracing to async tool functions.
-    
-    Args:
-        tool_name: Name of the tool for span naming
-    """
-    def decorator(func):
-        # Use functools.wraps to preserve function signature
-        import functools
-        
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs):
-            with tracer.start_as_current_span(f"tool.{tool_name}") as span:
+def _traced(func):
+    """Decorator adding an OpenTelemetry span named tool.<function name> to an async tool."""
+    # With tracing disabled the tool is registered unwrapped, so calls skip span setup entirely
+    if not settings.opentelemetry_enabled:
+        return func
+
+    tool_name = func.__name__
+    span_name = f"tool.{tool_name}"
+    # Attribute keys for the tool's parameters, built once
+    input_attributes = {
+        name: f"tool.input.{name}" for name in inspect.signature(func).parameters
+    }
+    # Bound here so each call reads closure cells instead of module globals and attributes.
+    # Tool implementations open no child spans, so the span is not made current (skipping
+    # the context attach/detach); it still takes the caller's current span as its parent.
+    start_span = tracer.start_span
+    ok_status = trace.Status(trace.StatusCode.OK)
+    error_code = trace.StatusCode.ERROR
+    status_type = trace.Status
+    attribute_types = _ATTRIBUTE_TYPES
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        span = start_span(span_name)
+        try:
+            # Sampled-out spans discard attributes, so skip encoding them
+            if span.is_recording():
                 span.set_attribute("tool.name", tool_name)
                 # Add input attributes
-                if args:
-                    if isinstance(args[0], str):
-                        span.set_attribute("tool.input.id", args[0])
-                if kwargs:
-                    for key, value in kwargs.items():
-                        if isinstance(value, (str, int, float, bool)):
-                            span.set_attribute(f"tool.input.{key}", str(value))
-                
-                try:
-                    result = await func(*args, **kwargs)
-                    span.set_status(trace.Status(trace.StatusCode.OK))
-                    return result
-                except Exception as e:
-                    span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
-                    span.record_exception(e)
-                    raise
-        return wrapper
-    return decorator
+                if args and type(args[0]) is str:
+                    span.set_attribute("tool.input.id", args[0])
+                for key, value in kwargs.items():
+                    if type(value) in attribute_types:
+                        span.set_attribute(
+                            input_attributes.get(key) or f"tool.input.{key}", value
+                        )
+
+            result = await func(*args, **kwargs)
+            span.set_status(ok_status)
+            return result
+        except Exception as e:
+            span.set_status(status_type(error_code, str(e)))
+            span.record_exception(e)
+            raise
+        finally:
+            span.end()
+    return wrapper
+
+
+# Distinct argument sets cached per read-only tool; the oldest entry is evicted first
+TOOL_CACHE_MAXSIZE = 256
+
+
+def _ttl_cached(func):
+    """Decorator reusing a read-only async tool's result per arguments for a short TTL.
+
+    The TTL is settings.tool_cache_ttl_seconds; failures are not cached.
+    """
+    cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        ttl = settings.tool_cache_ttl_seconds
+        if ttl <= 0:
+            return await func(*args, **kwargs)
+
+        key = (args, tuple(sorted(kwargs.items())))
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        result = await func(*args, **kwargs)
+        cache.pop(key, None)
+        if len(cache) >= TOOL_CACHE_MAXSIZE:
+            del cache[next(iter(cache))]
+        cache[key] = (time.monotonic(), result)
+        return result
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+# Client-visible tool descriptions, passed to @mcp.tool() explicitly so they are still
+# published when the server runs with python -OO (which strips docstrings)
+_TOOL_DESCRIPTIONS: Dict[str, str] = {
+    "analyze_open_home_feedback": (
+        "Analyze open home feedback for a property.\n\n"
+        "Returns sentiment categories and comment breakdown."
+    ),
+    "calculate_breach_status": (
+        "Calculate breach status for a tenancy.\n\n"
+        "Returns legality and breach risk based on rent status and lease terms."
+    ),
+    "ocr_document": (
+        "Extract text from a document using OCR.\n\n"
+        "Supports PDF, image, and other document formats."
+    ),
+    "extract_expiry_date": (
+        "Extract expiry dates from text content.\n\n"
+        "Parses common date formats and returns structured expiry information."
+    ),
+    "generate_vendor_report": (
+        "Generate a comprehensive vendor report for a property.\n\n"
+        "Combines property details, feedback analysis, and market trends."
+    ),
+    "prepare_breach_notice": (
+        "Prepare a breach notice document for a tenancy.\n\n"
+        "Requires HITL (Human-in-the-Loop) approval before execution."
+    ),
+    "web_search": (
+        "Search the web for current information.\n\n"
+        "Use when query needs current/external information not in local data."
+    ),
+    "fetch_property_emails": (
+        "Fetch emails related to a specific property.\n\n"
+        "Retrieves email communications linked to a property within the specified\n"
+        "time window. Useful for vendor reports and communication history."
+    ),
+    "search_communication_threads": (
+        "Search email threads by query and optional contact filter.\n\n"
+        "Searches through email communications to find relevant threads.\n"
+        "Useful for finding specific conversations or contact history."
+    ),
+    "list_property_documents": (
+        "List all documents associated with a property.\n\n"
+        "Retrieves document metadata for files linked to a property in Google Drive.\n"
+        "Includes contracts, inspection reports, certificates, etc."
+    ),
+    "get_document_content": (
+        "Get document metadata and content preview.\n\n"
+        "Retrieves a document's details and a preview/extract of its content.\n"
+        "Useful for compliance checks and document review."
+    ),
+    "check_document_expiry": (
+        "Check expiry dates for all documents associated with a property.\n\n"
+        "Scans property documents and identifies any that are expired or expiring soon.\n"
+        "Useful for compliance monitoring and renewal reminders."
+    ),
+    "list_active_properties": (
+        "List active properties from VaultRE.\n\n"
+        "Retrieves properties matching optional status and class filters.\n"
+        "Useful for property management and reporting."
+    ),
+    "get_property_contacts": (
+        "Get all contacts associated with a property.\n\n"
+        "Retrieves contact information for owners, tenants, vendors, etc.\n"
+        "linked to a specific property in VaultRE."
+    ),
+    "get_upcoming_open_homes": (
+        "Get upcoming open home appointments.\n\n"
+        "Retrieves scheduled open home events, optionally filtered by property.\n"
+        "Useful for scheduling and vendor reports."
+    ),
+    "list_arrears_tenancies": (
+        "List tenancies with rent arrears from Ailo.\n\n"
+        "Retrieves tenancies with overdue rent payments, optionally filtered\n"
+        "by minimum days overdue and status. Useful for arrears management."
+    ),
+    "get_tenant_communication_history": (
+        "Get communication history for a tenancy.\n\n"
+        "Retrieves all communications (emails, calls, notes) related to a tenancy.\n"
+        "Useful for arrears management and tenant relations."
+    ),
+}
 
 
 # Get FastMCP server instance (create if not exists)
 mcp = create_fastmcp_server()
 
 
-@mcp.tool()
-@_trace_tool_async("analyze_open_home_feedback")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["analyze_open_home_feedback"])
+@_traced
 async def analyze_open_home_feedback(property_id: str) -> AnalyzeFeedbackOutput:
-    """Analyze open home feedback for a property.
-    
-    Returns sentiment categories and comment breakdown.
-    """
     input_data = AnalyzeFeedbackInput(property_id=property_id)
-    context = _get_default_context()
-    return await _analyze_open_home_feedback(input_data, context)
+    return await _analyze_open_home_feedback(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("calculate_breach_status")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["calculate_breach_status"])
+@_traced
 async def calculate_breach_status(tenancy_id: str) -> CalculateBreachOutput:
-    """Calculate breach status for a tenancy.
-    
-    Returns legality and breach risk based on rent status and lease terms.
-    """
     input_data = CalculateBreachInput(tenancy_id=tenancy_id)
-    context = _get_default_context()
-    return await _calculate_breach_status(input_data, context)
+    return await _calculate_breach_status(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("ocr_document")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["ocr_document"])
+@_traced
 async def ocr_document(document_url: str) -> OCRDocumentOutput:
-    """Extract text from a document using OCR.
-    
-    Supports PDF, image, and other document formats.
-    """
     input_data = OCRDocumentInput(document_url=document_url)
-    context = _get_default_context()
-    return await _ocr_document(input_data, context)
+    return await _ocr_document(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("extract_expiry_date")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["extract_expiry_date"])
+@_traced
 async def extract_expiry_date(text: str) -> ExtractExpiryOutput:
-    """Extract expiry dates from text content.
-    
-    Parses common date formats and returns structured expiry information.
-    """
     input_data = ExtractExpiryInput(text=text)
-    context = _get_default_context()
-    return await _extract_expiry_date(input_data, context)
+    return await _extract_expiry_date(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("generate_vendor_report")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["generate_vendor_report"])
+@_traced
 async def generate_vendor_report(property_id: str) -> GenerateVendorReportOutput:
-    """Generate a comprehensive vendor report for a property.
-    
-    Combines property details, feedback analysis, and market trends.
-    """
     input_data = GenerateVendorReportInput(property_id=property_id)
-    context = _get_default_context()
-    return await _generate_vendor_report(input_data, context)
+    return await _generate_vendor_report(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("prepare_breach_notice")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["prepare_breach_notice"])
+@_traced
 async def prepare_breach_notice(tenancy_id: str) -> PrepareBreachNoticeOutput:
-    """Prepare a breach notice document for a tenancy.
-    
-    Requires HITL (Human-in-the-Loop) approval before execution.
-    """
     input_data = PrepareBreachNoticeInput(tenancy_id=tenancy_id)
-    context = _get_default_context()
-    return await _prepare_breach_notice(input_data, context)
+    return await _prepare_breach_notice(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("web_search")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["web_search"])
+@_traced
 async def web_search(query: str, max_results: int = 5) -> WebSearchOutput:
-    """Search the web for current information.
-    
-    Use when query needs current/external information not in local data.
-    """
     input_data = WebSearchInput(query=query, max_results=max_results)
-    context = _get_default_context()
-    return await _web_search(input_data, context)
+    return await _web_search(input_data, _DEFAULT_CONTEXT)
 
 
 # =============================================================================
@@ -271,143 +370,89 @@ async def web_search(query: str, max_results: int = 5) -> WebSearchOutput:
 # =============================================================================
 
 
-@mcp.tool()
-@_trace_tool_async("fetch_property_emails")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["fetch_property_emails"])
+@_traced
 async def fetch_property_emails(property_id: str, days_back: int = 30) -> FetchPropertyEmailsOutput:
-    """Fetch emails related to a specific property.
-    
-    Retrieves email communications linked to a property within the specified
-    time window. Useful for vendor reports and communication history.
-    """
     input_data = FetchPropertyEmailsInput(property_id=property_id, days_back=days_back)
-    context = _get_default_context()
-    return await _fetch_property_emails(input_data, context)
+    return await _fetch_property_emails(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("search_communication_threads")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["search_communication_threads"])
+@_traced
 async def search_communication_threads(
-    query: str, max_results: int = 10, contact_email: Optional[str] = None
+    query: str, max_results: int = 10, contact_email: str | None = None
 ) -> SearchCommunicationThreadsOutput:
-    """Search email threads by query and optional contact filter.
-    
-    Searches through email communications to find relevant threads.
-    Useful for finding specific conversations or contact history.
-    """
     input_data = SearchCommunicationThreadsInput(
         query=query, max_results=max_results, contact_email=contact_email
     )
-    context = _get_default_context()
-    return await _search_communication_threads(input_data, context)
+    return await _search_communication_threads(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("list_property_documents")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["list_property_documents"])
+@_traced
+@_ttl_cached
 async def list_property_documents(property_id: str) -> ListPropertyDocumentsOutput:
-    """List all documents associated with a property.
-    
-    Retrieves document metadata for files linked to a property in Google Drive.
-    Includes contracts, inspection reports, certificates, etc.
-    """
     input_data = ListPropertyDocumentsInput(property_id=property_id)
-    context = _get_default_context()
-    return await _list_property_documents(input_data, context)
+    return await _list_property_documents(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("get_document_content")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["get_document_content"])
+@_traced
+@_ttl_cached
 async def get_document_content(document_id: str) -> GetDocumentContentOutput:
-    """Get document metadata and content preview.
-    
-    Retrieves a document's details and a preview/extract of its content.
-    Useful for compliance checks and document review.
-    """
     input_data = GetDocumentContentInput(document_id=document_id)
-    context = _get_default_context()
-    return await _get_document_content(input_data, context)
+    return await _get_document_content(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("check_document_expiry")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["check_document_expiry"])
+@_traced
 async def check_document_expiry(property_id: str) -> CheckDocumentExpiryOutput:
-    """Check expiry dates for all documents associated with a property.
-    
-    Scans property documents and identifies any that are expired or expiring soon.
-    Useful for compliance monitoring and renewal reminders.
-    """
     input_data = CheckDocumentExpiryInput(property_id=property_id)
-    context = _get_default_context()
-    return await _check_document_expiry(input_data, context)
+    return await _check_document_expiry(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("list_active_properties")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["list_active_properties"])
+@_traced
+@_ttl_cached
 async def list_active_properties(
-    status: Optional[str] = None, property_class: Optional[str] = None
+    status: str | None = None, property_class: str | None = None
 ) -> ListActivePropertiesOutput:
-    """List active properties from VaultRE.
-    
-    Retrieves properties matching optional status and class filters.
-    Useful for property management and reporting.
-    """
     input_data = ListActivePropertiesInput(status=status, property_class=property_class)
-    context = _get_default_context()
-    return await _list_active_properties(input_data, context)
+    return await _list_active_properties(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("get_property_contacts")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["get_property_contacts"])
+@_traced
+@_ttl_cached
 async def get_property_contacts(property_id: str) -> GetPropertyContactsOutput:
-    """Get all contacts associated with a property.
-    
-    Retrieves contact information for owners, tenants, vendors, etc.
-    linked to a specific property in VaultRE.
-    """
     input_data = GetPropertyContactsInput(property_id=property_id)
-    context = _get_default_context()
-    return await _get_property_contacts(input_data, context)
+    return await _get_property_contacts(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("get_upcoming_open_homes")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["get_upcoming_open_homes"])
+@_traced
+@_ttl_cached
 async def get_upcoming_open_homes(
-    property_id: Optional[str] = None, days_ahead: int = 30
+    property_id: str | None = None, days_ahead: int = 30
 ) -> GetUpcomingOpenHomesOutput:
-    """Get upcoming open home appointments.
-    
-    Retrieves scheduled open home events, optionally filtered by property.
-    Useful for scheduling and vendor reports.
-    """
     input_data = GetUpcomingOpenHomesInput(property_id=property_id, days_ahead=days_ahead)
-    context = _get_default_context()
-    return await _get_upcoming_open_homes(input_data, context)
+    return await _get_upcoming_open_homes(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("list_arrears_tenancies")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["list_arrears_tenancies"])
+@_traced
+@_ttl_cached
 async def list_arrears_tenancies(
-    min_days_overdue: int = 0, status: Optional[str] = None
+    min_days_overdue: int = 0, status: str | None = None
 ) -> ListArrearsTenanciesOutput:
-    """List tenancies with rent arrears from Ailo.
-    
-    Retrieves tenancies with overdue rent payments, optionally filtered
-    by minimum days overdue and status. Useful for arrears management.
-    """
     input_data = ListArrearsTenanciesInput(min_days_overdue=min_days_overdue, status=status)
-    context = _get_default_context()
-    return await _list_arrears_tenancies(input_data, context)
+    return await _list_arrears_tenancies(input_data, _DEFAULT_CONTEXT)
 
 
-@mcp.tool()
-@_trace_tool_async("get_tenant_communication_history")
+@mcp.tool(description=_TOOL_DESCRIPTIONS["get_tenant_communication_history"])
+@_traced
 async def get_tenant_communication_history(
     tenancy_id: str, days_back: int = 90
 ) -> GetTenantCommunicationHistoryOutput:
-    """Get communication history for a tenancy.
-    
-    Retrieves all communications (emails, calls, notes) related to a tenancy.
-    Useful for arrears management and tenant relations.
-    """
     input_data = GetTenantCommunicationHistoryInput(tenancy_id=tenancy_id, days_back=days_back)
-    context = _get_default_context()
-    return await _get_tenant_communication_history(input_data, context)
+    return await _get_tenant_communication_history(input_data, _DEFAULT_CONTEXT)
@@ -3,17 +3,24 @@
 import asyncio
 import re
 from datetime import datetime, timedelta
-from typing import Dict
+from typing import Dict, List
+
+from pydantic import TypeAdapter
 
 from tenure_mcp.schemas.tools import (
     AnalyzeFeedbackInput,
     AnalyzeFeedbackOutput,
+    BreachLegalStatus,
+    BreachLevel,
+    BreachType,
     CalculateBreachInput,
     CalculateBreachOutput,
     ExtractExpiryInput,
     ExtractExpiryOutput,
+    FeedbackSummary,
     GenerateVendorReportInput,
     GenerateVendorReportOutput,
+    MarketTrends,
     OCRDocumentInput,
     OCRDocumentOutput,
     PrepareBreachNoticeInput,
@@ -53,6 +60,30 @@ def _get_mock_ledger_data():
 
 MOCK_LEDGER_DATA = _get_mock_ledger_data()
 
+# Day/month/year with / or - separators (e.g. 15/01/2026, 15-1-26)
+_DATE = r"(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})"
+
+# (pattern, field_name) pairs scanned by extract_expiry_date, compiled once at import
+DATE_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (
+        re.compile(r"expir(?:y|ation|es)\s*(?:date|on)?\s*:?\s*" + _DATE, re.IGNORECASE),
+        "expiry_date",
+    ),
+    (re.compile(r"valid\s+until\s*:?\s*" + _DATE, re.IGNORECASE), "valid_until"),
+    (re.compile(r"end\s+date\s*:?\s*" + _DATE, re.IGNORECASE), "end_date"),
+)
+
+_WEB_SEARCH_RESULTS: TypeAdapter[List[WebSearchResultItem]] = TypeAdapter(
+    List[WebSearchResultItem]
+)
+
+# Notice wording per breach type (one entry per BreachType value)
+BREACH_TYPE_DESCRIPTIONS: Dict[BreachType, str] = {
+    "rent_arrears": "Rent arrears - failure to pay rent as required by the lease agreement",
+    "lease_violation": "Lease violation - breach of terms and conditions of the lease",
+    "property_damage": "Property damage - damage to the property beyond fair wear and tear",
+}
+
 
 async def analyze_open_home_feedback(
     input_data: AnalyzeFeedbackInput, context: RequestContext
@@ -77,8 +108,9 @@ async def analyze_open_home_feedback(
         comments.append(item.get("comment", ""))
 
     total = len(feedback_list)
+    # Counts are computed locally, so skip re-validation
     categories = [
-        SentimentCategory(
+        SentimentCategory.model_construct(
             category=cat,
             count=count,
             percentage=round((count / total * 100) if total > 0 else 0, 2),
@@ -119,6 +151,8 @@ async def calculate_breach_status(
             days_overdue = days_since_payment - 30
 
     # Determine breach risk
+    level: BreachLevel
+    breach_status: BreachLegalStatus
     if days_overdue == 0:
         level = "low"
         breach_status = "compliant"
@@ -196,20 +230,9 @@ async def extract_expiry_date(
     # Simulate latency
     await asyncio.sleep(0.1)
 
-    # Date patterns
-    date_patterns = [
-        (
-            r"expir(?:y|ation|es)\s*(?:date|on)?\s*:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
-            "expiry_date",
-        ),
-        (r"valid\s+until\s*:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", "valid_until"),
-        (r"end\s+date\s*:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})", "end_date"),
-    ]
-
     extracted_dates = []
-    for pattern, field_name in date_patterns:
-        matches = re.finditer(pattern, input_data.text, re.IGNORECASE)
-        for match in matches:
+    for pattern, field_name in DATE_PATTERNS:
+        for match in pattern.finditer(input_data.text):
             date_str = match.group(1)
             try:
                 # Try to parse date
@@ -259,13 +282,14 @@ async def generate_vendor_report(
     positive_count = sum(1 for f in feedback_list if f.get("sentiment") == "positive")
     total_count = len(feedback_list)
 
-    feedback_summary = {
-        "total_feedback": total_count,
-        "positive_sentiment": positive_count,
-        "positive_percentage": round(
+    # Fields are computed locally, so skip re-validation
+    feedback_summary = FeedbackSummary.model_construct(
+        total_feedback=total_count,
+        positive_sentiment=positive_count,
+        positive_percentage=round(
             (positive_count / total_count * 100) if total_count > 0 else 0, 2
         ),
-    }
+    )
 
     recommendations = []
     if positive_count / total_count < 0.5 if total_count > 0 else False:
@@ -277,7 +301,7 @@ async def generate_vendor_report(
         property_id=input_data.property_id,
         report_date=datetime.now(),
         feedback_summary=feedback_summary,
-        market_trends={"avg_days_on_market": 45, "price_trend": "stable"},
+        market_trends=MarketTrends.model_construct(avg_days_on_market=45, price_trend="stable"),
         recommendations=recommendations,
     )
 
@@ -305,12 +329,6 @@ async def prepare_breach_notice(
     # Generate draft breach notice content
     notice_id = f"notice_{input_data.tenancy_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
 
-    breach_type_descriptions = {
-        "rent_arrears": "Rent arrears - failure to pay rent as required by the lease agreement",
-        "lease_violation": "Lease violation - breach of terms and conditions of the lease",
-        "property_damage": "Property damage - damage to the property beyond fair wear and tear",
-    }
-
     draft_content = f"""
 DRAFT BREACH NOTICE - NOT FOR DISTRIBUTION
 
@@ -321,7 +339,7 @@ Date: {datetime.now().strftime('%Y-%m-%d')}
 BREACH TYPE: {input_data.breach_type.upper().replace('_', ' ')}
 
 DESCRIPTION:
-{breach_type_descriptions.get(input_data.breach_type, 'Breach of lease agreement')}
+{BREACH_TYPE_DESCRIPTIONS[input_data.breach_type]}
 
 BREACH STATUS:
 - Risk Level: {breach_status.breach_risk.level}
@@ -395,12 +413,15 @@ async def web_search(
         return WebSearchOutput(query=input_data.query, results=[])
 
     raw_results = data.get("results", [])
-    results = [
-        WebSearchResultItem(
-            title=r.get("title", ""),
-            url=r.get("url", ""),
-            snippet=r.get("content", "")[:500] if r.get("content") else "",
-        )
-        for r in raw_results[: input_data.max_results]
-    ]
+    # Validate the whole result list in one pydantic-core call
+    results = _WEB_SEARCH_RESULTS.validate_python(
+        [
+            {
+                "title": r.get("title", ""),
+                "url": r.get("url", ""),
+                "snippet": r.get("content", "")[:500] if r.get("content") else "",
+            }
+            for r in raw_results[: input_data.max_results]
+        ]
+    )
     return WebSearchOutput(query=input_data.query, results=results)
@@ -1,7 +1,8 @@
 """Integration tools for Gmail, Google Drive, VaultRE, and Ailo."""
 
+import asyncio
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import Awaitable, Iterable, List, Optional, TypeVar
 
 from tenure_mcp.middleware.clients import (
     get_ailo_client,
@@ -39,6 +40,24 @@ from tenure_mcp.schemas.integrations import (
     ThreadSummary,
 )
 
+T = TypeVar("T")
+
+# Cap on concurrent lookups fanned out to one integration client
+MAX_CONCURRENT_LOOKUPS = 10
+
+
+async def _gather_bounded(
+    awaitables: Iterable[Awaitable[T]], limit: int = MAX_CONCURRENT_LOOKUPS
+) -> List[T]:
+    """Await lookups concurrently, at most limit at a time, returning results in order."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(*(run(awaitable) for awaitable in awaitables))
+
 
 # =============================================================================
 # Gmail Tools
@@ -256,21 +275,31 @@ async def get_upcoming_open_homes(
         days_ahead=input_data.days_ahead,
     )
 
-    # Get property details for addresses
-    summaries = []
-    for oh in open_homes:
-        # In a real implementation, we'd batch fetch property details
-        prop = await client.get_property(oh.property_id)
-        summaries.append(
-            OpenHomeSummary(
-                open_home_id=oh.id,
-                property_id=oh.property_id,
-                property_address=prop.address.full_address if prop else "Unknown",
-                start_time=oh.start_time,
-                end_time=oh.end_time,
-                agent_name=None,  # Would fetch from agent registry
-            )
+    async def fetch_address(property_id: str) -> str:
+        # A failed lookup only costs that open home its address
+        try:
+            prop = await client.get_property(property_id)
+        except Exception:
+            return "Unknown"
+        return prop.address.full_address if prop else "Unknown"
+
+    # Fetch each distinct property's address once, concurrently
+    property_ids = list(dict.fromkeys(oh.property_id for oh in open_homes))
+    addresses = dict(
+        zip(property_ids, await _gather_bounded(fetch_address(pid) for pid in property_ids))
+    )
+
+    summaries = [
+        OpenHomeSummary(
+            open_home_id=oh.id,
+            property_id=oh.property_id,
+            property_address=addresses[oh.property_id],
+            start_time=oh.start_time,
+            end_time=oh.end_time,
+            agent_name=None,  # Would fetch from agent registry
         )
+        for oh in open_homes
+    ]
 
     return GetUpcomingOpenHomesOutput(
         open_homes=summaries,
@@ -300,12 +329,14 @@ async def list_arrears_tenancies(
         max_results=input_data.max_results,
     )
 
+    # Get tenant details for every ledger concurrently
+    tenants = await _gather_bounded(
+        client.get_tenant_details(ledger.tenancy_id) for ledger in ledgers
+    )
+
     # Build arrears reports
     reports = []
-    for ledger in ledgers:
-        # Get tenant details
-        tenant = await client.get_tenant_details(ledger.tenancy_id)
-
+    for ledger, tenant in zip(ledgers, tenants):
         # Get property address (would typically come from a property lookup)
         property_address = f"Property {ledger.property_id}"
 
@@ -353,9 +384,11 @@ async def get_tenant_communication_history(
     ailo_client = get_ailo_client()
     gmail_client = get_gmail_client()
 
-    # Get tenant details
-    tenant = await ailo_client.get_tenant_details(input_data.tenancy_id)
-    ledger = await ailo_client.get_ledger(input_data.tenancy_id)
+    # Get tenant details and ledger concurrently
+    tenant, ledger = await asyncio.gather(
+        ailo_client.get_tenant_details(input_data.tenancy_id),
+        ailo_client.get_ledger(input_data.tenancy_id),
+    )
 
     if not tenant:
         return GetTenantCommunicationHistoryOutput(
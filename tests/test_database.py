@@ -0,0 +1,471 @@
+"""Tests for SQLite storage (tenure_mcp.storage)."""
+
+import asyncio
+import gc
+import json
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from tenure_mcp.server.audit import AUDIT_EVENT, audit_writer_loop, enqueue_record, flush_queue
+from tenure_mcp.storage import database, fixtures
+from tenure_mcp.storage.database import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Create a file-backed database, closed after the test."""
+    db = Database(db_path=str(tmp_path / "test.db"))
+    yield db
+    db.close()
+
+
+def buyer(contact_id, last_name="Lee"):
+    """Build a minimal mock contact record."""
+    return {"id": contact_id, "first_name": "Ann", "last_name": last_name, "contact_type": "buyer"}
+
+
+def payment(payment_id, ledger_id="ledger_1", amount=100.0):
+    """Build a minimal mock payment record."""
+    return {
+        "id": payment_id,
+        "ledger_id": ledger_id,
+        "amount": amount,
+        "payment_date": "2024-01-01",
+    }
+
+
+class TestConnections:
+    """Test connection setup, pooling and lifetime."""
+
+    def test_database_uses_wal_journal(self, db):
+        """Test the database file is switched to WAL and connections use tuned PRAGMAs."""
+        with db.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 30000
+
+    def test_in_memory_database_skips_file_pragmas(self):
+        """Test an in-memory database initializes without WAL or file durability settings."""
+        db = Database(db_path=":memory:")
+        with db.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL (default)
+        db.insert_mock_contact(buyer("c1"))
+        assert len(db.get_mock_contacts()) == 1
+        db.close()
+
+    def test_in_memory_database_shared_across_threads(self):
+        """Test every thread sees the same in-memory database, its schema and its data."""
+        db = Database(db_path=":memory:")
+        db.insert_mock_contact(buyer("c1"))
+
+        def read():
+            with db.get_connection() as conn:
+                busy_timeout = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+            return busy_timeout, [contact["id"] for contact in db.get_mock_contacts()]
+
+        def write(i):
+            db.insert_mock_contact(buyer(f"c{i + 2}"))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert pool.submit(read).result() == (30000, ["c1"])
+            list(pool.map(write, range(10)))
+
+        assert len(db.get_mock_contacts()) == 11
+        db.close()
+
+    def test_connections_are_pooled_per_thread(self, db):
+        """Test each thread reuses one connection and concurrent writers all commit."""
+        with db.get_connection() as first, db.get_connection() as second:
+            assert first is second
+
+        def write(i):
+            db.log_audit_event(correlation_id=f"corr-{i}", event_type="test_event")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(write, range(20)))
+
+        with db.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0] == 20
+
+    def test_thread_connection_closed_when_thread_exits(self, db):
+        """Test a finished thread's pooled connection is closed and no longer tracked."""
+        opened = []
+
+        def read():
+            with db.get_connection() as conn:
+                conn.execute("SELECT 1")
+                opened.append(conn)
+
+        worker = threading.Thread(target=read)
+        worker.start()
+        worker.join()
+
+        assert opened[0] not in db._connections.values()
+        with pytest.raises(Exception):
+            opened[0].execute("SELECT 1")
+
+    def test_unreferenced_database_is_collected(self, tmp_path):
+        """Test the exit-time close hook does not keep Database instances alive."""
+        db = Database(db_path=str(tmp_path / "collected.db"))
+        with db.get_connection() as conn:
+            conn.execute("SELECT 1")
+        ref = weakref.ref(db)
+        del db, conn
+        gc.collect()
+        assert ref() is None
+
+    def test_get_db_creates_one_instance_across_threads(self, tmp_path):
+        """Test concurrent first calls to get_db share a single Database."""
+        with patch.object(database, "_db", None), patch.object(
+            database.settings, "database_path", str(tmp_path / "shared.db")
+        ):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                instances = list(pool.map(lambda _: database.get_db(), range(32)))
+            assert all(db is instances[0] for db in instances)
+            instances[0].close()
+
+
+class TestTransactions:
+    """Test transaction grouping and index maintenance."""
+
+    def test_bulk_ingest_commits_once_or_rolls_back(self, db):
+        """Test writes inside bulk_ingest share one transaction."""
+        with db.bulk_ingest():
+            for i in range(10):
+                db.insert_mock_payment(payment(f"pay_{i}"))
+        assert len(db.get_mock_payments("ledger_1")) == 10
+
+        with pytest.raises(RuntimeError):
+            with db.bulk_ingest():
+                db.insert_mock_payment(payment("pay_x", ledger_id="ledger_2", amount=1.0))
+                raise RuntimeError("abort")
+        assert db.get_mock_payments("ledger_2") == []
+
+    def test_bulk_ingest_rebuilds_dropped_indexes(self, db):
+        """Test mock indexes dropped for a bulk seed are restored on commit."""
+        mock_indexes = {name for name, _ in database._MOCK_INDEX_DDL}
+
+        def index_names():
+            with db.get_connection() as conn:
+                rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+                return {row[0] for row in rows}
+
+        with db.bulk_ingest(drop_indexes=True):
+            assert not index_names() & mock_indexes
+        assert mock_indexes <= index_names()
+
+    def test_clear_mock_data_keeps_outer_transaction(self, db):
+        """Test clearing inside bulk_ingest rolls back with the enclosing transaction."""
+        db.insert_mock_contact(buyer("c1"))
+        with pytest.raises(RuntimeError):
+            with db.bulk_ingest():
+                db.clear_mock_data()
+                raise RuntimeError("abort")
+        assert len(db.get_mock_contacts()) == 1
+
+        db.clear_mock_data("not_a_table")
+        db.clear_mock_data("mock_contacts")
+        assert db.get_mock_contacts() == []
+
+
+class TestEncoding:
+    """Test JSON encoding of column values."""
+
+    def test_datetime_encoder_handles_special_types(self):
+        """Test the JSON encoder serializes datetime, date, Decimal and their subclasses."""
+
+        class LocalDateTime(datetime):
+            pass
+
+        payload = {
+            "at": datetime(2024, 1, 2, 3, 4, 5),
+            "on": date(2024, 1, 2),
+            "amount": Decimal("12.50"),
+            "local": LocalDateTime(2024, 1, 2, 3, 4, 5),
+        }
+        assert json.loads(json.dumps(payload, cls=database.DateTimeEncoder)) == {
+            "at": "2024-01-02T03:04:05",
+            "on": "2024-01-02",
+            "amount": "12.50",
+            "local": "2024-01-02T03:04:05",
+        }
+
+    def test_json_columns_encode_special_types(self):
+        """Test JSON column values round-trip datetime and Decimal inputs."""
+        encoded = database._dumps(
+            {"at": datetime(2024, 1, 2, 3, 4, 5), "amount": Decimal("12.50"), 1: "x"}
+        )
+        assert json.loads(encoded) == {"at": "2024-01-02T03:04:05", "amount": "12.50", "1": "x"}
+
+
+class TestMockData:
+    """Test mock data inserts and queries."""
+
+    def test_mock_bulk_insert_replaces_existing_rows(self, db):
+        """Test bulk mock inserts write every row and re-inserting an id updates it."""
+        contacts = [buyer(f"contact_{i}", last_name=str(i)) for i in range(5)]
+        db.insert_mock_contacts_bulk(contacts)
+        db.insert_mock_contact({**contacts[0], "last_name": "Updated"})
+
+        rows = db.get_mock_contacts()
+        assert len(rows) == 5
+        assert {row["last_name"] for row in rows if row["id"] == "contact_0"} == {"Updated"}
+
+    def test_getters_return_dicts(self, db):
+        """Test every mock getter returns plain dicts, whether or not the table has JSON columns."""
+        fixtures.seed_all_mock_data(db=db)
+
+        results = [
+            *db.get_mock_emails(),
+            *db.get_mock_drive_files(),
+            *db.get_expiring_documents(days_ahead=3650),
+            *db.get_mock_properties(),
+            *db.get_mock_contacts(),
+            *db.get_mock_feedback("prop_001"),
+            *db.get_mock_open_homes(),
+            *db.get_mock_arrears_ledgers(),
+            *db.get_mock_payments("ledger_001"),
+            *db.get_mock_payments_multi(["ledger_001"])["ledger_001"],
+            db.get_mock_property("prop_001"),
+            db.get_mock_ledger("tenancy_001"),
+            db.get_mock_tenant("tenancy_001"),
+        ]
+        assert results
+        assert all(type(row) is dict for row in results)
+        assert db.get_mock_ledger("tenancy_missing") is None
+
+    def test_iter_rows_fetches_in_batches(self, db):
+        """Test row iterators yield every row across fetchmany batches."""
+        db.insert_mock_feedback_bulk(
+            [
+                {
+                    "id": f"fb_{i}",
+                    "property_id": "prop_001",
+                    "feedback_date": f"2024-01-{i + 1:02d}",
+                }
+                for i in range(7)
+            ]
+        )
+        with db.get_connection() as conn:
+            cursor = conn.execute("SELECT id FROM mock_feedback")
+            assert len(list(database._iter_rows(cursor, batch_size=3))) == 7
+
+        ids = [row["id"] for row in db.iter_mock_feedback("prop_001", limit=5)]
+        assert ids == [f"fb_{i}" for i in range(6, 1, -1)]
+
+    def test_mock_json_columns_decoded_on_read(self, db):
+        """Test JSON list columns come back as native lists."""
+        db.insert_mock_property(
+            {
+                "id": "prop_001",
+                "address_line1": "1 Test St",
+                "address_suburb": "Brisbane",
+                "address_state": "QLD",
+                "address_postcode": "4000",
+                "property_class": "residential",
+                "status": "listing",
+                "features": ["Pool"],
+            }
+        )
+        prop = db.get_mock_property("prop_001")
+        assert prop["features"] == ["Pool"]
+        assert prop["agent_ids"] == []
+        assert db.get_mock_properties()[0]["features"] == ["Pool"]
+
+    def test_mock_upsert_updates_row_in_place(self, db):
+        """Test re-inserting an existing id updates the row instead of replacing it."""
+        ledger = {
+            "id": "ledger_1",
+            "tenancy_id": "tenancy_1",
+            "rent_amount": 500.0,
+            "rent_frequency": "weekly",
+        }
+        db.insert_mock_ledger(ledger)
+        with db.get_connection() as conn:
+            conn.execute("UPDATE mock_ledgers SET created_at = '2000-01-01 00:00:00'")
+
+        db.insert_mock_ledger({**ledger, "arrears_days": 7})
+        row = db.get_mock_ledger("tenancy_1")
+        assert row["arrears_days"] == 7
+        assert row["created_at"] == "2000-01-01 00:00:00"
+
+    def test_bulk_insert_spans_multiple_statements(self, db):
+        """Test bulk inserts larger than one multi-VALUES chunk keep every row."""
+        count = database._BULK_INSERT_ROWS * 2 + 5
+        payments = [payment(f"pay_{i}", amount=float(i)) for i in range(count)]
+        db.insert_mock_payments_bulk(payments + [{**payments[0], "amount": -1.0}])
+
+        rows = db.get_mock_payments("ledger_1", limit=count + 10)
+        assert len(rows) == count
+        assert {row["amount"] for row in rows if row["id"] == "pay_0"} == {-1.0}
+
+    def test_report_queries_use_indexes(self, db):
+        """Test the report and history queries search an index instead of scanning or sorting."""
+        queries = {
+            "idx_mock_ledgers_arrears": (database._SELECT_MOCK_ARREARS_LEDGERS_SQL, (1, 50)),
+            "idx_mock_drive_files_expiry": (database._SELECT_EXPIRING_DOCUMENTS_SQL, (30,)),
+            "idx_mock_properties_status_updated": (
+                database._SELECT_MOCK_PROPERTIES_BY_STATUS_SQL,
+                ("listing", 50),
+            ),
+            "idx_mock_payments_ledger_date": (database._SELECT_MOCK_PAYMENTS_SQL, ("ledger_1", 20)),
+        }
+        with db.get_connection() as conn:
+            for index_name, (sql, params) in queries.items():
+                plan = " ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+                assert f"USING INDEX {index_name}" in plan
+                assert "TEMP B-TREE" not in plan
+
+    def test_expiring_documents_and_upcoming_open_homes_bind_cutoffs(self, db):
+        """Test date cutoffs computed in Python select the same rows as before."""
+        today = date.today()
+        for file_id, days in (("soon", 10), ("later", 90)):
+            db.insert_mock_drive_file(
+                {
+                    "id": file_id,
+                    "name": f"{file_id}.pdf",
+                    "mime_type": "application/pdf",
+                    "expiry_date": (today + timedelta(days=days)).isoformat(),
+                }
+            )
+        assert [row["id"] for row in db.get_expiring_documents(days_ahead=30)] == ["soon"]
+
+        now = datetime.now()
+        for open_home_id, days in (("past", -2), ("next", 2)):
+            start = (now + timedelta(days=days)).isoformat()
+            db.insert_mock_open_home(
+                {
+                    "id": open_home_id,
+                    "property_id": "prop_001",
+                    "start_time": start,
+                    "end_time": start,
+                }
+            )
+        assert [row["id"] for row in db.get_mock_open_homes(upcoming_only=True)] == ["next"]
+
+    def test_get_mock_payments_multi_matches_per_ledger_queries(self, db):
+        """Test the batched payment query returns each ledger's newest rows in one call."""
+        db.insert_mock_payments_bulk(fixtures.get_mock_payments())
+        ledger_ids = ["ledger_001", "ledger_003", "ledger_missing"]
+
+        batched = db.get_mock_payments_multi(ledger_ids, limit=3)
+
+        assert list(batched) == ledger_ids
+        assert batched["ledger_missing"] == []
+        for ledger_id in ledger_ids:
+            expected = db.get_mock_payments(ledger_id, limit=3)
+            assert batched[ledger_id] == expected
+
+
+class TestSeeding:
+    """Test fixture seeding and persistence."""
+
+    def test_seed_all_mock_data_reseeds_atomically(self, db):
+        """Test reseeding clears and reloads every fixture table in one pass."""
+        counts = fixtures.seed_all_mock_data(db=db)
+        db.insert_mock_contact(buyer("stale", last_name="Row"))
+        assert fixtures.seed_all_mock_data(db=db) == counts
+
+        with db.get_connection() as conn:
+            contacts = conn.execute("SELECT COUNT(*) FROM mock_contacts").fetchone()[0]
+        assert contacts == counts["contacts"]
+
+    def test_mock_fixtures_are_built_once_per_day(self):
+        """Test fixture builders reuse the day's records but hand out independent copies."""
+        fixtures.get_mock_emails.cache_clear()
+        with patch.object(fixtures, "datetime", wraps=datetime) as clock:
+            first = fixtures.get_mock_emails()
+            second = fixtures.get_mock_emails()
+            built = clock.now.call_count
+
+        assert first == second
+        assert first is not second
+        assert first[0] is not second[0]
+        assert built == 1
+        first[0]["snippet"] = "changed"
+        first[0]["label_ids"].append("SPAM")
+        first.clear()
+        assert fixtures.get_mock_emails() == second
+
+    def test_seed_mock_data_accepts_prebuilt_rows(self, tmp_path):
+        """Test pre-built property and contact rows seed the same data as the records."""
+        data = {"properties": fixtures.MOCK_PROPERTIES, "contacts": fixtures.MOCK_CONTACTS}
+        from_records = Database(db_path=str(tmp_path / "records.db"))
+        from_records.seed_mock_data(data)
+        from_rows = Database(db_path=str(tmp_path / "rows.db"))
+        from_rows.seed_mock_data(
+            data,
+            rows={
+                "properties": fixtures.MOCK_PROPERTIES_ROWS,
+                "contacts": fixtures.MOCK_CONTACTS_ROWS,
+            },
+        )
+
+        def strip_timestamps(rows):
+            return [
+                {k: v for k, v in dict(row).items() if k not in ("created_at", "updated_at")}
+                for row in rows
+            ]
+
+        assert strip_timestamps(from_rows.get_mock_properties()) == strip_timestamps(
+            from_records.get_mock_properties()
+        )
+        assert strip_timestamps(from_rows.get_mock_contacts()) == strip_timestamps(
+            from_records.get_mock_contacts()
+        )
+        assert len(from_rows.get_mock_contacts()) == len(fixtures.MOCK_CONTACTS)
+        from_records.close()
+        from_rows.close()
+
+    def test_seed_in_memory_and_persist(self, tmp_path):
+        """Test seeding an in-memory database and saving it to disk with the backup API."""
+        memory_db = Database(db_path=":memory:")
+        counts = fixtures.seed_all_mock_data(db=memory_db)
+        target = tmp_path / "backup" / "seeded.db"
+        memory_db.persist(str(target))
+        memory_db.close()
+
+        file_db = Database(db_path=str(target))
+        assert len(file_db.get_mock_contacts()) == counts["contacts"]
+        assert len(file_db.get_mock_payments("ledger_001")) == 8
+        file_db.close()
+
+    def test_in_memory_database_serves_threads_and_audit_writer(self, tmp_path):
+        """Test worker-thread reads and queued audit records reach a persisted in-memory DB."""
+        memory_db = Database(db_path=":memory:")
+        counts = fixtures.seed_all_mock_data(db=memory_db)
+
+        async def run():
+            queue = asyncio.Queue()
+            writer = asyncio.create_task(audit_writer_loop(queue, memory_db))
+            contacts = await asyncio.to_thread(memory_db.get_mock_contacts)
+            for i in range(5):
+                enqueue_record(
+                    queue, memory_db, AUDIT_EVENT, correlation_id=f"c-{i}", event_type="read"
+                )
+            await asyncio.sleep(0.2)
+            enqueue_record(queue, memory_db, AUDIT_EVENT, correlation_id="late", event_type="read")
+            writer.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await writer
+            flush_queue(queue, memory_db)
+            return contacts
+
+        contacts = asyncio.run(run())
+        assert len(contacts) == counts["contacts"]
+        target = tmp_path / "seeded.db"
+        memory_db.persist(str(target))
+        memory_db.close()
+
+        file_db = Database(db_path=str(target))
+        assert len(file_db.get_mock_contacts()) == counts["contacts"]
+        with file_db.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0] == 6
+        file_db.close()
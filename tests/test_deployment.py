@@ -51,6 +51,13 @@ class TestHealthEndpoints:
         assert data["checks"]["tools_registered"] is True
         assert data["checks"]["resources_registered"] is True
 
+    def test_readiness_result_is_cached(self, client):
+        """Test repeated /ready probes within the TTL share one database check."""
+        with patch("tenure_mcp.server.app._probe_db", return_value=True) as probe:
+            assert client.get("/ready").json()["status"] == "ready"
+            assert client.get("/ready").json()["status"] == "ready"
+        assert probe.call_count == 1
+
     def test_version_endpoint(self, client):
         """Test /version returns version info."""
         response = client.get("/version")
@@ -59,12 +66,24 @@ class TestHealthEndpoints:
         assert "version" in data
         assert "api_version" in data
 
+    def test_version_endpoint_etag(self, client):
+        """Test /version returns an ETag and answers a matching If-None-Match with 304."""
+        response = client.get("/version")
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        cached = client.get("/version", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.content == b""
+
     def test_metrics_endpoint(self, client):
         """Test /metrics returns Prometheus-compatible metrics."""
+        client.get("/healthz")
         response = client.get("/metrics")
         assert response.status_code == 200
-        # Should return text content
-        assert response.text is not None
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'tenure_requests_total{method="GET",path="/healthz",status="200"}' in response.text
 
 
 class TestToolEndpoints:
@@ -157,6 +176,16 @@ class TestWorkflowEndpoints:
         data = response.json()
         assert data["success"] is True
 
+    def test_workflow_missing_id(self, client, auth_headers):
+        """Test workflows reject a body without their required ID."""
+        response = client.post(
+            "/v1/workflows/arrears_detection",
+            json={"property_id": "prop_001"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Missing tenancy_id"
+
     def test_workflow_not_found(self, client, auth_headers):
         """Test 404 for unknown workflow."""
         response = client.post(
@@ -179,6 +208,37 @@ class TestResourceEndpoints:
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
+        assert data["data"]["property_id"] == "prop_001"
+
+    def test_resource_registry_captures_path_params(self):
+        """Test URI templates match by segment and capture their parameters."""
+        from tenure_mcp.resources import ResourceRegistry
+
+        def details(resource_id, context):
+            return None
+
+        def documents(resource_id, context):
+            return None
+
+        registry = ResourceRegistry()
+        registry.register("vault://properties/{id}/details", details)
+        registry.register("vault://properties/{id}/documents", documents)
+
+        func, _, params = registry.match("vault://properties/prop_001/documents")
+        assert func is documents
+        assert params == {"id": "prop_001"}
+        assert registry.match("vault://properties/prop_001") is None
+        assert registry.match("vault://properties/prop_001/details/extra") is None
+
+    def test_resource_uses_request_correlation_id(self, client, auth_headers):
+        """Test resource responses reuse the request's X-Correlation-ID."""
+        response = client.get(
+            "/v1/resources/vault://properties/prop_001/details",
+            headers={**auth_headers, "X-Correlation-ID": "corr-123"},
+        )
+        assert response.status_code == 200
+        assert response.headers["X-Correlation-ID"] == "corr-123"
+        assert response.json()["correlation_id"] == "corr-123"
 
     def test_get_property_feedback(self, client, auth_headers):
         """Test property feedback resource retrieval."""
@@ -192,6 +252,34 @@ class TestResourceEndpoints:
 class TestPolicyEnforcement:
     """Test RBAC and policy enforcement via API."""
 
+    def test_bearer_token_required(self, client, auth_headers):
+        """Test protected endpoints reject missing or wrong bearer tokens."""
+        path = "/v1/resources/vault://properties/prop_001/details"
+        headers = {k: v for k, v in auth_headers.items() if k != "Authorization"}
+
+        response = client.get(path, headers=headers)
+        assert response.status_code == 401
+        assert response.json()["error"] == "Missing or invalid Authorization header"
+
+        response = client.get(path, headers={**headers, "Authorization": "Bearer wrong-token"})
+        assert response.status_code == 401
+        assert response.json()["error"] == "Invalid bearer token"
+
+        assert client.get(path, headers=auth_headers).status_code == 200
+
+    def test_cors_preflight_skips_auth(self, client):
+        """Test CORS preflight requests are answered without a bearer token."""
+        response = client.options(
+            "/v1/tools/analyze_open_home_feedback",
+            headers={
+                "Origin": "https://app.example.com",
+                "Access-Control-Request-Method": "POST",
+            },
+        )
+        assert response.status_code == 200
+        assert "access-control-allow-origin" in response.headers
+        assert "x-correlation-id" not in response.headers
+
     def test_admin_tool_requires_admin_role(self, client, auth_headers):
         """Test that admin tools reject agent role."""
         # Agent trying to access admin tool
@@ -312,3 +400,122 @@ class TestDatabasePersistence:
                 count = cursor.fetchone()[0]
 
             assert count == 1
+
+    def test_audit_writer_batches_queued_records(self, tmp_path):
+        """Test queued records are written by the audit writer task."""
+        import asyncio
+        from tenure_mcp.server.audit import (
+            AUDIT_EVENT,
+            TOOL_EXECUTION,
+            audit_writer_loop,
+            enqueue_record,
+        )
+        from tenure_mcp.storage.database import Database
+
+        db = Database(db_path=str(tmp_path / "audit.db"))
+
+        async def run():
+            queue = asyncio.Queue()
+            writer = asyncio.create_task(audit_writer_loop(queue, db))
+            enqueue_record(
+                queue,
+                db,
+                TOOL_EXECUTION,
+                correlation_id="test-123",
+                tool_name="test_tool",
+                user_id="user_1",
+                tenant_id="tenant_1",
+                input_data={"property_id": "prop_001"},
+            )
+            enqueue_record(queue, db, AUDIT_EVENT, correlation_id="test-123", event_type="test_event")
+            await asyncio.sleep(0.2)
+            writer.cancel()
+
+        asyncio.run(run())
+
+        with db.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM tool_executions").fetchone()[0] == 1
+            assert conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0] == 1
+
+    def test_audit_writer_keeps_good_records_when_batch_fails(self, tmp_path):
+        """Test a record that cannot be written does not discard the rest of its batch."""
+        from tenure_mcp.server.audit import AUDIT_EVENT, AuditRecord, write_records_or_each
+        from tenure_mcp.storage.database import Database
+
+        db = Database(db_path=str(tmp_path / "audit.db"))
+        records = [
+            AuditRecord(AUDIT_EVENT, {"correlation_id": "ok-1", "event_type": "policy_check"}),
+            # event_type is NOT NULL, so this record fails the batch transaction
+            AuditRecord(AUDIT_EVENT, {"correlation_id": "bad", "event_type": None}),
+            AuditRecord(AUDIT_EVENT, {"correlation_id": "ok-2", "event_type": "policy_check"}),
+        ]
+
+        write_records_or_each(db, records)
+
+        with db.get_connection() as conn:
+            rows = conn.execute("SELECT correlation_id FROM audit_log ORDER BY id").fetchall()
+        assert [row[0] for row in rows] == ["ok-1", "ok-2"]
+        db.close()
+
+    def test_audit_event_written_directly_without_writer(self, tmp_path):
+        """Test policy and workflow audit events are written at once outside the server."""
+        from tenure_mcp.server.audit import record_audit_event
+        from tenure_mcp.storage.database import Database
+
+        db = Database(db_path=str(tmp_path / "audit.db"))
+        record_audit_event(db, correlation_id="cli-1", event_type="policy_check")
+
+        with db.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0] == 1
+        db.close()
+
+    def test_audit_event_joins_registered_writer_queue(self, tmp_path):
+        """Test audit events share the server's writer queue, in order with handler records."""
+        import asyncio
+        from tenure_mcp.server.audit import (
+            AUDIT_EVENT,
+            TOOL_EXECUTION,
+            audit_writer_loop,
+            enqueue_record,
+            record_audit_event,
+            register_writer,
+            unregister_writer,
+        )
+        from tenure_mcp.storage.database import Database
+
+        db = Database(db_path=str(tmp_path / "audit.db"))
+
+        async def run():
+            queue = asyncio.Queue()
+            register_writer(queue, db)
+            try:
+                record_audit_event(db, correlation_id="req-1", event_type="policy_check")
+                enqueue_record(
+                    queue,
+                    db,
+                    TOOL_EXECUTION,
+                    correlation_id="req-1",
+                    tool_name="test_tool",
+                    user_id="user_1",
+                    tenant_id="tenant_1",
+                    input_data={},
+                )
+                record_audit_event(db, correlation_id="req-1", event_type="workflow_completed")
+                assert [record.kind for record in queue._queue] == [
+                    AUDIT_EVENT,
+                    TOOL_EXECUTION,
+                    AUDIT_EVENT,
+                ]
+                writer = asyncio.create_task(audit_writer_loop(queue, db))
+                await asyncio.sleep(0.2)
+                writer.cancel()
+            finally:
+                unregister_writer()
+
+        asyncio.run(run())
+
+        with db.get_connection() as conn:
+            rows = conn.execute("SELECT event_type FROM audit_log ORDER BY id").fetchall()
+            assert [row[0] for row in rows] == ["policy_check", "workflow_completed"]
+            assert conn.execute("SELECT COUNT(*) FROM tool_executions").fetchone()[0] == 1
+        db.close()
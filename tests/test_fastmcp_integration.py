@@ -49,6 +49,49 @@ class TestFastMCPServer:
         assert server is not None
         assert hasattr(server, "name")
 
+    def test_default_context_is_built_once(self):
+        """Test tool calls reuse one pre-built default RequestContext."""
+        from tenure_mcp.schemas.base import RequestContext
+        from tenure_mcp.tools import fastmcp_tools
+
+        assert isinstance(fastmcp_tools._DEFAULT_CONTEXT, RequestContext)
+        assert fastmcp_tools._DEFAULT_CONTEXT.role == "agent"
+
+    def test_tool_descriptions_do_not_depend_on_docstrings(self):
+        """Test every tool publishes its description from _TOOL_DESCRIPTIONS (survives -OO)."""
+        import asyncio
+
+        from tenure_mcp.tools import fastmcp_tools
+
+        tools = asyncio.run(fastmcp_tools.mcp.list_tools())
+        descriptions = {tool.name: tool.description for tool in tools}
+        for name, description in fastmcp_tools._TOOL_DESCRIPTIONS.items():
+            assert descriptions[name] == description
+
+    def test_read_only_tool_results_are_cached(self):
+        """Test read-only tools reuse results for the same arguments within the TTL."""
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+
+        from tenure_mcp.tools import fastmcp_tools
+
+        fastmcp_tools.get_property_contacts.cache_clear()
+        impl = AsyncMock(side_effect=lambda input_data, context: input_data.property_id)
+
+        def call(property_id):
+            return asyncio.run(fastmcp_tools.get_property_contacts(property_id=property_id))
+
+        with patch.object(fastmcp_tools, "_get_property_contacts", impl):
+            assert call("prop_001") == "prop_001"
+            assert call("prop_001") == "prop_001"
+            assert call("prop_002") == "prop_002"
+            assert impl.await_count == 2
+
+            with patch.object(fastmcp_tools.settings, "tool_cache_ttl_seconds", 0):
+                call("prop_001")
+            assert impl.await_count == 3
+        fastmcp_tools.get_property_contacts.cache_clear()
+
 
 class TestFastMCPEndpoints:
     """Test FastMCP HTTP endpoints."""
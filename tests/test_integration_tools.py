@@ -199,6 +199,41 @@ async def test_get_upcoming_open_homes(context):
         assert oh.end_time
 
 
+@pytest.mark.asyncio
+async def test_get_upcoming_open_homes_fetches_each_property_once(context):
+    """Test open home addresses are looked up once per property and failures read Unknown."""
+    from datetime import datetime
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, patch
+
+    start = datetime(2026, 1, 10, 10, 0)
+    end = datetime(2026, 1, 10, 10, 30)
+    open_homes = [
+        SimpleNamespace(id=f"oh_{i}", property_id=pid, start_time=start, end_time=end)
+        for i, pid in enumerate(["prop_001", "prop_002", "prop_001"])
+    ]
+
+    async def get_property(property_id):
+        if property_id == "prop_002":
+            raise RuntimeError("VaultRE unavailable")
+        return SimpleNamespace(address=SimpleNamespace(full_address="1 Test St"))
+
+    client = SimpleNamespace(
+        list_upcoming_open_homes=AsyncMock(return_value=open_homes),
+        get_property=AsyncMock(side_effect=get_property),
+    )
+    with patch("tenure_mcp.tools.integration_tools.get_vaultre_client", return_value=client):
+        output = await get_upcoming_open_homes(GetUpcomingOpenHomesInput(days_ahead=7), context)
+
+    assert [oh.property_address for oh in output.open_homes] == [
+        "1 Test St",
+        "Unknown",
+        "1 Test St",
+    ]
+    assert [oh.open_home_id for oh in output.open_homes] == ["oh_0", "oh_1", "oh_2"]
+    assert client.get_property.await_count == 2
+
+
 # =============================================================================
 # Ailo Integration Tools Tests
 # =============================================================================
@@ -239,6 +274,30 @@ async def test_get_tenant_communication_history(context):
     assert isinstance(output.history.communications, list)
 
 
+@pytest.mark.asyncio
+async def test_gather_bounded_caps_concurrency_and_keeps_order():
+    """Test fanned-out lookups run concurrently up to the cap and keep input order."""
+    import asyncio
+
+    from tenure_mcp.tools.integration_tools import _gather_bounded
+
+    running = 0
+    peak = 0
+
+    async def lookup(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - value % 5))
+        running -= 1
+        return value
+
+    results = await _gather_bounded((lookup(i) for i in range(12)), limit=4)
+
+    assert results == list(range(12))
+    assert peak == 4
+
+
 # =============================================================================
 # Schema Validation Tests
 # =============================================================================
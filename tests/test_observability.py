@@ -96,3 +96,125 @@ class TestTracingIntegration:
             
             assert span.is_recording()
             assert span.get_attribute("workflow.name") == "test_workflow"
+
+    def test_traced_tool_span_named_after_function(self):
+        """Test the tool decorator names spans after the function and skips unrecorded attributes."""
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        from tenure_mcp.tools import fastmcp_tools
+
+        async def sample_tool(property_id: str) -> str:
+            return property_id
+
+        mock_tracer = MagicMock()
+        span = mock_tracer.start_span.return_value
+        span.is_recording.return_value = False
+        with patch.object(fastmcp_tools, "tracer", mock_tracer):
+            traced = fastmcp_tools._traced(sample_tool)
+            assert asyncio.run(traced(property_id="prop_001")) == "prop_001"
+
+        assert traced.__name__ == "sample_tool"
+        mock_tracer.start_span.assert_called_once_with("tool.sample_tool")
+        span.end.assert_called_once_with()
+        span.set_attribute.assert_not_called()
+
+    def test_traced_tool_sets_span_status(self):
+        """Test the tool decorator marks spans OK on success and ERROR with the message on failure."""
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        from tenure_mcp.tools import fastmcp_tools
+
+        async def failing_tool(property_id: str) -> str:
+            raise ValueError("no such property")
+
+        async def sample_tool(property_id: str) -> str:
+            return property_id
+
+        mock_tracer = MagicMock()
+        span = mock_tracer.start_span.return_value
+        with patch.object(fastmcp_tools, "tracer", mock_tracer):
+            traced_ok = fastmcp_tools._traced(sample_tool)
+            traced_error = fastmcp_tools._traced(failing_tool)
+
+        asyncio.run(traced_ok("prop_001"))
+        assert span.set_status.call_args.args[0].status_code == trace.StatusCode.OK
+
+        with pytest.raises(ValueError):
+            asyncio.run(traced_error("prop_001"))
+        status = span.set_status.call_args.args[0]
+        assert status.status_code == trace.StatusCode.ERROR
+        assert status.description == "no such property"
+
+    def test_traced_tool_span_is_child_of_caller_span(self):
+        """Test tool spans end after the call and keep the caller's span as parent and current."""
+        import asyncio
+        from unittest.mock import patch
+
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        from tenure_mcp.tools import fastmcp_tools
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        sdk_tracer = provider.get_tracer(__name__)
+
+        async def sample_tool(property_id: str) -> str:
+            return trace.get_current_span().name
+
+        with patch.object(fastmcp_tools, "tracer", sdk_tracer):
+            traced = fastmcp_tools._traced(sample_tool)
+        with sdk_tracer.start_as_current_span("caller") as caller:
+            assert asyncio.run(traced("prop_001")) == "caller"
+
+        tool_span = next(s for s in exporter.get_finished_spans() if s.name == "tool.sample_tool")
+        assert tool_span.parent.span_id == caller.get_span_context().span_id
+        assert tool_span.status.status_code == trace.StatusCode.OK
+
+    def test_trace_tool_execution_calls_sync_tool_directly(self):
+        """Test the sync tracing helper returns the tool result without an event loop."""
+        from tenure_mcp.tools import fastmcp_tools
+
+        initialize_tracing()
+        result = fastmcp_tools._trace_tool_execution("sample", lambda value: value * 2, 21)
+        assert result == 42
+
+    def test_traced_tool_is_unwrapped_when_tracing_disabled(self):
+        """Test tools skip span creation entirely when OpenTelemetry is disabled."""
+        from unittest.mock import patch
+
+        from tenure_mcp.tools import fastmcp_tools
+
+        async def sample_tool(property_id: str) -> str:
+            return property_id
+
+        with patch.object(fastmcp_tools.settings, "opentelemetry_enabled", False):
+            assert fastmcp_tools._traced(sample_tool) is sample_tool
+
+    def test_traced_tool_records_inputs_with_native_types(self):
+        """Test recorded tool spans keep scalar inputs as-is and skip other values."""
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        from tenure_mcp.tools import fastmcp_tools
+
+        async def sample_tool(query: str, max_results: int = 5, filters=None) -> str:
+            return query
+
+        mock_tracer = MagicMock()
+        span = mock_tracer.start_span.return_value
+        span.is_recording.return_value = True
+        with patch.object(fastmcp_tools, "tracer", mock_tracer):
+            traced = fastmcp_tools._traced(sample_tool)
+            asyncio.run(traced(query="rent", max_results=3, filters=["a"]))
+
+        attributes = {call.args[0]: call.args[1] for call in span.set_attribute.call_args_list}
+        assert attributes == {
+            "tool.name": "sample_tool",
+            "tool.input.query": "rent",
+            "tool.input.max_results": 3,
+        }
@@ -3,11 +3,14 @@
 import pytest
 from pydantic import ValidationError
 
+from tenure_mcp.schemas.integrations import FetchPropertyEmailsInput
 from tenure_mcp.schemas.tools import (
     AnalyzeFeedbackInput,
     CalculateBreachInput,
     ExtractExpiryInput,
     OCRDocumentInput,
+    SentimentCategory,
+    WebSearchResultItem,
 )
 
 
@@ -58,3 +61,26 @@ def test_extract_expiry_input_invalid():
     """Test invalid ExtractExpiryInput."""
     with pytest.raises(ValidationError):
         ExtractExpiryInput(text="short")  # Too short
+
+
+def test_record_models_are_frozen():
+    """Test record-like output models reject mutation and unknown fields."""
+    item = WebSearchResultItem(title="Example", url="https://example.com")
+    with pytest.raises(ValidationError):
+        item.title = "Changed"
+
+    with pytest.raises(ValidationError):
+        SentimentCategory(category="positive", count=1, percentage=100.0, extra="x")
+
+
+def test_integration_identifier_fields():
+    """Test integration ID fields share the native identifier constraint."""
+    assert FetchPropertyEmailsInput(property_id="prop_001").property_id == "prop_001"
+
+    for bad in ["prop 001", "prop_001\n", "a" * 101]:
+        with pytest.raises(ValidationError):
+            FetchPropertyEmailsInput(property_id=bad)
+
+    with pytest.raises(ValidationError) as exc_info:
+        FetchPropertyEmailsInput(property_id="prop@001")
+    assert exc_info.value.errors()[0]["type"] == "string_pattern_mismatch"
@@ -1,13 +1,17 @@
 """Tests for Tier C (mutation/high-risk) agents."""
 
+from typing import get_args
+
 import pytest
+from pydantic import ValidationError
 
 from tenure_mcp.schemas.base import RequestContext
 from tenure_mcp.schemas.tools import (
+    BreachType,
     PrepareBreachNoticeInput,
     PrepareBreachNoticeOutput,
 )
-from tenure_mcp.tools.implementations import prepare_breach_notice
+from tenure_mcp.tools.implementations import BREACH_TYPE_DESCRIPTIONS, prepare_breach_notice
 
 
 @pytest.fixture
@@ -38,8 +42,9 @@ async def test_prepare_breach_notice_valid(context):
 @pytest.mark.asyncio
 async def test_prepare_breach_notice_invalid_breach_type(context):
     """Test prepare_breach_notice with invalid breach_type."""
-    with pytest.raises(ValueError, match="Invalid breach_type"):
+    with pytest.raises(ValidationError) as exc_info:
         PrepareBreachNoticeInput(tenancy_id="tenancy_001", breach_type="invalid_type")
+    assert exc_info.value.errors()[0]["type"] == "literal_error"
 
 
 @pytest.mark.asyncio
@@ -50,6 +55,9 @@ async def test_prepare_breach_notice_all_breach_types(context):
         output = await prepare_breach_notice(input_data, context)
         assert output.breach_type == breach_type
         assert output.status == "draft"
+        assert BREACH_TYPE_DESCRIPTIONS[breach_type] in output.draft_content
+
+    assert set(BREACH_TYPE_DESCRIPTIONS) == set(get_args(BreachType))
 
 
 def test_prepare_breach_notice_output_serialization():
@@ -7,6 +7,8 @@ from tenure_mcp.schemas.tools import (
     AnalyzeFeedbackInput,
     CalculateBreachInput,
     ExtractExpiryInput,
+    FeedbackSummary,
+    GenerateVendorReportInput,
     OCRDocumentInput,
     WebSearchInput,
 )
@@ -14,6 +16,7 @@ from tenure_mcp.tools.implementations import (
     analyze_open_home_feedback,
     calculate_breach_status,
     extract_expiry_date,
+    generate_vendor_report,
     ocr_document,
     web_search,
 )
@@ -77,6 +80,19 @@ async def test_extract_expiry_date(context):
         assert date.confidence <= 1.0
 
 
+@pytest.mark.asyncio
+async def test_generate_vendor_report(context):
+    """Test generate_vendor_report tool returns typed summary submodels."""
+    input_data = GenerateVendorReportInput(property_id="prop_001")
+    output = await generate_vendor_report(input_data, context)
+
+    assert isinstance(output.feedback_summary, FeedbackSummary)
+    assert output.feedback_summary.total_feedback == 5
+    assert output.market_trends.price_trend == "stable"
+    dumped = output.model_dump()
+    assert dumped["feedback_summary"]["positive_percentage"] == 40.0
+
+
 @pytest.mark.asyncio
 async def test_web_search_no_api_key(context):
     """Test web_search when TAVILY_API_KEY is not set returns empty results."""